@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import collections
 import functools
+import itertools
 import logging
+import operator
 import random
 import secrets
 from argparse import Namespace
 from collections import Counter, deque
 from collections.abc import Collection, MutableSequence
 from enum import IntEnum, IntFlag
+from types import MemberDescriptorType
 from typing import (AbstractSet, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Mapping, NamedTuple,
                     Optional, Protocol, Set, Tuple, Union, TYPE_CHECKING)
 
@@ -20,6 +23,7 @@ import Utils
 
 if TYPE_CHECKING:
     from worlds import AutoWorld
+    from worlds.generic.Rules import LocalityTable
 
 
 class Group(TypedDict):
@@ -81,6 +85,8 @@ class MultiWorld():
     start_hints: Dict[int, Options.StartHints]
     start_location_hints: Dict[int, Options.StartLocationHints]
     item_links: Dict[int, Options.ItemLinks]
+    locality: Optional[LocalityTable] = None
+    """local_items and non_local_items restrictions for fill, if there are any. Set up by locality_rules."""
 
     game: Dict[int, str]
 
@@ -99,11 +105,20 @@ class MultiWorld():
         region_cache: Dict[int, Dict[str, Region]]
         entrance_cache: Dict[int, Dict[str, Entrance]]
         location_cache: Dict[int, Dict[str, Location]]
+        # registered locations by fill state, maintained through Location.item, to the order of their registration
+        unfilled_locations: Dict[int, Dict[Location, int]]
+        filled_locations: Dict[int, Dict[Location, int]]
+        # placed items by (item player, item name), to the order of registration of their locations
+        item_locations: Dict[Tuple[int, str], Dict[Location, int]]
 
         def __init__(self, players: int):
             self.region_cache = {player: {} for player in range(1, players+1)}
             self.entrance_cache = {player: {} for player in range(1, players+1)}
             self.location_cache = {player: {} for player in range(1, players+1)}
+            self.unfilled_locations = {player: {} for player in range(1, players+1)}
+            self.filled_locations = {player: {} for player in range(1, players+1)}
+            self.item_locations = {}
+            self._registrations = itertools.count()
 
         def __iadd__(self, other: Iterable[Region]):
             self.extend(other)
@@ -124,6 +139,48 @@ class MultiWorld():
             self.region_cache[new_id] = {}
             self.entrance_cache[new_id] = {}
             self.location_cache[new_id] = {}
+            self.unfilled_locations[new_id] = {}
+            self.filled_locations[new_id] = {}
+
+        def register_location(self, location: Location) -> None:
+            location.region_manager = self
+            self._index_location(location, next(self._registrations))
+
+        def unregister_location(self, location: Location) -> None:
+            player = location.player
+            if location.item is not None:
+                self._remove_item_location(location.item, location)
+            self.unfilled_locations[player].pop(location, None)
+            self.filled_locations[player].pop(location, None)
+            location.region_manager = None
+
+        def index_location(self, location: Location, old_item: Optional[Item] = None) -> None:
+            """Move a registered location to the fill state indexes of its current item."""
+            player = location.player
+            order = self.unfilled_locations[player].pop(location, None)
+            if order is None:
+                order = self.filled_locations[player].pop(location, None)
+                if order is None:  # a copy of a registered location
+                    return
+            if old_item is not None:
+                self._remove_item_location(old_item, location)
+            self._index_location(location, order)
+
+        def _index_location(self, location: Location, order: int) -> None:
+            item = location.item
+            if item is None:
+                self.unfilled_locations[location.player][location] = order
+            else:
+                self.filled_locations[location.player][location] = order
+                self.item_locations.setdefault((item.player, item.name), {})[location] = order
+
+        def _remove_item_location(self, item: Item, location: Location) -> None:
+            key = item.player, item.name
+            locations = self.item_locations.get(key)
+            if locations is not None:
+                locations.pop(location, None)
+                if not locations:
+                    del self.item_locations[key]
 
         def __iter__(self) -> Iterator[Region]:
             for regions in self.region_cache.values():
@@ -448,27 +505,27 @@ class MultiWorld():
     def get_items(self) -> List[Item]:
         return [loc.item for loc in self.get_filled_locations()] + self.itempool
 
-    def find_item_locations(self, item: str, player: int, resolve_group_locations: bool = False) -> List[Location]:
-        if resolve_group_locations:
-            player_groups = self.get_player_groups(player)
-            return [location for location in self.get_locations() if
-                    location.item and location.item.name == item and location.player not in player_groups and
-                    (location.item.player == player or location.item.player in player_groups)]
-        return [location for location in self.get_locations() if
-                location.item and location.item.name == item and location.item.player == player]
-
-    def find_item(self, item: str, player: int) -> Location:
-        return next(location for location in self.get_locations() if
-                    location.item and location.item.name == item and location.item.player == player)
+    @staticmethod
+    def _in_location_order(locations: Dict[Location, int]) -> List[Location]:
+        """Locations of the item index in the order of get_locations, which is by player, then registration."""
+        return [location for location, _ in sorted(locations.items(), key=lambda entry: (entry[0].player, entry[1]))]
 
     def find_items_in_locations(self, items: Set[str], player: int, resolve_group_locations: bool = False) -> List[Location]:
+        item_locations = self.regions.item_locations
         if resolve_group_locations:
             player_groups = self.get_player_groups(player)
-            return [location for location in self.get_locations() if
-                    location.item and location.item.name in items and location.player not in player_groups and
-                    (location.item.player == player or location.item.player in player_groups)]
-        return [location for location in self.get_locations() if
-                location.item and location.item.name in items and location.item.player == player]
+            return self._in_location_order({
+                location: order for item_player in (player, *player_groups) for item in items
+                for location, order in item_locations.get((item_player, item), {}).items()
+                if location.player not in player_groups})
+        return self._in_location_order({location: order for item in items
+                                        for location, order in item_locations.get((player, item), {}).items()})
+
+    def find_item_locations(self, item: str, player: int, resolve_group_locations: bool = False) -> List[Location]:
+        return self.find_items_in_locations({item}, player, resolve_group_locations)
+
+    def find_item(self, item: str, player: int) -> Location:
+        return next(iter(self._in_location_order(self.regions.item_locations.get((player, item), {}))))
 
     def create_item(self, item_name: str, player: int) -> Item:
         return self.worlds[player].create_item(item_name)
@@ -502,11 +559,29 @@ class MultiWorld():
         return Utils.RepeatableChain(tuple(self.regions.location_cache[player].values()
                                            for player in self.regions.location_cache))
 
+    def _get_locations_by_fill_state(self, filled: bool, player: Optional[int] = None) -> List[Location]:
+        """Filled or unfilled locations in the order of get_locations.
+        If there are few, sorting them by registration is faster than going through all locations of the player."""
+        if player is None:
+            return [location for player in self.regions.location_cache
+                    for location in self._get_locations_by_fill_state(filled, player)]
+        index = (self.regions.filled_locations if filled else self.regions.unfilled_locations)[player]
+        locations = self.regions.location_cache[player]
+        if len(index) * 8 <= len(locations):
+            return [location for location, _ in sorted(index.items(), key=operator.itemgetter(1))]
+        return [location for location in locations.values() if (location.item is not None) is filled]
+
     def get_unfilled_locations(self, player: Optional[int] = None) -> List[Location]:
-        return [location for location in self.get_locations(player) if location.item is None]
+        return self._get_locations_by_fill_state(False, player)
 
     def get_filled_locations(self, player: Optional[int] = None) -> List[Location]:
-        return [location for location in self.get_locations(player) if location.item is not None]
+        return self._get_locations_by_fill_state(True, player)
+
+    def get_advancement_locations(self, player: Optional[int] = None) -> List[Location]:
+        """Locations holding an advancement item, in the order of get_locations.
+        Classifications are checked on every call, as worlds may change them after placing an item."""
+        return [location for location in self._get_locations_by_fill_state(True, player)
+                if location.item.advancement]
 
     def get_reachable_locations(self, state: Optional[CollectionState] = None, player: Optional[int] = None) -> List[Location]:
         state: CollectionState = state if state else self.state
@@ -553,8 +628,8 @@ class MultiWorld():
             state = CollectionState(self)
             if self.has_beaten_game(state):
                 return True
-        prog_locations = {location for location in self.get_locations() if location.item
-                          and location.item.advancement and location not in state.locations_checked}
+        prog_locations = {location for location in self.get_advancement_locations()
+                          if location not in state.locations_checked}
 
         while prog_locations:
             sphere: Set[Location] = set()
@@ -801,7 +876,7 @@ class CollectionState():
 
     def sweep_for_advancements(self, locations: Optional[Iterable[Location]] = None) -> None:
         if locations is None:
-            locations = self.multiworld.get_filled_locations()
+            locations = self.multiworld.get_advancement_locations()
         reachable_advancements = True
         # since the loop has a good chance to run more than once, only filter the advancements once
         locations = {location for location in locations if location.advancement and location not in self.advancements}
@@ -929,18 +1004,54 @@ class CollectionState():
             self.stale[item.player] = True
 
 
-class Entrance:
-    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
+class SlotDefaults(type):
+    """Metaclass for slotted classes with default values for some of their slots, listed in `_slot_defaults`.
+
+    Instances get the defaults set on creation, unless a subclass overrides them with a class attribute.
+    Reading one of them from the class, like `Location.access_rule`, gives the default instead of the slot.
+
+    These classes slot the attributes that nearly every instance sets, and keep a `__dict__` slot for everything else,
+    which is only allocated once an instance sets another attribute. So attributes with class level defaults that
+    are rarely changed, as well as custom attributes that worlds attach, still work, but cost memory where used."""
+    _slot_defaults: Dict[str, Any]
+    _init_defaults: Tuple[Tuple[str, Any], ...]
+
+    def __init__(cls, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        owner = next(klass for klass in cls.__mro__ if "_slot_defaults" in vars(klass))
+        overriding = cls.__mro__[:cls.__mro__.index(owner)]
+        cls._init_defaults = tuple((attribute, value) for attribute, value in owner._slot_defaults.items()
+                                   if not any(attribute in vars(klass) for klass in overriding))
+
+    def __getattribute__(cls, name: str) -> Any:
+        value = type.__getattribute__(cls, name)
+        if type(value) is MemberDescriptorType:
+            defaults = type.__getattribute__(cls, "_slot_defaults")
+            if name in defaults:
+                return defaults[name]
+        return value
+
+
+class Entrance(metaclass=SlotDefaults):
+    __slots__ = ("player", "name", "parent_region", "connected_region", "access_rule", "__dict__")
+    _slot_defaults: ClassVar[Dict[str, Any]] = {
+        "access_rule": lambda state: True,
+        "connected_region": None,
+    }
+
+    access_rule: Callable[[CollectionState], bool]
     hide_path: bool = False
     player: int
     name: str
     parent_region: Optional[Region]
-    connected_region: Optional[Region] = None
+    connected_region: Optional[Region]
     # LttP specific, TODO: should make a LttPEntrance
     addresses = None
     target = None
 
     def __init__(self, player: int, name: str = "", parent: Optional[Region] = None) -> None:
+        for attribute, value in self._init_defaults:
+            setattr(self, attribute, value)
         self.name = name
         self.parent_region = parent
         self.player = player
@@ -966,6 +1077,9 @@ class Entrance:
 
 
 class Region:
+    # see SlotDefaults for the __dict__ slot
+    __slots__ = ("name", "_hint_text", "player", "multiworld", "entrances", "_exits", "_locations", "__dict__")
+
     name: str
     _hint_text: str
     player: int
@@ -1003,12 +1117,14 @@ class Region:
             location: Location = self._list.__getitem__(index)
             self._list.__delitem__(index)
             del(self.region_manager.location_cache[location.player][location.name])
+            self.region_manager.unregister_location(location)
 
         def insert(self, index: int, value: Location) -> None:
             assert value.name not in self.region_manager.location_cache[value.player], \
                 f"{value.name} already exists in the location cache."
             self._list.insert(index, value)
             self.region_manager.location_cache[value.player][value.name] = value
+            self.region_manager.register_location(value)
 
     class EntranceRegister(Register):
         def __delitem__(self, index: int) -> None:
@@ -1139,21 +1255,34 @@ class LocationProgressType(IntEnum):
     EXCLUDED = 3
 
 
-class Location:
+class Location(metaclass=SlotDefaults):
+    __slots__ = ("player", "name", "address", "parent_region", "locked", "access_rule", "_item", "region_manager",
+                 "__dict__")
+    _slot_defaults: ClassVar[Dict[str, Any]] = {
+        "locked": False,
+        "access_rule": lambda state: True,
+        "_item": None,
+        "region_manager": None,
+    }
+
     game: str = "Generic"
     player: int
     name: str
     address: Optional[int]
     parent_region: Optional[Region]
-    locked: bool = False
+    locked: bool
     show_in_spoiler: bool = True
     progress_type: LocationProgressType = LocationProgressType.DEFAULT
     always_allow: Callable[[CollectionState, Item], bool] = staticmethod(lambda state, item: False)
-    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
+    access_rule: Callable[[CollectionState], bool]
     item_rule: Callable[[Item], bool] = staticmethod(lambda item: True)
-    item: Optional[Item] = None
+    _item: Optional[Item]
+    region_manager: Optional[MultiWorld.RegionManager]
+    """the RegionManager this location is registered with by being in one of its regions"""
 
     def __init__(self, player: int, name: str = '', address: Optional[int] = None, parent: Optional[Region] = None):
+        for attribute, value in self._init_defaults:
+            setattr(self, attribute, value)
         self.player = player
         self.name = name
         self.address = address
@@ -1191,6 +1320,18 @@ class Location:
     def __lt__(self, other: Location):
         return (self.player, self.name) < (other.player, other.name)
 
+    @property
+    def item(self) -> Optional[Item]:
+        return self._item
+
+    @item.setter
+    def item(self, item: Optional[Item]) -> None:
+        old_item = self._item
+        self._item = item
+        # unregistered locations are indexed once they are added to a region
+        if self.region_manager is not None:
+            self.region_manager.index_location(self, old_item)
+
     @property
     def advancement(self) -> bool:
         return self.item is not None and self.item.advancement
@@ -1242,6 +1383,17 @@ class Item:
         self.code = code
         self.location = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "name" or name == "player":
+            location = getattr(self, "location", None)
+            if location is not None and location.item is self:
+                # placed items are indexed by player and name, so take it out of the index while it changes
+                location.item = None
+                object.__setattr__(self, name, value)
+                location.item = self
+                return
+        object.__setattr__(self, name, value)
+
     @property
     def hint_text(self) -> str:
         return getattr(self, "_hint_text", self.name.replace("_", " ").replace("-", " "))
@@ -1335,7 +1487,7 @@ class Spoiler:
         from itertools import chain
         # get locations containing progress items
         multiworld = self.multiworld
-        prog_locations = {location for location in multiworld.get_filled_locations() if location.item.advancement}
+        prog_locations = set(multiworld.get_advancement_locations())
         state_cache: List[Optional[CollectionState]] = [None]
         collection_spheres: List[Set[Location]] = []
         state = CollectionState(multiworld)
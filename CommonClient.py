@@ -188,6 +188,69 @@ class CommonContext:
     items_handling: typing.Optional[int] = None
     want_slot_data: bool = True  # should slot_data be retrieved via Connect
 
+    class GameNameLookup(typing.Mapping[int, str]):
+        """id -> name lookup of a single game, built from its name -> id table the first time it's used.
+        Like a KeyedDefaultDict, missing ids are looked up as their "Unknown" name."""
+        def __init__(self, name_to_id: typing.Mapping[str, int], unknown: typing.Callable[[int], str]):
+            self._name_to_id: typing.Mapping[str, int] = name_to_id
+            self._unknown: typing.Callable[[int], str] = unknown
+            self._names: typing.Optional[typing.Dict[int, str]] = None
+
+        @property
+        def names(self) -> typing.Dict[int, str]:
+            if self._names is None:
+                self._names = {code: name for name, code in self._name_to_id.items()}
+            return self._names
+
+        def __getitem__(self, code: int) -> str:
+            name = self.names.get(code)
+            return self._unknown(code) if name is None else name
+
+        def __contains__(self, code: object) -> bool:
+            return code in self.names
+
+        def get(self, code: int, default: typing.Optional[str] = None) -> typing.Optional[str]:
+            return self.names.get(code, default)
+
+        def __len__(self) -> int:
+            return len(self.names)
+
+        def __iter__(self) -> typing.Iterator[int]:
+            return iter(self.names)
+
+    class StoredGameNameLookup(GameNameLookup):
+        """id -> name lookup of a single game answered from the data package store one id at a time."""
+        def __init__(self, store: Utils.DataPackageStore, checksum: str, lookup_type: typing.Literal["item", "location"],
+                     unknown: typing.Callable[[int], str]):
+            super().__init__({}, unknown)
+            self._store: Utils.DataPackageStore = store
+            self._checksum: str = checksum
+            self._lookup_type: typing.Literal["item", "location"] = lookup_type
+            self._looked_up: typing.Dict[int, typing.Optional[str]] = {}
+
+        @property
+        def names(self) -> typing.Dict[int, str]:
+            if self._names is None:
+                self._names = {code: name for name, code in
+                               self._store.get_ids(self._checksum, self._lookup_type).items()}
+            return self._names
+
+        def get(self, code: int, default: typing.Optional[str] = None) -> typing.Optional[str]:
+            if self._names is not None:
+                return self._names.get(code, default)
+            try:
+                name = self._looked_up[code]
+            except KeyError:
+                name = self._looked_up[code] = self._store.get_name(self._checksum, self._lookup_type, code)
+            return default if name is None else name
+
+        def __getitem__(self, code: int) -> str:
+            name = self.get(code)
+            return self._unknown(code) if name is None else name
+
+        def __contains__(self, code: object) -> bool:
+            return isinstance(code, int) and self.get(code) is not None
+
     class NameLookupDict:
         """A specialized dict, with helper methods, for id -> name item/location data package lookups by game."""
         def __init__(self, ctx: CommonContext, lookup_type: typing.Literal["item", "location"]):
@@ -195,7 +258,6 @@ class CommonContext:
             self.lookup_type: typing.Literal["item", "location"] = lookup_type
             self._unknown_item: typing.Callable[[int], str] = lambda key: f"Unknown {lookup_type} (ID: {key})"
             self._archipelago_lookup: typing.Dict[int, str] = {}
-            self._flat_store: typing.Dict[int, str] = Utils.KeyedDefaultDict(self._unknown_item)
             self._game_store: typing.Dict[str, typing.ChainMap[int, str]] = collections.defaultdict(
                 lambda: collections.ChainMap(self._archipelago_lookup, Utils.KeyedDefaultDict(self._unknown_item)))
             self.warned: bool = False
@@ -212,7 +274,12 @@ class CommonContext:
                                   f"{self.lookup_type}, name could be incorrect. Please use "
                                   f"`{self.lookup_type}_names.lookup_in_game()` or "
                                   f"`{self.lookup_type}_names.lookup_in_slot()` instead.")
-                return self._flat_store[key]  # type: ignore
+                # the game updated last takes precedence for ids several games use
+                for game_lookup in reversed(self._game_store.values()):
+                    name = game_lookup.maps[-1].get(key)
+                    if name is not None:
+                        return name  # type: ignore
+                return self._unknown_item(key)  # type: ignore
 
             return self._game_store[key]
 
@@ -250,15 +317,25 @@ class CommonContext:
 
         def update_game(self, game: str, name_to_id_lookup_table: typing.Dict[str, int]) -> None:
             """Overrides existing lookup tables for a particular game."""
-            id_to_name_lookup_table = Utils.KeyedDefaultDict(self._unknown_item)
-            id_to_name_lookup_table.update({code: name for name, code in name_to_id_lookup_table.items()})
-            self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table)
-            self._flat_store.update(id_to_name_lookup_table)  # Only needed for legacy lookup method.
+            id_to_name_lookup_table = CommonContext.GameNameLookup(name_to_id_lookup_table, self._unknown_item)
+            self._set_game_lookup(game, id_to_name_lookup_table)
             if game == "Archipelago":
                 # Keep track of the Archipelago data package separately so if it gets updated in a custom datapackage,
                 # it updates in all chain maps automatically.
                 self._archipelago_lookup.clear()
-                self._archipelago_lookup.update(id_to_name_lookup_table)
+                self._archipelago_lookup.update(id_to_name_lookup_table.names)
+
+        def update_game_from_store(self, game: str, store: Utils.DataPackageStore, checksum: str) -> None:
+            """Overrides existing lookup tables for a particular game with lookups in the data package store."""
+            if game == "Archipelago":
+                self.update_game(game, store.get_ids(checksum, self.lookup_type))
+            else:
+                self._set_game_lookup(game, CommonContext.StoredGameNameLookup(store, checksum, self.lookup_type,
+                                                                               self._unknown_item))
+
+        def _set_game_lookup(self, game: str, id_to_name_lookup_table: typing.Mapping[int, str]) -> None:
+            self._game_store.pop(game, None)  # move to the end, to take precedence in legacy lookups
+            self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table)
 
     # defaults
     starting_reconnect_delay: int = 5
@@ -371,6 +448,10 @@ class CommonContext:
             return self.server_address
         return Utils.persistent_load().get("client", {}).get("last_server_address", "")
 
+    @functools.cached_property
+    def data_package_store(self) -> Utils.DataPackageStore:
+        return Utils.get_data_package_store()
+
     @functools.cached_property
     def raw_text_parser(self) -> RawJSONtoTextParser:
         return RawJSONtoTextParser(self)
@@ -591,6 +672,8 @@ class CommonContext:
                 if ((remote_checksum or remote_version <= local_version and remote_version != 0)
                         and remote_checksum == local_checksum):
                     self.update_game(network_data_package["games"][game], game)
+                elif remote_checksum and self.data_package_store.get_version(game, remote_checksum) is not None:
+                    self.update_game_from_store(game, remote_checksum)
                 else:
                     cached_game = Utils.load_data_package_for_checksum(game, remote_checksum)
                     cache_version: int = cached_game.get("version", 0)
@@ -601,6 +684,7 @@ class CommonContext:
                         needed_updates.add(game)
                     else:
                         self.update_game(cached_game, game)
+                        self.data_package_store.store_game(game, cached_game)
         if needed_updates:
             await self.send_msgs([{"cmd": "GetDataPackage", "games": [game_name]} for game_name in needed_updates])
 
@@ -610,6 +694,13 @@ class CommonContext:
         self.versions[game] = game_package.get("version", 0)
         self.checksums[game] = game_package.get("checksum")
 
+    def update_game_from_store(self, game: str, checksum: str):
+        """Look up names of game in the data package store, instead of loading its data package."""
+        self.item_names.update_game_from_store(game, self.data_package_store, checksum)
+        self.location_names.update_game_from_store(game, self.data_package_store, checksum)
+        self.versions[game] = self.data_package_store.get_version(game, checksum) or 0
+        self.checksums[game] = checksum
+
     def update_data_package(self, data_package: dict):
         for game, game_data in data_package["games"].items():
             self.update_game(game_data, game)
@@ -622,6 +713,7 @@ class CommonContext:
         logger.info(f"Got new ID/Name DataPackage for {', '.join(data_package['games'])}")
         for game, game_data in data_package["games"].items():
             Utils.store_data_package_for_checksum(game, game_data)
+            self.data_package_store.store_game(game, game_data)
 
     # data storage
 
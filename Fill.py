@@ -72,7 +72,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                     item_pool.pop(p)
                     break
         maximum_exploration_state = sweep_from_pool(
-            base_state, item_pool + unplaced_items, multiworld.get_filled_locations(item.player)
+            base_state, item_pool + unplaced_items, multiworld.get_advancement_locations(item.player)
             if single_player_placement else None)
 
         has_beaten_game = multiworld.has_beaten_game(maximum_exploration_state)
@@ -120,7 +120,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                         location.item = None
                         placed_item.location = None
                         swap_state = sweep_from_pool(base_state, [placed_item, *item_pool] if unsafe else item_pool,
-                                                     multiworld.get_filled_locations(item.player)
+                                                     multiworld.get_advancement_locations(item.player)
                                                      if single_player_placement else None)
                         # unsafe means swap_state assumes we can somehow collect placed_item before item_to_place
                         # by continuing to swap, which is not guaranteed. This is unsafe because there is no mechanic
@@ -180,7 +180,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
     if cleanup_required:
         # validate all placements and remove invalid ones
         state = sweep_from_pool(
-            base_state, [], multiworld.get_filled_locations(item.player)
+            base_state, [], multiworld.get_advancement_locations(item.player)
             if single_player_placement else None)
         for placement in placements:
             if multiworld.worlds[placement.item.player].options.accessibility != "minimal" and not placement.can_reach(state):
@@ -232,12 +232,17 @@ def remaining_fill(multiworld: MultiWorld,
     swapped_items: typing.Counter[typing.Tuple[int, str]] = Counter()
     total = min(len(itempool),  len(locations))
     placed = 0
+    locality = multiworld.locality
+    locality_only_rules = locality.locality_only_rules if locality else frozenset()
     while locations and itempool:
         item_to_place = itempool.pop()
         spot_to_fill: typing.Optional[Location] = None
 
+        # locations with nothing but locality rules are checked in bulk through the locality table
+        blocked_players = locality.blocked_players(item_to_place) if locality else frozenset()
         for i, location in enumerate(locations):
-            if location.item_rule(item_to_place):
+            if (location.player not in blocked_players if location.item_rule in locality_only_rules
+                    else location.item_rule(item_to_place)):
                 # popping by index is faster than removing by content,
                 spot_to_fill = locations.pop(i)
                 # skipping a scan for the element
@@ -363,7 +368,8 @@ def distribute_early_items(multiworld: MultiWorld,
         early_priority_locations: typing.List[Location] = []
         loc_indexes_to_remove: typing.Set[int] = set()
         base_state = multiworld.state.copy()
-        base_state.sweep_for_advancements(locations=(loc for loc in multiworld.get_filled_locations() if loc.address is None))
+        base_state.sweep_for_advancements(
+            locations=(loc for loc in multiworld.get_advancement_locations() if loc.address is None))
         for i, loc in enumerate(fill_locations):
             if loc.can_reach(base_state):
                 if loc.progress_type == LocationProgressType.PRIORITY:
@@ -980,15 +986,18 @@ def distribute_planned(multiworld: MultiWorld) -> None:
             err: typing.List[str] = []
             successful_pairs: typing.List[typing.Tuple[int, Item, Location]] = []
             claimed_indices: typing.Set[typing.Optional[int]] = set()
+            pool_indices: typing.Dict[str, typing.List[int]] = collections.defaultdict(list)
+            if from_pool:
+                for i, pool_item in enumerate(multiworld.itempool):
+                    if pool_item.player == player:
+                        pool_indices[pool_item.name].append(i)
             for item_name in items:
                 index_to_delete: typing.Optional[int] = None
                 if from_pool:
                     try:
                         # If from_pool, try to find an existing item with this name & player in the itempool and use it
-                        index_to_delete, item = next(
-                            (i, item) for i, item in enumerate(multiworld.itempool)
-                            if item.player == player and item.name == item_name and i not in claimed_indices
-                        )
+                        index_to_delete = next(i for i in pool_indices[item_name] if i not in claimed_indices)
+                        item = multiworld.itempool[index_to_delete]
                     except StopIteration:
                         warn(
                         f"Could not remove {item_name} from pool for {multiworld.player_name[player]} as it's already missing from it.",
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import contextlib
 import copy
 import logging
 import os
 import random
 import string
 import sys
+import time
 import urllib.parse
 import urllib.request
 from collections import Counter
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from itertools import chain
 
+# the generator only needs the worlds of the games it generates, see worlds.lazy_world_loading
+lazy_worlds_supported = True
+
 import ModuleUpdate
 
 ModuleUpdate.update()
@@ -52,6 +58,18 @@ def mystery_argparse():
     parser.add_argument("--skip_output", action="store_true",
                         help="Skips generation assertion and output stages and skips multidata and spoiler output. "
                              "Intended for debugging and testing purposes.")
+    parser.add_argument("--trace", default=None,
+                        help="Write a trace of the time taken by each generation step of each world to this file, "
+                             "in Chrome's trace format, for https://ui.perfetto.dev, and log a summary.")
+    parser.add_argument("--trace_memory", action="store_true",
+                        help="Also trace peak memory of each step. Makes generation a lot slower.")
+    parser.add_argument("--trace_profile", action="store_true",
+                        help="Also profile each world with cProfile, "
+                             "saving its stats next to the trace file as <trace>_P<player>.prof.")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Read player files and roll their options in this many processes. "
+                             "Each roll gets its own seed, so results only depend on the seed and not the number of "
+                             "processes, but differ from not setting this option.")
     args = parser.parse_args()
     if not os.path.isabs(args.weights_file_path):
         args.weights_file_path = os.path.join(args.player_files_path, args.weights_file_path)
@@ -65,6 +83,23 @@ def get_seed_name(random_source) -> str:
     return f"{random_source.randint(0, pow(10, seeddigits) - 1)}".zfill(seeddigits)
 
 
+@contextlib.contextmanager
+def job_map(processes: int) -> Iterator[Callable[..., Iterator[Any]]]:
+    """Provides a map function, that runs the jobs in a process pool if more than one process is requested."""
+    if processes > 1:
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            yield executor.map
+    else:
+        yield map
+
+
+def roll_file_settings(yamls: Tuple[Any, ...], plando_options: PlandoOptions,
+                       seed: int) -> Tuple[argparse.Namespace, ...]:
+    """Roll the settings of all yamls from a file with their own seed, independent of other rolls."""
+    random.seed(seed)
+    return tuple(roll_settings(yaml, plando_options) for yaml in yamls)
+
+
 def main(args=None) -> Tuple[argparse.Namespace, int]:
     # __name__ == "__main__" check so unittests that already imported worlds don't trip this.
     if __name__ == "__main__" and "worlds" in sys.modules:
@@ -106,17 +141,24 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
             raise Exception("Cannot mix --sameoptions with --meta")
     else:
         meta_weights = None
+    processes: int = getattr(args, "processes", 0)
     player_id = 1
     player_files = {}
+    player_file_paths: Dict[str, str] = {}
     for file in os.scandir(args.player_files_path):
         fname = file.name
         if file.is_file() and not fname.startswith(".") and not fname.lower().endswith(".ini") and \
                 os.path.join(args.player_files_path, fname) not in {args.meta_file_path, args.weights_file_path}:
-            path = os.path.join(args.player_files_path, fname)
+            player_file_paths[fname] = os.path.join(args.player_files_path, fname)
+    start = time.perf_counter()
+    with job_map(processes) as map_jobs:
+        file_weights = map_jobs(read_weights_yamls, player_file_paths.values())
+        for fname in player_file_paths:
             try:
-                weights_cache[fname] = read_weights_yamls(path)
+                weights_cache[fname] = next(file_weights)
             except Exception as e:
                 raise ValueError(f"File {fname} is invalid. Please fix your yaml.") from e
+    logging.info(f"Read {len(player_file_paths)} player files in {time.perf_counter() - start:.2f} seconds.")
 
     # sort dict for consistent results across platforms:
     weights_cache = {key: value for key, value in sorted(weights_cache.items(), key=lambda k: k[0].casefold())}
@@ -144,8 +186,10 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
                         f"Provide a general weights file ({args.weights_file_path}) or individual player files. "
                         f"A mix is also permitted.")
 
+    start = time.perf_counter()
     from worlds.AutoWorld import AutoWorldRegister
     from worlds.alttp.EntranceRandomizer import parse_arguments
+    logging.info(f"Loaded worlds in {time.perf_counter() - start:.2f} seconds.")
     erargs = parse_arguments(['--multi', str(args.multi)])
     erargs.seed = seed
     erargs.plando_options = args.plando
@@ -157,10 +201,19 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
     erargs.skip_output = args.skip_output
     erargs.name = {}
     erargs.csv_output = args.csv_output
-
-    settings_cache: Dict[str, Tuple[argparse.Namespace, ...]] = \
-        {fname: (tuple(roll_settings(yaml, args.plando) for yaml in yamls) if args.sameoptions else None)
-         for fname, yamls in weights_cache.items()}
+    erargs.trace = getattr(args, "trace", None)
+    erargs.trace_memory = getattr(args, "trace_memory", False)
+    erargs.trace_profile = getattr(args, "trace_profile", False)
+
+    start = time.perf_counter()
+    settings_cache: Dict[str, Optional[Tuple[argparse.Namespace, ...]]]
+    if processes and args.sameoptions:
+        settings_cache = dict(zip(weights_cache, roll_in_processes(weights_cache, list(weights_cache), args.plando,
+                                                                   processes)))
+    else:
+        settings_cache = \
+            {fname: (tuple(roll_settings(yaml, args.plando) for yaml in yamls) if args.sameoptions else None)
+             for fname, yamls in weights_cache.items()}
 
     if meta_weights:
         for category_name, category_dict in meta_weights.items():
@@ -185,12 +238,23 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
     name_counter = Counter()
     erargs.player_options = {}
 
+    rolled_settings: Optional[Iterator[Tuple[argparse.Namespace, ...]]] = None
+    if processes and not args.sameoptions:
+        # roll everything up front, in the order the players get assigned below
+        roll_paths: List[str] = []
+        player = 1
+        while player <= args.multi and player_path_cache[player]:
+            roll_paths.append(player_path_cache[player])
+            player += len(weights_cache[player_path_cache[player]])
+        rolled_settings = iter(roll_in_processes(weights_cache, roll_paths, args.plando, processes))
+
     player = 1
     while player <= args.multi:
         path = player_path_cache[player]
         if path:
             try:
                 settings: Tuple[argparse.Namespace, ...] = settings_cache[path] if settings_cache[path] else \
+                    next(rolled_settings) if rolled_settings else \
                     tuple(roll_settings(yaml, args.plando) for yaml in weights_cache[path])
                 for settingsObject in settings:
                     for k, v in vars(settingsObject).items():
@@ -214,12 +278,31 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
         else:
             raise RuntimeError(f'No weights specified for player {player}')
 
+    logging.info(f"Rolled options for {args.multi} player{'s' if args.multi > 1 else ''} "
+                 f"in {time.perf_counter() - start:.2f} seconds.")
+
     if len(set(name.lower() for name in erargs.name.values())) != len(erargs.name):
         raise Exception(f"Names have to be unique. Names: {Counter(name.lower() for name in erargs.name.values())}")
 
     return erargs, seed
 
 
+def roll_in_processes(weights_cache: Dict[str, Tuple[Any, ...]], paths: List[str], plando_options: PlandoOptions,
+                      processes: int) -> List[Tuple[argparse.Namespace, ...]]:
+    """Roll the yamls of each of paths, with seeds derived from the global random up front."""
+    seeds = [random.getrandbits(64) for _ in paths]
+    with job_map(processes) as map_jobs:
+        rolls = map_jobs(roll_file_settings, (weights_cache[path] for path in paths),
+                         (plando_options for _ in paths), seeds)
+        results: List[Tuple[argparse.Namespace, ...]] = []
+        for path in paths:
+            try:
+                results.append(next(rolls))
+            except Exception as e:
+                raise ValueError(f"File {path} is invalid. Please fix your yaml.") from e
+    return results
+
+
 def read_weights_yamls(path) -> Tuple[Any, ...]:
     try:
         if urllib.parse.urlparse(path).scheme in ('https', 'file'):
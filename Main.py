@@ -1,5 +1,6 @@
 import collections
 import concurrent.futures
+import contextlib
 import logging
 import os
 import pickle
@@ -14,6 +15,7 @@ from BaseClasses import CollectionState, Item, Location, LocationProgressType, M
 from Fill import FillError, balance_multiworld_progression, distribute_items_restrictive, distribute_planned, \
     flood_items
 from Options import StartInventoryPool
+from Tracing import GenerationTrace, span
 from Utils import __version__, output_path, version_tuple, get_settings
 from settings import get_settings
 from worlds import AutoWorld
@@ -23,6 +25,20 @@ __all__ = ["main"]
 
 
 def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = None):
+    trace_path: Optional[str] = getattr(args, "trace", None)
+    if not trace_path:
+        return _main(args, seed, baked_server_options)
+
+    trace = GenerationTrace(getattr(args, "trace_memory", False), getattr(args, "trace_profile", False))
+    try:
+        with trace.activate():
+            return _main(args, seed, baked_server_options)
+    finally:
+        logging.info(trace.summary(args.name))
+        trace.write(trace_path, args.name)
+
+
+def _main(args, seed, baked_server_options: Optional[Dict[str, object]]):
     if not baked_server_options:
         baked_server_options = get_settings().server_options.as_dict()
     assert isinstance(baked_server_options, dict)
@@ -200,7 +216,8 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
 
     logger.info("Running Item Plando.")
 
-    distribute_planned(multiworld)
+    with span("plando"):
+        distribute_planned(multiworld)
 
     logger.info('Running Pre Main Fill.')
 
@@ -208,15 +225,17 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
 
     logger.info(f'Filling the multiworld with {len(multiworld.itempool)} items.')
 
-    if multiworld.algorithm == 'flood':
-        flood_items(multiworld)  # different algo, biased towards early game progress items
-    elif multiworld.algorithm == 'balanced':
-        distribute_items_restrictive(multiworld, get_settings().generator.panic_method)
+    with span("fill"):
+        if multiworld.algorithm == 'flood':
+            flood_items(multiworld)  # different algo, biased towards early game progress items
+        elif multiworld.algorithm == 'balanced':
+            distribute_items_restrictive(multiworld, get_settings().generator.panic_method)
 
     AutoWorld.call_all(multiworld, 'post_fill')
 
     if multiworld.players > 1 and not args.skip_prog_balancing:
-        balance_multiworld_progression(multiworld)
+        with span("balancing"):
+            balance_multiworld_progression(multiworld)
     else:
         logger.info("Progression balancing skipped.")
 
@@ -233,15 +252,24 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
     output = tempfile.TemporaryDirectory()
     with output as temp_dir:
         output_players = [player for player in multiworld.player_ids if AutoWorld.World.generate_output.__code__
-                          is not multiworld.worlds[player].generate_output.__code__]
-        with concurrent.futures.ThreadPoolExecutor(len(output_players) + 2) as pool:
+                          is not multiworld.worlds[player].generate_output.__code__ or
+                          AutoWorld.World.generate_output_job.__code__
+                          is not multiworld.worlds[player].generate_output_job.__code__]
+        output_processes = get_settings().generator.output_processes
+        zip_compression_level = get_settings().generator.zip_compression_level
+        if not 0 <= zip_compression_level <= 9:  # fail before creating the output, not after
+            raise ValueError(f"zip_compression_level has to be from 0 to 9, not {zip_compression_level}")
+        job_pool = concurrent.futures.ProcessPoolExecutor(output_processes) \
+            if output_processes and output_players else None
+        with span("output"), concurrent.futures.ThreadPoolExecutor(len(output_players) + 2) as pool, \
+                job_pool or contextlib.nullcontext():
             check_accessibility_task = pool.submit(multiworld.fulfills_accessibility)
 
             output_file_futures = [pool.submit(AutoWorld.call_stage, multiworld, "generate_output", temp_dir)]
             for player in output_players:
                 # skip starting a thread for methods that say "pass".
                 output_file_futures.append(
-                    pool.submit(AutoWorld.call_single, multiworld, "generate_output", player, temp_dir))
+                    pool.submit(generate_player_output, multiworld, player, temp_dir, job_pool))
 
             # collect ER hint info
             er_hint_data: Dict[int, Dict[int, str]] = {}
@@ -361,19 +389,53 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
                     logger.info(f'Generating output files ({i}/{len(output_file_futures)}).')
                 future.result()
 
-        if args.spoiler > 1:
-            logger.info('Calculating playthrough.')
-            multiworld.spoiler.create_playthrough(create_paths=args.spoiler > 2)
+        with span("spoiler"):
+            if args.spoiler > 1:
+                logger.info('Calculating playthrough.')
+                multiworld.spoiler.create_playthrough(create_paths=args.spoiler > 2)
 
-        if args.spoiler:
-            multiworld.spoiler.to_file(os.path.join(temp_dir, '%s_Spoiler.txt' % outfilebase))
+            if args.spoiler:
+                multiworld.spoiler.to_file(os.path.join(temp_dir, '%s_Spoiler.txt' % outfilebase))
 
         zipfilename = output_path(f"AP_{multiworld.seed_name}.zip")
         logger.info(f"Creating final archive at {zipfilename}")
-        with zipfile.ZipFile(zipfilename, mode="w", compression=zipfile.ZIP_DEFLATED,
-                             compresslevel=9) as zf:
-            for file in os.scandir(temp_dir):
-                zf.write(file.path, arcname=file.name)
+        with span("archive"):
+            write_output_archive(zipfilename, temp_dir, zip_compression_level)
 
     logger.info('Done. Enjoy. Total Time: %s', time.perf_counter() - start)
     return multiworld
+
+
+def generate_player_output(multiworld: MultiWorld, player: int, output_directory: str,
+                           job_pool: Optional[concurrent.futures.Executor] = None) -> None:
+    """Create the output files of a world, using its output job if it offers one. Jobs are run in job_pool if given."""
+    job = AutoWorld.call_single(multiworld, "generate_output_job", player, output_directory)
+    if job is None:
+        AutoWorld.call_single(multiworld, "generate_output", player, output_directory)
+    elif job_pool:
+        job_pool.submit(job).result()
+    else:
+        job()
+
+
+def is_compressible(path: str, sample_size: int = 64 * 1024) -> bool:
+    """Guess if deflating a file is worth it, by trying it on a sample. Fails for zips, zlib streams and the like."""
+    with open(path, "rb") as f:
+        sample = f.read(sample_size)
+    return len(zlib.compress(sample, 1)) < len(sample) * 0.9
+
+
+def write_output_archive(zipfilename: str, directory: str, compresslevel: int = 9) -> None:
+    """Zip up all files in directory, with paths relative to it. Files that are already compressed are stored as is,
+    as deflating them again takes long for no gain."""
+    if not 0 <= compresslevel <= 9:
+        raise ValueError(f"zip_compression_level has to be from 0 to 9, not {compresslevel}")
+    with zipfile.ZipFile(zipfilename, mode="w") as zf:
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                if compresslevel and is_compressible(path):
+                    zf.write(path, os.path.relpath(path, directory), zipfile.ZIP_DEFLATED, compresslevel)
+                else:
+                    zf.write(path, os.path.relpath(path, directory), zipfile.ZIP_STORED)
@@ -6,6 +6,7 @@ import collections
 import contextlib
 import copy
 import datetime
+import fnmatch
 import functools
 import hashlib
 import inspect
@@ -179,10 +180,16 @@ class Context:
     location_checks: typing.Dict[typing.Tuple[int, int], typing.Set[int]]
     hints_used: typing.Dict[typing.Tuple[int, int], int]
     groups: typing.Dict[int, typing.Set[int]]
-    save_version = 2
+    save_version = 3  # 3: data storage saved as pickled entries per key, not readable by servers before it
     stored_data: typing.Dict[str, object]
     read_data: typing.Dict[str, object]
     stored_data_notification_clients: typing.Dict[str, typing.Set[Client]]
+    stored_data_notification_prefixes: typing.Dict[str, typing.Set[Client]]
+    stored_data_notification_patterns: typing.Dict[str, typing.Set[Client]]
+    dirty_stored_data_keys: typing.Set[str]
+    pending_set_replies: typing.Dict[Client, typing.List[str]]
+    bounce_game_clients: typing.Dict[int, typing.Dict[str, typing.Set[Client]]]
+    bounce_tag_clients: typing.Dict[int, typing.Dict[str, typing.Set[Client]]]
     slot_info: typing.Dict[int, NetworkSlot]
     generator_version = Version(0, 0, 0)
     checksums: typing.Dict[str, str]
@@ -257,6 +264,16 @@ class Context:
         self.random = random.Random()
         self.stored_data = {}
         self.stored_data_notification_clients = collections.defaultdict(weakref.WeakSet)
+        self.stored_data_notification_prefixes = collections.defaultdict(weakref.WeakSet)
+        self.stored_data_notification_patterns = collections.defaultdict(weakref.WeakSet)
+        self.dirty_stored_data_keys = set()
+        self.pending_set_replies = {}
+        self.bounce_game_clients = collections.defaultdict(dict)
+        self.bounce_tag_clients = collections.defaultdict(dict)
+        self._bounce_index_entries: typing.Dict[Client, typing.Tuple[int, str, typing.FrozenSet[str]]] = {}
+        self._stored_data_lock = threading.Lock()
+        self._stored_data_entries: typing.Dict[str, bytes] = {}
+        self._stored_data_entries_source: typing.Optional[typing.Dict[str, object]] = None
         self.read_data = {}
         self.spheres = []
 
@@ -288,9 +305,9 @@ class Context:
             self.non_hintable_names[world_name] = world.hint_blacklist
 
         for game_package in self.gamespackage.values():
-            # remove groups from data sent to clients
-            del game_package["item_name_groups"]
-            del game_package["location_name_groups"]
+            # remove groups from data sent to clients, unless an earlier Context in this process already did
+            game_package.pop("item_name_groups", None)
+            game_package.pop("location_name_groups", None)
 
     def _init_game_data(self):
         for game_name, game_package in self.gamespackage.items():
@@ -381,11 +398,34 @@ class Context:
         msgs = self.dumper(msgs)
         async_start(self.broadcast_send_encoded_msgs(endpoints, msgs))
 
+    def queue_set_reply(self, endpoints: typing.Iterable[Client], msg: dict):
+        """Encodes a SetReply right away and queues it to be sent with other SetReplies by flush_set_replies."""
+        encoded = self.dumper(msg)
+        for endpoint in endpoints:
+            self.pending_set_replies.setdefault(endpoint, []).append(encoded)
+
+    def flush_set_replies(self):
+        """Sends queued SetReplies, all of an endpoint's in one message."""
+        if not self.pending_set_replies:
+            return
+        # endpoints subscribed to the same keys get the same message, which only has to be built once
+        endpoints_by_replies: typing.Dict[typing.Tuple[int, ...], typing.List[Client]] = {}
+        replies_by_id: typing.Dict[typing.Tuple[int, ...], typing.List[str]] = {}
+        for endpoint, replies in self.pending_set_replies.items():
+            replies_id = tuple(map(id, replies))
+            endpoints_by_replies.setdefault(replies_id, []).append(endpoint)
+            replies_by_id[replies_id] = replies
+        self.pending_set_replies = {}
+        for replies_id, endpoints in endpoints_by_replies.items():
+            msg = f"[{','.join(replies_by_id[replies_id])}]"
+            async_start(self.broadcast_send_encoded_msgs(endpoints, msg))
+
     async def disconnect(self, endpoint: Client):
         if endpoint in self.endpoints:
             self.endpoints.remove(endpoint)
         if endpoint.slot and endpoint in self.clients[endpoint.team][endpoint.slot]:
             self.clients[endpoint.team][endpoint.slot].remove(endpoint)
+        self.remove_from_bounce_index(endpoint)
         await on_client_disconnected(self, endpoint)
 
     def notify_client(self, client: Client, text: str, additional_arguments: dict = {}):
@@ -598,7 +638,7 @@ class Context:
                 (key, value.timestamp()) for key, value in self.client_connection_timers.items()),
             "random_state": self.random.getstate(),
             "group_collected": dict(self.group_collected),
-            "stored_data": self.stored_data,
+            "stored_data_entries": self.get_stored_data_entries(),
             "game_options": {"hint_cost": self.hint_cost, "location_check_points": self.location_check_points,
                              "server_password": self.server_password, "password": self.password,
                              "release_mode": self.release_mode,
@@ -643,13 +683,95 @@ class Context:
         if "group_collected" in savedata:
             self.group_collected = savedata["group_collected"]
 
-        if "stored_data" in savedata:
+        if "stored_data_entries" in savedata:
+            self.stored_data = {key: restricted_loads(entry) for key, entry in savedata["stored_data_entries"].items()}
+            with self._stored_data_lock:
+                self._stored_data_entries = dict(savedata["stored_data_entries"])
+                self._stored_data_entries_source = self.stored_data
+                self.dirty_stored_data_keys = set()
+        elif "stored_data" in savedata:
             self.stored_data = savedata["stored_data"]
         # count items and slots from lists for items_handling = remote
         self.logger.info(
             f'Loaded save file with {sum([len(v) for k, v in self.received_items.items() if k[2]])} received items '
             f'for {sum(k[2] for k in self.received_items)} players')
 
+    def mark_stored_data_dirty(self, key: str):
+        with self._stored_data_lock:
+            self.dirty_stored_data_keys.add(key)
+
+    def get_stored_data_entries(self) -> typing.Dict[str, bytes]:
+        """Returns the pickled value of each data storage key. Only keys changed since the last call are pickled."""
+        with self._stored_data_lock:
+            if self._stored_data_entries_source is not self.stored_data:  # replaced as a whole, start over
+                self._stored_data_entries = {}
+                self._stored_data_entries_source = self.stored_data
+                self.dirty_stored_data_keys = set(self.stored_data)
+            dirty_keys, self.dirty_stored_data_keys = self.dirty_stored_data_keys, set()
+        for key in dirty_keys:
+            self._stored_data_entries[key] = pickle.dumps(self.stored_data[key])
+        return dict(self._stored_data_entries)
+
+    def add_stored_data_notification(self, client: Client, key: str):
+        """Notify client of changes to exactly key."""
+        self.stored_data_notification_clients[key].add(client)
+
+    def add_stored_data_pattern_notification(self, client: Client, pattern: str):
+        """Notify client of changes to all keys matching the glob pattern, like for fnmatch.
+        A pattern whose only special character is a trailing `*` is looked up as a prefix."""
+        if pattern.endswith("*") and not any(char in pattern[:-1] for char in "*?["):
+            self.stored_data_notification_prefixes[pattern[:-1]].add(client)
+        else:
+            self.stored_data_notification_patterns[pattern].add(client)
+
+    def get_stored_data_notification_clients(self, key: str) -> typing.Set[Client]:
+        targets: typing.Set[Client] = set(self.stored_data_notification_clients.get(key, ()))
+        if self.stored_data_notification_prefixes:
+            prefixes = self.stored_data_notification_prefixes
+            for end in range(len(key) + 1):
+                clients = prefixes.get(key[:end])
+                if clients:
+                    targets.update(clients)
+        for pattern, clients in self.stored_data_notification_patterns.items():
+            if clients and fnmatch.fnmatchcase(key, pattern):
+                targets.update(clients)
+        return targets
+
+    def update_bounce_index(self, client: Client):
+        """Index client by its team, the game of its slot and its tags, for Bounce. Call after these change."""
+        self.remove_from_bounce_index(client)
+        entry = client.team, self.games[client.slot], frozenset(client.tags)
+        team, game, tags = entry
+        self._bounce_index_entries[client] = entry
+        self.bounce_game_clients[team].setdefault(game, set()).add(client)
+        team_tag_clients = self.bounce_tag_clients[team]
+        for tag in tags:
+            team_tag_clients.setdefault(tag, set()).add(client)
+
+    def remove_from_bounce_index(self, client: Client):
+        entry = self._bounce_index_entries.pop(client, None)
+        if entry:
+            team, game, tags = entry
+            for index, keys in ((self.bounce_game_clients[team], (game,)), (self.bounce_tag_clients[team], tags)):
+                for key in keys:
+                    clients = index[key]
+                    clients.discard(client)
+                    if not clients:
+                        del index[key]
+
+    def get_bounce_clients(self, team: int, games: typing.Iterable[str], tags: typing.Iterable[str],
+                           slots: typing.Iterable[int]) -> typing.Set[Client]:
+        """Clients of team that play one of games, have one of tags or are connected to one of slots."""
+        targets: typing.Set[Client] = set()
+        for index, keys in ((self.bounce_game_clients.get(team, {}), games),
+                            (self.bounce_tag_clients.get(team, {}), tags),
+                            (self.clients.get(team, {}), slots)):
+            for key in keys:
+                clients = index.get(key)
+                if clients:
+                    targets.update(clients)
+        return targets
+
     # rest
 
     def get_hint_cost(self, slot):
@@ -798,13 +920,13 @@ class Context:
 
     def on_changed_hints(self, team: int, slot: int):
         key: str = f"_read_hints_{team}_{slot}"
-        targets: typing.Set[Client] = set(self.stored_data_notification_clients[key])
+        targets: typing.Set[Client] = self.get_stored_data_notification_clients(key)
         if targets:
             self.broadcast(targets, [{"cmd": "SetReply", "key": key, "value": self.hints[team, slot]}])
 
     def on_client_status_change(self, team: int, slot: int):
         key: str = f"_read_client_status_{team}_{slot}"
-        targets: typing.Set[Client] = set(self.stored_data_notification_clients[key])
+        targets: typing.Set[Client] = self.get_stored_data_notification_clients(key)
         if targets:
             self.broadcast(targets, [{"cmd": "SetReply", "key": key, "value": self.client_game_state[team, slot]}])
 
@@ -832,11 +954,15 @@ async def server(websocket, path: str = "/", ctx: Context = None):
             if ctx.log_network:
                 ctx.logger.info(f"Incoming message: {data}")
             for msg in decode(data):
+                if ctx.pending_set_replies and not (isinstance(msg, dict) and msg.get("cmd") == "Set"):
+                    ctx.flush_set_replies()  # keep replies in order with responses to other commands
                 await process_client_cmd(ctx, client, msg)
+            ctx.flush_set_replies()
     except Exception as e:
         if not isinstance(e, websockets.WebSocketException):
             ctx.logger.exception(e)
     finally:
+        ctx.flush_set_replies()
         if ctx.log_network:
             ctx.logger.info("Disconnected")
         await ctx.disconnect(client)
@@ -1783,6 +1909,7 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
             client.version = args['version']
             client.tags = args['tags']
             client.no_locations = 'TextOnly' in client.tags or 'Tracker' in client.tags
+            ctx.update_bounce_index(client)
             connected_packet = {
                 "cmd": "Connected",
                 "team": client.team, "slot": client.slot,
@@ -1854,6 +1981,7 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 old_tags = client.tags
                 client.tags = args["tags"]
                 if set(old_tags) != set(client.tags):
+                    ctx.update_bounce_index(client)
                     client.no_locations = 'TextOnly' in client.tags or 'Tracker' in client.tags
                     ctx.broadcast_text_all(
                         f"{ctx.get_aliased_name(client.team, client.slot)} (Team #{client.team + 1}) has changed tags "
@@ -1952,11 +2080,9 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
             args["cmd"] = "Bounced"
             msg = ctx.dumper([args])
 
-            for bounceclient in ctx.endpoints:
-                if client.team == bounceclient.team and (ctx.games[bounceclient.slot] in games or
-                                                         set(bounceclient.tags) & tags or
-                                                         bounceclient.slot in slots):
-                    await ctx.send_encoded_msgs(bounceclient, msg)
+            targets = ctx.get_bounce_clients(client.team, games, tags, slots)
+            if targets:
+                await ctx.broadcast_send_encoded_msgs(targets, msg)
 
         elif cmd == "Get":
             if "keys" not in args or type(args["keys"]) != list:
@@ -1985,20 +2111,25 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 func = modify_functions[operation["operation"]]
                 value = func(value, operation["value"])
             ctx.stored_data[args["key"]] = args["value"] = value
-            targets = set(ctx.stored_data_notification_clients[args["key"]])
+            ctx.mark_stored_data_dirty(args["key"])
+            targets = ctx.get_stored_data_notification_clients(args["key"])
             if args.get("want_reply", True):
                 targets.add(client)
             if targets:
-                ctx.broadcast(targets, [args])
+                # Sets sent together get their SetReplies back together, see server()
+                ctx.queue_set_reply(targets, args)
             ctx.save()
 
         elif cmd == "SetNotify":
-            if "keys" not in args or type(args["keys"]) != list:
+            if ("keys" not in args and "patterns" not in args) or type(args.get("keys", [])) != list or \
+                    type(args.get("patterns", [])) != list:
                 await ctx.send_msgs(client, [{'cmd': 'InvalidPacket', "type": "arguments",
                                               "text": 'SetNotify', "original_cmd": cmd}])
                 return
-            for key in args["keys"]:
-                ctx.stored_data_notification_clients[key].add(client)
+            for key in args.get("keys", []):
+                ctx.add_stored_data_notification(client, key)
+            for pattern in args.get("patterns", []):
+                ctx.add_stored_data_pattern_notification(client, pattern)
 
 
 def update_client_status(ctx: Context, client: Client, new_status: ClientStatus):
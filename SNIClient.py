@@ -9,7 +9,9 @@ import subprocess
 import base64
 import logging
 import asyncio
+import bisect
 import enum
+import itertools
 import typing
 
 from json import loads, dumps
@@ -512,6 +514,32 @@ async def snes_recv_loop(ctx: SNIContext) -> None:
 
 
 async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional[bytes]:
+    data = await snes_read_many(ctx, [(address, size)])
+    return None if data is None else data[0]
+
+
+def merge_snes_reads(reads: typing.Iterable[typing.Tuple[int, int]],
+                     max_gap: int = 0) -> typing.List[typing.Tuple[int, int]]:
+    """Merge (address, size) ranges that overlap, touch or are at most max_gap bytes apart into sorted ranges."""
+    merged: typing.List[typing.Tuple[int, int]] = []
+    for address, size in sorted(reads):
+        if merged and address <= merged[-1][0] + merged[-1][1] + max_gap:
+            start, merged_size = merged[-1]
+            merged[-1] = (start, max(merged_size, address + size - start))
+        else:
+            merged.append((address, size))
+    return merged
+
+
+async def snes_read_many(ctx: SNIContext, reads: typing.Sequence[typing.Tuple[int, int]],
+                         max_gap: int = 0x20) -> typing.Optional[typing.List[bytes]]:
+    """Read several (address, size) ranges, like a game watcher needs each tick, in one go.
+    Ranges close to each other are read with one request and all requests are sent before waiting for data,
+    so this takes a single round trip to SNI. Returns the data for each range in order, or None on failure."""
+    if not reads:
+        return []
+    merged = merge_snes_reads(reads, max_gap)
+    total_size = sum(size for _, size in merged)
     try:
         await ctx.snes_request_lock.acquire()
 
@@ -523,36 +551,48 @@ async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional
         ):
             return None
 
-        GetAddress_Request: SNESRequest = {
-            "Opcode": "GetAddress",
-            "Space": "SNES",
-            "Operands": [hex(address)[2:], hex(size)[2:]]
-        }
         try:
-            await ctx.snes_socket.send(dumps(GetAddress_Request))
+            for address, size in merged:
+                GetAddress_Request: SNESRequest = {
+                    "Opcode": "GetAddress",
+                    "Space": "SNES",
+                    "Operands": [hex(address)[2:], hex(size)[2:]]
+                }
+                await ctx.snes_socket.send(dumps(GetAddress_Request))
         except ConnectionClosed:
             return None
 
         data: bytes = bytes()
-        while len(data) < size:
+        while len(data) < total_size:
             try:
                 data += await asyncio.wait_for(ctx.snes_recv_queue.get(), 5)
             except asyncio.TimeoutError:
                 break
 
-        if len(data) != size:
-            snes_logger.error('Error reading %s, requested %d bytes, received %d' % (hex(address), size, len(data)))
+        if len(data) != total_size:
+            snes_logger.error('Error reading %s, requested %d bytes, received %d' %
+                              (", ".join(hex(address) for address, _ in merged), total_size, len(data)))
             if len(data):
                 snes_logger.error(str(data))
                 snes_logger.warning('Communication Failure with SNI')
             if ctx.snes_socket is not None and not ctx.snes_socket.closed:
                 await ctx.snes_socket.close()
             return None
-
-        return data
     finally:
         ctx.snes_request_lock.release()
 
+    if len(merged) == 1 and len(reads) == 1:
+        return [data]
+    # hand each read its slice of the merged ranges
+    starts = [address for address, _ in merged]
+    offsets = list(itertools.accumulate((size for _, size in merged), initial=0))
+    results: typing.List[bytes] = []
+    for address, size in reads:
+        index = bisect.bisect_right(starts, address) - 1
+        offset = offsets[index] + address - starts[index]
+        results.append(data[offset:offset + size])
+    return results
+
 
 async def snes_write(ctx: SNIContext, write_list: typing.List[typing.Tuple[int, bytes]]) -> bool:
     try:
@@ -0,0 +1,211 @@
+"""Structured timing of generation, for finding which world or stage makes a multiworld slow.
+
+Generate with `--trace <file>` to get a Chrome trace of every world's step, fill, balancing, spoiler and output,
+which can be opened in https://ui.perfetto.dev or chrome://tracing, and a summary in the log."""
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, ContextManager, Dict, Iterator, List, NamedTuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+
+__all__ = ["GenerationTrace", "TraceEvent", "get_active_trace", "span"]
+
+_active_trace: Optional[GenerationTrace] = None
+
+
+def get_active_trace() -> Optional[GenerationTrace]:
+    """The trace generation is currently recorded to, if any."""
+    return _active_trace
+
+
+def span(name: str, category: str = "stage", player: Optional[int] = None, game: Optional[str] = None
+         ) -> ContextManager[None]:
+    """Record the block as an event of the active trace, if generation is traced."""
+    if _active_trace:
+        return _active_trace.span(name, category, player, game)
+    return contextlib.nullcontext()
+
+
+class TraceEvent(NamedTuple):
+    name: str
+    category: str
+    start: float
+    """seconds since the start of the trace"""
+    duration: float
+    cpu: float
+    """CPU time of the thread the event ran in, in seconds"""
+    memory: Optional[int]
+    """peak traced memory during the event minus traced memory before it, in bytes, if memory is traced"""
+    thread: int
+    player: Optional[int]
+    game: Optional[str]
+
+
+class _OpenSpan:
+    __slots__ = ("start_memory", "peak_memory")
+
+    def __init__(self, start_memory: int) -> None:
+        self.start_memory = start_memory
+        self.peak_memory = start_memory
+
+
+class GenerationTrace:
+    """Records a TraceEvent for every span of generation while active.
+
+    Peak memory is traced with tracemalloc if trace_memory is set, which makes generation a lot slower,
+    and only for spans on the thread that activated the trace, as tracemalloc can't tell threads apart.
+    If profile is set, every world's calls are run under a cProfile.Profile of that world."""
+    events: List[TraceEvent]
+    trace_memory: bool
+    profile: bool
+    profiles: Dict[int, "cProfile.Profile"]
+
+    def __init__(self, trace_memory: bool = False, profile: bool = False) -> None:
+        self.events = []
+        self.trace_memory = trace_memory
+        self.profile = profile
+        self.profiles = {}
+        self.start = time.perf_counter()
+        self._thread: Optional[int] = None
+        self._open_spans: List[_OpenSpan] = []
+        self._started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[GenerationTrace]:
+        global _active_trace
+        if _active_trace:
+            raise RuntimeError("Another generation trace is already active.")
+        self._thread = threading.get_ident()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        _active_trace = self
+        try:
+            yield self
+        finally:
+            _active_trace = None
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, player: Optional[int] = None, game: Optional[str] = None
+             ) -> Iterator[None]:
+        thread = threading.get_ident()
+        open_span: Optional[_OpenSpan] = None
+        if self.trace_memory and thread == self._thread and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if self._open_spans:  # the peak is reset below, so hand it to the span we are in first
+                self._open_spans[-1].peak_memory = max(self._open_spans[-1].peak_memory, peak)
+            tracemalloc.reset_peak()
+            open_span = _OpenSpan(current)
+            self._open_spans.append(open_span)
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            cpu = time.thread_time() - cpu_start
+            end = time.perf_counter()
+            memory: Optional[int] = None
+            if open_span:
+                self._open_spans.pop()
+                open_span.peak_memory = max(open_span.peak_memory, tracemalloc.get_traced_memory()[1])
+                memory = open_span.peak_memory - open_span.start_memory
+                if self._open_spans:
+                    self._open_spans[-1].peak_memory = max(self._open_spans[-1].peak_memory, open_span.peak_memory)
+            self.events.append(TraceEvent(name, category, start - self.start, end - start, cpu, memory, thread,
+                                          player, game))
+
+    @contextlib.contextmanager
+    def profiled(self, player: int) -> Iterator[None]:
+        """Run the block under the profile of player, if profiling."""
+        if not self.profile:
+            yield
+            return
+        import cProfile
+        profile = self.profiles.setdefault(player, cProfile.Profile())
+        try:
+            profile.enable()
+        except ValueError:  # another profile is active in this interpreter, as profiling is global in 3.12+
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+
+    def to_chrome_trace(self, player_names: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+        """The events in Chrome's Trace Event Format, as read by Perfetto and chrome://tracing."""
+        pid = os.getpid()
+        threads = {thread: number for number, thread in enumerate(dict.fromkeys(
+            [self._thread, *(event.thread for event in self.events)]))}
+        trace_events: List[Dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": number,
+             "args": {"name": "Main" if number == 0 else f"Worker {number}"}}
+            for number in threads.values()
+        ]
+        for event in self.events:
+            args: Dict[str, Any] = {"cpu_ms": round(event.cpu * 1000, 3)}
+            if event.memory is not None:
+                args["peak_memory_delta_kib"] = round(event.memory / 1024, 1)
+            if event.player is not None:
+                args["player"] = event.player
+                if player_names and event.player in player_names:
+                    args["player_name"] = player_names[event.player]
+            if event.game:
+                args["game"] = event.game
+            trace_events.append({
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": round(event.start * 1_000_000, 3),
+                "dur": round(event.duration * 1_000_000, 3),
+                "pid": pid,
+                "tid": threads[event.thread],
+                "args": args,
+            })
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def summary(self, player_names: Optional[Dict[int, str]] = None, top: int = 10) -> str:
+        """A table of the time taken per generation stage and by the slowest worlds."""
+        def row(name: str, events: List[TraceEvent]) -> str:
+            memory = [event.memory for event in events if event.memory is not None]
+            memory_text = f"{max(memory) / 1024 / 1024:10.1f}" if memory else f"{'-':>10}"
+            return (f"{name:<40.40} {len(events):>6} {sum(event.duration for event in events):10.3f} "
+                    f"{sum(event.cpu for event in events):10.3f} {memory_text}")
+
+        header = f"{'':<40} {'Calls':>6} {'Wall (s)':>10} {'CPU (s)':>10} {'Peak (MiB)':>10}"
+        stages: Dict[str, List[TraceEvent]] = {}
+        worlds: Dict[int, List[TraceEvent]] = {}
+        for event in self.events:
+            if event.category == "stage":
+                stages.setdefault(event.name, []).append(event)
+            elif event.category == "world" and event.player is not None:
+                worlds.setdefault(event.player, []).append(event)
+        lines = ["Generation stages:", header]
+        lines.extend(row(name, events) for name, events in stages.items())
+        slowest = sorted(worlds.items(), key=lambda item: sum(event.duration for event in item[1]), reverse=True)
+        lines.extend(["Slowest worlds:", header])
+        for player, events in slowest[:top]:
+            name = player_names[player] if player_names and player in player_names else f"Player {player}"
+            lines.append(row(f"{name} ({events[0].game})", events))
+        return "\n".join(lines)
+
+    def write(self, path: str, player_names: Optional[Dict[int, str]] = None) -> None:
+        """Write the Chrome trace to path, and the profile of each world next to it, named after its player."""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(player_names), f)
+        base = os.path.splitext(path)[0]
+        for player, profile in self.profiles.items():
+            profile.dump_stats(f"{base}_P{player}.prof")
+        logging.info(f"Wrote generation trace to {path}"
+                     + (f" and {len(self.profiles)} world profiles next to it" if self.profiles else ""))
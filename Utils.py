@@ -14,6 +14,7 @@ import io
 import collections
 import importlib
 import logging
+import threading
 import warnings
 
 from argparse import Namespace
@@ -32,6 +33,7 @@ if typing.TYPE_CHECKING:
     import pathlib
     from BaseClasses import Region
     import multiprocessing
+    import sqlite3
 
 
 def tuplize_version(version: str) -> Version:
@@ -367,6 +369,85 @@ def store_data_package_for_checksum(game: str, data: typing.Dict[str, Any]) -> N
             logging.debug(f"Could not store data package: {e}")
 
 
+class DataPackageStore:
+    """Data packages of games received from servers, kept in a sqlite database by checksum.
+
+    The database is shared by every client on this machine and names are looked up one id at a time,
+    so a client doesn't have to load the full data package of every game in a multiworld."""
+    path: str
+    _connection: typing.Optional["sqlite3.Connection"]
+
+    def __init__(self, path: typing.Optional[str] = None) -> None:
+        self.path = path if path else cache_path("datapackage", "datapackage.sqlite3")
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> "sqlite3.Connection":
+        if self._connection is None:
+            import sqlite3
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")  # readers in other clients don't block a writer
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS packages "
+                                   "(game TEXT, checksum TEXT, version INTEGER, PRIMARY KEY (game, checksum))")
+                connection.execute("CREATE TABLE IF NOT EXISTS names (checksum TEXT, kind TEXT, id INTEGER, name TEXT, "
+                                   "PRIMARY KEY (checksum, kind, id)) WITHOUT ROWID")
+                connection.execute("CREATE INDEX IF NOT EXISTS names_by_name ON names (checksum, kind, name)")
+            self._connection = connection
+        return self._connection
+
+    def _query(self, sql: str, parameters: typing.Sequence[typing.Any]) -> typing.List[typing.Tuple[typing.Any, ...]]:
+        try:
+            with self._lock:
+                return self.connection.execute(sql, parameters).fetchall()
+        except Exception as e:
+            logging.debug(f"Could not read data package store: {e}")
+            return []
+
+    def get_version(self, game: str, checksum: str) -> typing.Optional[int]:
+        """Returns the version of the stored data package of game with checksum, or None if it isn't stored."""
+        rows = self._query("SELECT version FROM packages WHERE game = ? AND checksum = ?", (game, checksum))
+        return rows[0][0] if rows else None
+
+    def store_game(self, game: str, data: typing.Dict[str, Any]) -> None:
+        """Adds the data package of game, if it has a checksum and isn't stored yet."""
+        checksum = data.get("checksum")
+        if not checksum or self.get_version(game, checksum) is not None:
+            return
+        try:
+            with self._lock, self.connection as connection:
+                connection.executemany("INSERT OR IGNORE INTO names VALUES (?, ?, ?, ?)", itertools.chain(
+                    ((checksum, "item", code, name) for name, code in data["item_name_to_id"].items()),
+                    ((checksum, "location", code, name) for name, code in data["location_name_to_id"].items())))
+                connection.execute("INSERT OR IGNORE INTO packages VALUES (?, ?, ?)",
+                                   (game, checksum, data.get("version", 0)))
+        except Exception as e:
+            logging.debug(f"Could not store data package: {e}")
+
+    def get_name(self, checksum: str, kind: typing.Literal["item", "location"], code: int) -> typing.Optional[str]:
+        rows = self._query("SELECT name FROM names WHERE checksum = ? AND kind = ? AND id = ?", (checksum, kind, code))
+        return rows[0][0] if rows else None
+
+    def get_id(self, checksum: str, kind: typing.Literal["item", "location"], name: str) -> typing.Optional[int]:
+        rows = self._query("SELECT id FROM names WHERE checksum = ? AND kind = ? AND name = ?", (checksum, kind, name))
+        return rows[0][0] if rows else None
+
+    def get_ids(self, checksum: str, kind: typing.Literal["item", "location"]) -> typing.Dict[str, int]:
+        return dict(self._query("SELECT name, id FROM names WHERE checksum = ? AND kind = ?", (checksum, kind)))
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+@cache_argsless
+def get_data_package_store() -> DataPackageStore:
+    return DataPackageStore()
+
+
 def get_default_adjuster_settings(game_name: str) -> Namespace:
     import LttPAdjuster
     adjuster_settings = Namespace()
@@ -474,6 +555,71 @@ class KeyedDefaultDict(collections.defaultdict):
         return value
 
 
+class LazyDict(dict):
+    """dict with pending keys, whose loader is called to fill them in the first time they are accessed.
+    Iterating or measuring the dict loads all pending keys first."""
+    pending: typing.Dict[typing.Any, typing.Callable[[], typing.Any]]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.pending = {}
+
+    def load(self, key: Any) -> None:
+        loader = self.pending.pop(key, None)
+        if loader:
+            loader()
+
+    def load_all(self) -> None:
+        while self.pending:
+            self.load(next(iter(self.pending)))
+
+    def __missing__(self, key: Any) -> Any:
+        self.load(key)
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or key in self.pending
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __bool__(self) -> bool:
+        return dict.__len__(self) > 0 or bool(self.pending)
+
+    def __len__(self) -> int:
+        self.load_all()
+        return dict.__len__(self)
+
+    def __iter__(self) -> typing.Iterator[Any]:
+        self.load_all()
+        return dict.__iter__(self)
+
+    def keys(self) -> typing.KeysView[Any]:
+        self.load_all()
+        return dict.keys(self)
+
+    def values(self) -> typing.ValuesView[Any]:
+        self.load_all()
+        return dict.values(self)
+
+    def items(self) -> typing.ItemsView[Any, Any]:
+        self.load_all()
+        return dict.items(self)
+
+    def __repr__(self) -> str:
+        self.load_all()
+        return dict.__repr__(self)
+
+
 def get_text_between(text: str, start: str, end: str) -> str:
     return text[text.index(start) + len(start): text.rindex(end)]
 
@@ -12,6 +12,7 @@ from werkzeug.routing import BaseConverter
 from Utils import title_sorted, get_file_safe_name
 
 UPLOAD_FOLDER = os.path.relpath('uploads')
+BLOB_FOLDER = os.path.relpath('blobs')
 LOGS_FOLDER = os.path.relpath('logs')
 os.makedirs(LOGS_FOLDER, exist_ok=True)
 
@@ -32,6 +33,7 @@ app.config["SELFGEN"] = True  # application process is in charge of scheduling G
 app.config["DEBUG"] = False
 app.config["PORT"] = 80
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config["BLOB_FOLDER"] = BLOB_FOLDER  # content addressed storage of slot files
 app.config['MAX_CONTENT_LENGTH'] = 64 * 1024 * 1024  # 64 megabyte limit
 # if you want to deploy, make sure you have a non-guessable secret key
 app.config["SECRET_KEY"] = bytes(socket.gethostname(), encoding="utf-8")
@@ -39,6 +41,9 @@ app.config["SECRET_KEY"] = bytes(socket.gethostname(), encoding="utf-8")
 app.config["JOB_THRESHOLD"] = 1
 # after what time in seconds should generation be aborted, freeing the queue slot. Can be set to None to disable.
 app.config["JOB_TIME"] = 600
+# after what time in seconds without connected clients a hosted room writes its state to the database and frees it
+# from memory until the next connection. Can be set to None to disable.
+app.config["HIBERNATION_TIME"] = None
 app.config['SESSION_PERMANENT'] = True
 
 # waitress uses one thread for I/O, these are for processing of views that then get sent
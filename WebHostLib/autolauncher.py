@@ -66,9 +66,12 @@ def cleanup():
         rooms = Room.select(lambda room: room.owner == UUID(int=0)).delete(bulk=True)
         seeds = Seed.select(lambda seed: seed.owner == UUID(int=0) and not seed.rooms).delete(bulk=True)
         slots = Slot.select(lambda slot: not slot.seed).delete(bulk=True)
-        # Command gets deleted by ponyorm Cascade Delete, as Room is Required
+        # Command gets deleted by ponyorm Cascade Delete, as Room is Required, same for SlotBlob of Slot
     if rooms or seeds or slots:
         logging.info(f"{rooms} Rooms, {seeds} Seeds and {slots} Slots have been deleted.")
+    blobs = collect_blobs()
+    if blobs:
+        logging.info(f"{blobs} unreferenced files have been deleted from the blob store.")
 
 
 def autohost(config: dict):
@@ -147,6 +150,7 @@ class MultiworldInstance():
         self.cert = config["SELFLAUNCHCERT"]
         self.key = config["SELFLAUNCHKEY"]
         self.host = config["HOST_ADDRESS"]
+        self.hibernation_time = config["HIBERNATION_TIME"]
         self.rooms_to_start = multiprocessing.Queue()
         self.rooms_shutting_down = multiprocessing.Queue()
         self.name = f"MultiHoster{id}"
@@ -156,8 +160,8 @@ class MultiworldInstance():
             return False
 
         process = multiprocessing.Process(group=None, target=run_server_process,
-                                          args=(self.name, self.ponyconfig, get_static_server_data(),
-                                                self.cert, self.key, self.host,
+                                          args=(self.name, self.ponyconfig, get_static_server_data_file(),
+                                                self.cert, self.key, self.host, self.hibernation_time,
                                                 self.rooms_to_start, self.rooms_shutting_down),
                                           name=self.name)
         process.start()
@@ -186,5 +190,6 @@ class MultiworldInstance():
 
 
 from .models import Room, Generation, STATE_QUEUED, STATE_STARTED, STATE_ERROR, db, Seed, Slot
-from .customserver import run_server_process, get_static_server_data
+from .blobs import collect_blobs
+from .customserver import run_server_process, get_static_server_data_file
 from .generate import gen_game
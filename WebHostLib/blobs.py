@@ -0,0 +1,67 @@
+"""Content addressed storage of uploaded slot files on disk, so they don't have to pass through RAM as a whole."""
+import hashlib
+import os
+import tempfile
+import time
+import typing
+
+from . import app
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def blob_path(digest: str) -> str:
+    return os.path.join(app.config["BLOB_FOLDER"], digest[:2], digest)
+
+
+def store_blob(stream: typing.BinaryIO) -> str:
+    """Copy stream into the blob store in chunks. Returns the digest to retrieve it with.
+    Identical files are only stored once."""
+    folder = app.config["BLOB_FOLDER"]
+    os.makedirs(folder, exist_ok=True)
+    sha = hashlib.sha256()
+    with tempfile.NamedTemporaryFile(dir=folder, delete=False) as temp_file:
+        try:
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                sha.update(chunk)
+                temp_file.write(chunk)
+        except BaseException:
+            temp_file.close()
+            os.unlink(temp_file.name)
+            raise
+    digest = sha.hexdigest()
+    path = blob_path(digest)
+    if os.path.exists(path):
+        os.unlink(temp_file.name)
+        os.utime(path)  # new reference, so collect_blobs doesn't remove it before it is committed
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(temp_file.name, path)
+    return digest
+
+
+def open_blob(digest: str) -> typing.BinaryIO:
+    return open(blob_path(digest), "rb")
+
+
+def collect_blobs(min_age: float = 60 * 60) -> int:
+    """Delete files of the blob store that no SlotBlob references, returning how many were deleted.
+    Files younger than min_age seconds are kept, as their upload may not be committed yet.
+    This includes temporary files of uploads that didn't finish."""
+    from pony.orm import db_session, select
+    from .models import SlotBlob
+
+    folder = app.config["BLOB_FOLDER"]
+    if not os.path.isdir(folder):
+        return 0
+    with db_session:
+        referenced = set(select(blob.digest for blob in SlotBlob))
+    cutoff = time.time() - min_age
+    deleted = 0
+    for directory, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            path = os.path.join(directory, file_name)
+            if file_name not in referenced and os.path.getmtime(path) < cutoff:
+                os.unlink(path)
+                deleted += 1
+    return deleted
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import contextlib
 import datetime
 import functools
 import logging
+import mmap
 import multiprocessing
 import pickle
 import random
@@ -19,7 +21,8 @@ from pony.orm import commit, db_session, select
 
 import Utils
 
-from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, load_server_cert
+from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, \
+    load_server_cert, queue_gc
 from Utils import restricted_loads, cache_argsless
 from .locker import Locker
 from .models import Command, GameDataPackage, Room, db
@@ -53,24 +56,38 @@ del MultiServer
 
 
 class DBCommandProcessor(ServerCommandProcessor):
+    ctx: WebHostContext
+
+    def __call__(self, raw: str) -> typing.Optional[bool]:
+        # commands from the website may arrive while nobody is connected
+        self.ctx.wake()
+        return super(DBCommandProcessor, self).__call__(raw)
+
     def output(self, text: str):
         self.ctx.logger.info(text)
 
 
 class WebHostContext(Context):
     room_id: int
+    hibernated: bool
+    """game state has been written to the database and released from memory, see hibernate()"""
+    idle_since: float
+    """time.monotonic() of the last moment a client was connected"""
 
     def __init__(self, static_server_data: dict, logger: logging.Logger):
         # static server data is used during _load_game_data to load required data,
         # without needing to import worlds system, which takes quite a bit of memory
+        # it is shared by all rooms of the process and kept around to rehydrate the room after hibernation
         self.static_server_data = static_server_data
         super(WebHostContext, self).__init__("", 0, "", "", 1,
                                              40, True, "enabled", "enabled",
                                              "enabled", 0, 2, logger=logger)
-        del self.static_server_data
         self.main_loop = asyncio.get_running_loop()
         self.video = {}
         self.tags = ["AP", "WebHost"]
+        self.hibernated = False
+        self.hibernation_lock = threading.Lock()
+        self.idle_since = time.monotonic()
 
     def __del__(self):
         try:
@@ -86,6 +103,11 @@ class WebHostContext(Context):
             setattr(self, key, value)
         self.non_hintable_names = collections.defaultdict(frozenset, self.non_hintable_names)
 
+    async def disconnect(self, endpoint):
+        await super(WebHostContext, self).disconnect(endpoint)
+        if not self.endpoints:
+            self.idle_since = time.monotonic()
+
     def listen_to_db_commands(self):
         cmdprocessor = DBCommandProcessor(self)
 
@@ -118,8 +140,11 @@ class WebHostContext(Context):
         self.item_name_groups = {"Archipelago": static_item_name_groups.get("Archipelago", {})}
         self.location_name_groups = {"Archipelago": static_location_name_groups.get("Archipelago", {})}
 
-        for game in list(multidata.get("datapackage", {})):
-            game_data = multidata["datapackage"][game]
+        # only pick the games of this room out of the static data, as it may be lazily loaded, see SharedStaticData
+        games = {slot_info.game for slot_info in multidata["slot_info"].values()}
+        games.update(multidata.get("datapackage", {}))
+        for game in games:
+            game_data = multidata.get("datapackage", {}).get(game, {})
             if "checksum" in game_data:
                 if static_gamespackage.get(game, {}).get("checksum") == game_data["checksum"]:
                     # non-custom. remove from multidata and use static data
@@ -136,38 +161,97 @@ class WebHostContext(Context):
             self.item_name_groups[game] = static_item_name_groups.get(game, {})
             self.location_name_groups[game] = static_location_name_groups.get(game, {})
 
-        if not game_data_packages:
-            # all static -> use the static dicts directly
-            self.gamespackage = static_gamespackage
-            self.item_name_groups = static_item_name_groups
-            self.location_name_groups = static_location_name_groups
         return self._load(multidata, game_data_packages, True)
 
     @db_session
     def init_save(self, enabled: bool = True):
         self.saving = enabled
         if self.saving:
-            savegame_data = Room.get(id=self.room_id).multisave
-            if savegame_data:
-                self.set_save(restricted_loads(Room.get(id=self.room_id).multisave))
+            self._load_save()
             self._start_async_saving(atexit_save=False)
         threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
 
+    @db_session
+    def _load_save(self):
+        savegame_data = Room.get(id=self.room_id).multisave
+        if savegame_data:
+            self.set_save(restricted_loads(savegame_data))
+
     @db_session
     def _save(self, exit_save: bool = False) -> bool:
-        room = Room.get(id=self.room_id)
-        room.multisave = pickle.dumps(self.get_save())
-        # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
-        if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server again
-            room.last_activity = datetime.datetime.utcnow()
+        with self.hibernation_lock:
+            if self.hibernated:
+                return True  # the snapshot taken when hibernating is still current
+            room = Room.get(id=self.room_id)
+            room.multisave = pickle.dumps(self.get_save())
+            # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
+            if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server again
+                room.last_activity = datetime.datetime.utcnow()
+            return True
+
+    def hibernate(self) -> bool:
+        """Write the room to the database and release its game state, while the server keeps listening.
+        Returns False if the room can't hibernate, as it has clients or can't save."""
+        if self.hibernated or self.endpoints or not self.saving:
+            return False
+        self._save(True)
+        with self.hibernation_lock:
+            self.save_dirty = False
+            self.hibernated = True
+            # drop everything _load and set_save filled in, down to the state directly after __init__
+            del self.locations
+            self.slot_data = {}
+            self.read_data = {}
+            self.er_hint_data = {}
+            self.spheres = []
+            self.connect_names = {}
+            self.start_inventory = {}
+            self.received_items = {}
+            self.stored_data = {}
+            self.group_collected = {}
+            self.checksums = {}
+            self.all_item_and_group_names = {}
+            self.all_location_and_group_names = {}
+            for container in (self.location_checks, self.hints, self.hints_used, self.item_names, self.location_names):
+                container.clear()  # keep the default factories
+            self._load_game_data()
+        self.logger.info("Hibernating, as no client has been connected for a while.")
+        queue_gc()
         return True
 
+    def wake(self) -> None:
+        """Restore the game state of a hibernated room from the database."""
+        with self.hibernation_lock:
+            if not self.hibernated:
+                return
+            self.load(self.room_id)
+            self._load_save()
+            self.hibernated = False
+        self.logger.info("Woke up from hibernation.")
+
+    async def hibernate_when_idle(self, hibernate_after: float):
+        while not self.exit_event.is_set():
+            timeout = hibernate_after
+            if not self.hibernated and not self.endpoints:
+                timeout -= time.monotonic() - self.idle_since
+                if timeout <= 0:
+                    self.hibernate()
+                    timeout = hibernate_after
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.exit_event.wait(), timeout)
+
     def get_save(self) -> dict:
         d = super(WebHostContext, self).get_save()
         d["video"] = [(tuple(playerslot), videodata) for playerslot, videodata in self.video.items()]
         return d
 
 
+async def webhost_server(websocket, path: str = "/", ctx: WebHostContext = None):
+    # rehydrate before the RoomInfo is sent
+    ctx.wake()
+    await server(websocket, path, ctx)
+
+
 def get_random_port():
     return random.randint(49152, 65535)
 
@@ -201,6 +285,89 @@ def get_static_server_data() -> dict:
     return data
 
 
+class SharedStaticData(typing.Mapping[str, typing.Any]):
+    """Read-only view of one table of static server data inside a memory mapped file.
+    Entries are unpickled on first access and then shared by all rooms of the process,
+    while the file itself is shared by all hoster processes through the OS page cache."""
+    _buffer: mmap.mmap
+    _start: int
+    _index: typing.Dict[str, typing.Tuple[int, int]]
+    _loaded: typing.Dict[str, typing.Any]
+
+    def __init__(self, buffer: mmap.mmap, start: int, index: typing.Dict[str, typing.Tuple[int, int]]):
+        self._buffer = buffer
+        self._start = start
+        self._index = index
+        self._loaded = {}
+
+    def __getitem__(self, key: str) -> typing.Any:
+        try:
+            return self._loaded[key]
+        except KeyError:
+            offset, length = self._index[key]
+            offset += self._start
+            value = self._loaded[key] = pickle.loads(self._buffer[offset:offset + length])
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+_shared_static_tables = ("gamespackage", "item_name_groups", "location_name_groups")
+"""static server data tables that are split per game in the shared file, the rest is small and loaded in full"""
+
+
+@cache_argsless
+def get_static_server_data_file() -> str:
+    """Write static server data into a file for hoster processes to memory map, see load_static_server_data.
+    Layout: 8 byte little endian header length, pickled header of eager data and entry offsets, pickled entries."""
+    import hashlib
+    import os
+
+    data = get_static_server_data()
+    eager = {key: value for key, value in data.items() if key not in _shared_static_tables}
+    index: typing.Dict[str, typing.Dict[str, typing.Tuple[int, int]]] = {}
+    blobs: typing.List[bytes] = []
+    position = 0
+    for table in _shared_static_tables:
+        index[table] = {}
+        for game, entry in data[table].items():
+            blob = pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+            index[table][game] = position, len(blob)
+            blobs.append(blob)
+            position += len(blob)
+    # offsets are relative to the end of the header
+    header = pickle.dumps((eager, index), pickle.HIGHEST_PROTOCOL)
+    content = len(header).to_bytes(8, "little") + header + b"".join(blobs)
+    # content addressed, so concurrently running WebHosts with differing worlds don't overwrite each other's file
+    path = Utils.cache_path("webhost", f"static_server_data_{hashlib.sha256(content).hexdigest()[:16]}.bin")
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    return path
+
+
+def load_static_server_data(path: str) -> dict:
+    """Memory map a file written by get_static_server_data_file, to be passed into WebHostContext."""
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    header_length = int.from_bytes(buffer[:8], "little")
+    eager, index = pickle.loads(buffer[8:8 + header_length])
+    data = dict(eager)
+    for table, table_index in index.items():
+        data[table] = SharedStaticData(buffer, 8 + header_length, table_index)
+    return data
+
+
 def set_up_logging(room_id) -> logging.Logger:
     import os
     # logger setup
@@ -221,9 +388,10 @@ def set_up_logging(room_id) -> logging.Logger:
     return logger
 
 
-def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
+def run_server_process(name: str, ponyconfig: dict, static_server_data_file: str,
                        cert_file: typing.Optional[str], cert_key_file: typing.Optional[str],
-                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue):
+                       host: str, hibernation_time: typing.Optional[float],
+                       rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue):
     Utils.init_logging(name)
     try:
         import resource
@@ -236,6 +404,8 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
         resource.setrlimit(resource.RLIMIT_NOFILE, (file_limit, file_limit))
         del resource, file_limit
 
+    static_server_data = load_static_server_data(static_server_data_file)
+
     # establish DB connection for multidata and multisave
     db.bind(**ponyconfig)
     db.generate_mapping(check_tables=False)
@@ -260,12 +430,12 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 assert ctx.server is None
                 try:
                     ctx.server = websockets.serve(
-                        functools.partial(server, ctx=ctx), ctx.host, ctx.port, ssl=ssl_context)
+                        functools.partial(webhost_server, ctx=ctx), ctx.host, ctx.port, ssl=ssl_context)
 
                     await ctx.server
                 except OSError:  # likely port in use
                     ctx.server = websockets.serve(
-                        functools.partial(server, ctx=ctx), ctx.host, 0, ssl=ssl_context)
+                        functools.partial(webhost_server, ctx=ctx), ctx.host, 0, ssl=ssl_context)
 
                     await ctx.server
                 port = 0
@@ -289,7 +459,10 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 if ctx.saving:
                     setattr(asyncio.current_task(), "save", lambda: ctx._save(True))
                 assert ctx.shutdown_task is None
-                ctx.shutdown_task = asyncio.create_task(auto_shutdown(ctx, []))
+                to_cancel = []
+                if hibernation_time:
+                    to_cancel.append(asyncio.create_task(ctx.hibernate_when_idle(hibernation_time)))
+                ctx.shutdown_task = asyncio.create_task(auto_shutdown(ctx, to_cancel))
                 await ctx.shutdown_task
 
             except (KeyboardInterrupt, SystemExit):
@@ -1,15 +1,67 @@
+import io
 import json
+import typing
+import unicodedata
+import urllib.parse
 import zipfile
-from io import BytesIO
 
 from flask import send_file, Response, render_template
 from pony.orm import select
 
 from worlds.Files import AutoPatchRegister
 from . import app, cache
+from .blobs import CHUNK_SIZE
 from .models import Slot, Room, Seed
 
 
+class _ChunkCollector(io.RawIOBase):
+    """Unseekable write target, collecting what was written until it is taken out for a streamed response."""
+    def __init__(self):
+        self.chunks: typing.List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _stream_patch(source: typing.BinaryIO, manifest: typing.Dict[str, typing.Any]) -> typing.Iterator[bytes]:
+    # Python's zipfile module cannot overwrite/delete files in a zip, so we recreate the whole thing while sending it
+    output = _ChunkCollector()
+    with source, zipfile.ZipFile(source) as zf:
+        with zipfile.ZipFile(output, "w", compresslevel=9) as new_zip:
+            for file in zf.infolist():
+                if file.filename == "archipelago.json":
+                    new_zip.writestr("archipelago.json", json.dumps(manifest), zipfile.ZIP_STORED)
+                else:
+                    # opened by name, a new entry takes compression and level from the ZipFile
+                    new_zip.compression = file.compress_type
+                    with zf.open(file) as old, new_zip.open(file.filename, "w") as new:
+                        for chunk in iter(lambda: old.read(CHUNK_SIZE), b""):
+                            new.write(chunk)
+                            yield output.take()
+                yield output.take()
+        yield output.take()  # central directory
+
+
+def _attachment(download_name: str) -> typing.Dict[str, str]:
+    """Content-Disposition header for streamed responses, encoded like flask.send_file does."""
+    try:
+        download_name.encode("ascii")
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", download_name).encode("ascii", "ignore").decode("ascii")
+        quoted = urllib.parse.quote(download_name, safe="!#$&+^`|~")
+        return {"Content-Disposition": f"attachment; filename=\"{simple}\"; filename*=UTF-8''{quoted}"}
+    return {"Content-Disposition": f"attachment; filename=\"{download_name}\""}
+
+
 @app.route("/dl_patch/<suuid:room_id>/<int:patch_id>")
 def download_patch(room_id, patch_id):
     patch = Slot.get(id=patch_id)
@@ -18,30 +70,22 @@ def download_patch(room_id, patch_id):
     else:
         room = Room.get(id=room_id)
         last_port = room.last_port
-        filelike = BytesIO(patch.data)
-        greater_than_version_3 = zipfile.is_zipfile(filelike)
+        source = patch.open_data()
+        greater_than_version_3 = zipfile.is_zipfile(source)
         if greater_than_version_3:
-            # Python's zipfile module cannot overwrite/delete files in a zip, so we recreate the whole thing in ram
-            new_file = BytesIO()
-            with zipfile.ZipFile(filelike, "a") as zf:
+            with zipfile.ZipFile(source) as zf:
                 with zf.open("archipelago.json", "r") as f:
                     manifest = json.load(f)
-                manifest["server"] = f"{app.config['HOST_ADDRESS']}:{last_port}" if last_port else None
-                with zipfile.ZipFile(new_file, "w") as new_zip:
-                    for file in zf.infolist():
-                        if file.filename == "archipelago.json":
-                            new_zip.writestr("archipelago.json", json.dumps(manifest))
-                        else:
-                            new_zip.writestr(file.filename, zf.read(file), file.compress_type, 9)
+            manifest["server"] = f"{app.config['HOST_ADDRESS']}:{last_port}" if last_port else None
             if "patch_file_ending" in manifest:
                 patch_file_ending = manifest["patch_file_ending"]
             else:
                 patch_file_ending = AutoPatchRegister.patch_types[patch.game].patch_file_ending
             fname = f"P{patch.player_id}_{patch.player_name}_{app.jinja_env.filters['suuid'](room_id)}" \
                     f"{patch_file_ending}"
-            new_file.seek(0)
-            return send_file(new_file, as_attachment=True, download_name=fname)
+            return Response(_stream_patch(source, manifest), mimetype="application/zip", headers=_attachment(fname))
         else:
+            source.close()
             return "Old Patch file, no longer compatible."
 
 
@@ -59,20 +103,19 @@ def download_slot_file(room_id, player_id: int):
     if not slot_data:
         return "Slot Data not found"
     else:
-        import io
-
+        stream = slot_data.open_data()
         if slot_data.game == "Minecraft":
             from worlds.minecraft import mc_update_output
             fname = f"AP_{app.jinja_env.filters['suuid'](room_id)}_P{slot_data.player_id}_{slot_data.player_name}.apmc"
-            data = mc_update_output(slot_data.data, server=app.config['HOST_ADDRESS'], port=room.last_port)
+            with stream:
+                data = mc_update_output(stream.read(), server=app.config['HOST_ADDRESS'], port=room.last_port)
             return send_file(io.BytesIO(data), as_attachment=True, download_name=fname)
         elif slot_data.game == "Factorio":
-            with zipfile.ZipFile(io.BytesIO(slot_data.data)) as zf:
+            with zipfile.ZipFile(stream) as zf:
                 for name in zf.namelist():
                     if name.endswith("info.json"):
                         fname = name.rsplit("/", 1)[0] + ".zip"
         elif slot_data.game == "Ocarina of Time":
-            stream = io.BytesIO(slot_data.data)
             if zipfile.is_zipfile(stream):
                 with zipfile.ZipFile(stream) as zf:
                     for name in zf.namelist():
@@ -93,8 +136,10 @@ def download_slot_file(room_id, player_id: int):
         elif slot_data.game == "Final Fantasy Mystic Quest":
             fname = f"AP+{app.jinja_env.filters['suuid'](room_id)}_P{slot_data.player_id}_{slot_data.player_name}.apmq"
         else:
+            stream.close()
             return "Game download not supported."
-        return send_file(io.BytesIO(slot_data.data), as_attachment=True, download_name=fname)
+        stream.seek(0)
+        return send_file(stream, as_attachment=True, download_name=fname)
 
 
 @app.route("/templates")
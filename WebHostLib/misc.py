@@ -9,7 +9,7 @@ from werkzeug.utils import secure_filename
 
 from worlds.AutoWorld import AutoWorldRegister
 from . import app, cache
-from .models import Seed, Room, Command, UUID, uuid4
+from .models import Seed, Room, Command, UUID, count_games_played, uuid4
 
 
 def get_world_theme(game_name: str):
@@ -121,7 +121,10 @@ def new_room(seed: UUID):
         abort(404)
     room = Room(seed=seed, owner=session["_id"], tracker=uuid4())
     commit()
-    return redirect(url_for("host_room", room=room.id))
+    room_id = room.id
+    # after the room is committed, so a failure to count can't prevent its creation
+    count_games_played(room.creation_time.date(), (slot.game for slot in seed.slots))
+    return redirect(url_for("host_room", room=room_id))
 
 
 def _read_log(log: IO[Any], offset: int = 0) -> Iterator[bytes]:
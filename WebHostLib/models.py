@@ -1,6 +1,11 @@
-from datetime import datetime
+import logging
+import typing
+from collections import Counter
+from datetime import date, datetime
+from io import BytesIO
 from uuid import UUID, uuid4
-from pony.orm import Database, PrimaryKey, Required, Set, Optional, buffer, LongStr
+from pony.orm import Database, PrimaryKey, Required, Set, Optional, buffer, LongStr, TransactionError, commit, \
+    rollback
 
 db = Database()
 
@@ -13,9 +18,28 @@ class Slot(db.Entity):
     id = PrimaryKey(int, auto=True)
     player_id = Required(int)
     player_name = Required(str)
-    data = Optional(bytes, lazy=True)
+    data = Optional(bytes, lazy=True)  # only used by seeds uploaded before the blob store
     seed = Optional('Seed')
     game = Required(str)
+    blob = Optional('SlotBlob', cascade_delete=True)
+
+    @property
+    def has_data(self) -> bool:
+        return bool(self.blob or self.data)
+
+    def open_data(self) -> typing.BinaryIO:
+        """Open the slot file for reading, which may be stored in the blob store or the database."""
+        if self.blob:
+            from .blobs import open_blob
+            return open_blob(self.blob.digest)
+        return BytesIO(self.data)
+
+
+class SlotBlob(db.Entity):
+    """The file of a Slot in the blob store.
+    A table of its own, so Slot tables of existing databases don't need another column."""
+    slot = PrimaryKey(Slot)
+    digest = Required(str, index=True)
 
 
 class Room(db.Entity):
@@ -61,3 +85,32 @@ class Generation(db.Entity):
 class GameDataPackage(db.Entity):
     checksum = PrimaryKey(str)
     data = Required(bytes)
+
+
+class GamesPlayed(db.Entity):
+    """Slots per game of the rooms created on a day, counted after a Room is created for the stats page."""
+    day = Required(date, index=True)
+    game = Required(str)
+    count = Required(int, default=0)
+    PrimaryKey(day, game)
+
+
+def count_games_played(day: date, games: typing.Iterable[str], attempts: int = 3) -> None:
+    """Add games to the counts of day and commit them, separately from whatever was committed before.
+    A (day, game) row is created by the first count of it, so when two processes create the same row at once,
+    the one that loses retries and finds the row. If that keeps failing, the counts are dropped and logged."""
+    counts = Counter(games)
+    for attempt in range(attempts):
+        try:
+            for game, count in counts.items():
+                games_played = GamesPlayed.get_for_update(day=day, game=game)
+                if games_played:
+                    games_played.count += count
+                else:
+                    GamesPlayed(day=day, game=game, count=count)
+            commit()
+            return
+        except TransactionError as e:
+            rollback()
+            if attempt == attempts - 1:
+                logging.warning(f"Could not count games played on {day}: {e}")
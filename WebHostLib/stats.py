@@ -9,11 +9,12 @@ from bokeh.embed import components
 from bokeh.models import HoverTool
 from bokeh.plotting import figure, ColumnDataSource
 from bokeh.resources import INLINE
+import click
 from flask import render_template
-from pony.orm import select
+from pony.orm import db_session, select
 
 from . import app, cache
-from .models import Room
+from .models import GamesPlayed, Room, count_games_played
 
 PLOT_WIDTH = 600
 
@@ -23,13 +24,28 @@ def get_db_data(known_games: typing.Set[str]) -> typing.Tuple[typing.Counter[str
     games_played = defaultdict(Counter)
     total_games = Counter()
     cutoff = date.today() - timedelta(days=30)
+    played: GamesPlayed
+    for played in select(played for played in GamesPlayed if played.day >= cutoff):
+        if played.game in known_games:
+            total_games[played.game] += played.count
+            games_played[played.day][played.game] += played.count
+    return total_games, games_played
+
+
+@app.cli.command("backfill_stats")
+@click.option("--days", default=30, show_default=True, help="Recount rooms created within this many days.")
+@db_session
+def backfill_stats(days: int) -> None:
+    """Recount GamesPlayed from existing rooms, for rooms created before it was maintained."""
+    cutoff = date.today() - timedelta(days=days)
+    GamesPlayed.select(lambda played: played.day >= cutoff).delete(bulk=True)
+    rooms_per_day: typing.DefaultDict[date, typing.List[str]] = defaultdict(list)
     room: Room
     for room in select(room for room in Room if room.creation_time >= cutoff):
-        for slot in room.seed.slots:
-            if slot.game in known_games:
-                total_games[slot.game] += 1
-                games_played[room.creation_time.date()][slot.game] += 1
-    return total_games, games_played
+        rooms_per_day[room.creation_time.date()].extend(slot.game for slot in room.seed.slots)
+    for day, games in rooms_per_day.items():
+        count_games_played(day, games)
+    click.echo(f"Counted games of rooms created on {len(rooms_per_day)} days.")
 
 
 def get_color_palette(colors_needed: int) -> typing.List[RGB]:
@@ -20,7 +20,8 @@ from worlds import GamesPackage
 from worlds.Files import AutoPatchRegister
 from worlds.AutoWorld import data_package_checksum
 from . import app
-from .models import Seed, Room, Slot, GameDataPackage
+from .blobs import open_blob, store_blob
+from .models import Seed, Room, Slot, SlotBlob, GameDataPackage
 
 banned_extensions = (".sfc", ".z64", ".n64", ".nes", ".smc", ".sms", ".gb", ".gbc", ".gba")
 allowed_options_extensions = (".yaml", ".json", ".yml", ".txt", ".zip")
@@ -48,7 +49,8 @@ def banned_file(filename: str) -> bool:
     return filename.endswith(banned_extensions)
 
 
-def process_multidata(compressed_multidata, files={}):
+def process_multidata(compressed_multidata, files: typing.Dict[int, str] = {}):
+    """files maps slots to the digest of their file in the blob store"""
     game_data: GamesPackage
 
     decompressed_multidata = MultiServer.Context.decompress(compressed_multidata)
@@ -86,10 +88,12 @@ def process_multidata(compressed_multidata, files={}):
             # Ignore Player Groups (e.g. item links)
             if slot_info.type == SlotType.group:
                 continue
-            slots.add(Slot(data=files.get(slot, None),
-                           player_name=slot_info.name,
-                           player_id=slot,
-                           game=slot_info.game))
+            new_slot = Slot(player_name=slot_info.name,
+                            player_id=slot,
+                            game=slot_info.game)
+            if slot in files:
+                SlotBlob(slot=new_slot, digest=files[slot])
+            slots.add(new_slot)
         flush()  # commit slots
 
     compressed_multidata = compressed_multidata[0:1] + zlib.compress(pickle.dumps(decompressed_multidata), 9)
@@ -118,10 +122,12 @@ def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, s
 
         # AP Container
         elif handler:
-            data = zfile.open(file, "r").read()
-            patch = handler(BytesIO(data))
-            patch.read()
-            files[patch.player] = data
+            with zfile.open(file, "r") as stream:
+                digest = store_blob(stream)
+            with open_blob(digest) as stream:
+                patch = handler(stream)
+                patch.read()
+            files[patch.player] = digest
 
         # Spoiler
         elif file.filename.endswith(".txt"):
@@ -139,7 +145,7 @@ def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, s
         elif file.filename.endswith(".apmc"):
             data = zfile.open(file, "r").read()
             metadata = json.loads(base64.b64decode(data).decode("utf-8"))
-            files[metadata["player_id"]] = data
+            files[metadata["player_id"]] = store_blob(BytesIO(data))
 
         # Factorio
         elif file.filename.endswith(".zip"):
@@ -148,8 +154,8 @@ def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, s
             except ValueError:
                 flash("Error: Unexpected file found in .zip: " + file.filename)
                 return
-            data = zfile.open(file, "r").read()
-            files[int(slot_id[1:])] = data
+            with zfile.open(file, "r") as stream:
+                files[int(slot_id[1:])] = store_blob(stream)
 
         # All other files using the standard MultiWorld.get_out_file_name_base method
         else:
@@ -158,8 +164,8 @@ def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, s
             except ValueError:
                 flash("Error: Unexpected file found in .zip: " + file.filename)
                 return
-            data = zfile.open(file, "r").read()
-            files[int(slot_id[1:])] = data
+            with zfile.open(file, "r") as stream:
+                files[int(slot_id[1:])] = store_blob(stream)
 
     # Load multi data.
     if multidata:
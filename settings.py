@@ -662,6 +662,18 @@ class GeneratorOptions(Group):
         start_inventory -> Move remaining items to start_inventory, generate additional filler items to fill locations.
         """
 
+    class OutputProcesses(int):
+        """
+        Number of processes to create output files in, for worlds that support it. Speeds up ROM based games.
+        0 creates all output in the generating process.
+        """
+
+    class ZipCompressionLevel(int):
+        """
+        Compression level of the generated zip, from 1 (fastest) to 9 (smallest). 0 disables compression.
+        Files that are already compressed, like the .archipelago and most patch files, are always stored as is.
+        """
+
     enemizer_path: EnemizerPath = EnemizerPath("EnemizerCLI/EnemizerCLI.Core")  # + ".exe" is implied on Windows
     player_files_path: PlayerFilesPath = PlayerFilesPath("Players")
     players: Players = Players(0)
@@ -671,6 +683,8 @@ class GeneratorOptions(Group):
     race: Race = Race(0)
     plando_options: PlandoOptions = PlandoOptions("bosses, connections, texts")
     panic_method: PanicMethod = PanicMethod("swap")
+    output_processes: OutputProcesses = OutputProcesses(0)
+    zip_compression_level: ZipCompressionLevel = ZipCompressionLevel(9)
 
 
 class SNIOptions(Group):
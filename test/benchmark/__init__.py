@@ -3,5 +3,17 @@ if __name__ == "__main__":
     path_change.change_home()
     import load_worlds
     load_worlds.run_load_worlds_benchmark()
+    load_worlds.run_data_package_cache_benchmark()
     import locations
     locations.run_locations_benchmark()
+    import patching
+    patching.run_patching_benchmark()
+    patching.run_patch_pipeline_benchmark()
+    import bounce
+    bounce.run_bounce_benchmark()
+    import generation
+    generation.run_generation_benchmark()
+    import memory
+    memory.run_memory_benchmark()
+    import oot_rules
+    oot_rules.run_oot_rules_benchmark()
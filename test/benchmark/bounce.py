@@ -0,0 +1,55 @@
+def run_bounce_benchmark():
+    """Resolve the recipients of DeathLink and slot bounces in rooms of 10 to 5000 clients,
+    compared to how every endpoint was checked before."""
+    import logging
+    import random
+
+    from time_it import TimeIt
+
+    from MultiServer import Client, Context
+    from Utils import init_logging
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    def get_bounce_clients_by_scan(ctx: Context, team: int, games: set, tags: set, slots: set) -> set:
+        """How bounce recipients were found before, for comparison."""
+        return {bounceclient for bounceclient in ctx.endpoints
+                if team == bounceclient.team and (ctx.games[bounceclient.slot] in games or
+                                                  set(bounceclient.tags) & tags or
+                                                  bounceclient.slot in slots)}
+
+    rng = random.Random(0)
+    bounces = 5_000
+    ctx = Context("", 0, "", "", 0, 0, False)
+    for room_size in (10, 100, 1000, 5000):
+        ctx.endpoints = []
+        ctx.games = {slot: f"Game {slot % 20}" for slot in range(1, room_size + 1)}
+        ctx.clients = {0: {slot: [] for slot in ctx.games}}
+        ctx.bounce_game_clients.clear()
+        ctx.bounce_tag_clients.clear()
+        for slot in ctx.games:
+            client = Client(None, ctx)
+            client.auth = True
+            client.team = 0
+            client.slot = slot
+            # a share of DeathLink and RingLink players, and trackers, like a large async
+            client.tags = rng.choice((["DeathLink"], ["DeathLink", "RingLink"], [], [], ["Tracker"]))
+            ctx.endpoints.append(client)
+            ctx.clients[0][slot].append(client)
+            ctx.update_bounce_index(client)
+
+        requests = [({"Game 1"}, set(), set()) if n % 10 == 0 else
+                    (set(), set(), {rng.randrange(1, room_size + 1)}) if n % 10 == 1 else
+                    (set(), {"DeathLink"}, set()) for n in range(bounces)]
+        with TimeIt(f"{room_size} clients, {bounces} bounces by scanning endpoints", logger):
+            expected = [get_bounce_clients_by_scan(ctx, 0, *request) for request in requests]
+        with TimeIt(f"{room_size} clients, {bounces} bounces by index", logger):
+            result = [ctx.get_bounce_clients(0, *request) for request in requests]
+        assert result == expected, "Bounce index resolved different recipients."
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_bounce_benchmark()
@@ -0,0 +1,209 @@
+"""Complete generations of fixed seeds for a set of game mixes, timed per stage,
+to judge changes to fill, CollectionState or world logic by numbers.
+
+Every mix is generated in its own process, so peak RSS is that of the mix alone.
+Results are compared to the baseline file if it exists, and can be saved as the new baseline with --save_baseline.
+Baselines depend on the machine, so compare runs on the same one."""
+import os
+import typing
+
+# games for the mixes below, light ones generate quickly, heavy ones have expensive logic.
+# Hollow Knight is left out, as filling it takes longer than the rest of a mix together.
+light_games = ("Clique", "Timespinner", "Super Mario 64", "Risk of Rain 2", "A Link to the Past", "VVVVVV")
+heavy_games = ("Ocarina of Time", "Stardew Valley", "The Witness", "A Link to the Past")
+linked_item_pools = {
+    "Timespinner": ["Orb Melee", "Orb Spell", "Relic"],
+    "Super Mario 64": ["Everything"],
+    "Risk of Rain 2": ["Everything"],
+}
+
+
+def _players(games: typing.Sequence[str], count: int, item_links: bool = False
+             ) -> typing.List[typing.Dict[str, typing.Any]]:
+    """count players cycling through games, linking the linked_item_pools of their game if item_links is set."""
+    players = []
+    for n in range(count):
+        game = games[n % len(games)]
+        options = {"item_links": [{"name": f"{game} Link", "item_pool": linked_item_pools[game],
+                                   "replacement_item": None}]} if item_links else {}
+        players.append({"game": game, "options": options})
+    return players
+
+
+# name: (seed, players), where each player is a game and its options
+mixes: typing.Dict[str, typing.Tuple[int, typing.List[typing.Dict[str, typing.Any]]]] = {
+    "single": (1, _players(("A Link to the Past",), 1)),
+    "10 players": (10, _players(light_games, 10)),
+    "50 players": (50, _players(light_games, 50)),
+    "200 players": (200, _players(light_games, 200)),
+    "heavy logic": (4, _players(heavy_games, 8)),
+    "item links": (16, _players(tuple(linked_item_pools), 12, item_links=True)),
+}
+
+default_baseline_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generation_baseline.json")
+
+
+def _get_peak_rss() -> typing.Optional[int]:
+    try:
+        import resource
+        import sys
+        # bytes on macOS, KiB elsewhere
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset
+        except (ImportError, AttributeError):
+            return None
+
+
+def _generate_mix(seed: int, players: typing.List[typing.Dict[str, typing.Any]]) -> typing.Dict[str, typing.Any]:
+    """Generate a mix in this process without output, then calculate its playthrough,
+    returning the time per stage and peak RSS."""
+    import json
+    import logging
+    import sys
+    import tempfile
+    import time
+    import warnings
+
+    warnings.simplefilter("ignore")
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as players_dir:
+        for n, player in enumerate(players, 1):
+            with open(os.path.join(players_dir, f"{n}.yaml"), "w", encoding="utf-8") as f:
+                f.write(json.dumps({"name": f"Player{n}", "game": player["game"], player["game"]: player["options"],
+                                    "description": f"Generation benchmark slot {n}"}))
+
+        import Generate
+        import Main
+        from Tracing import GenerationTrace, span
+
+        sys.argv = [sys.argv[0], "--seed", str(seed), "--player_files_path", players_dir, "--skip_output"]
+        trace = GenerationTrace()
+        start = time.perf_counter()
+        with trace.activate():
+            with span("roll"):
+                args, seed = Generate.main()
+            multiworld = Main.main(args, seed)
+            with span("spoiler"):
+                # paths take minutes with many players and only trace back the playthrough, so leave them out
+                multiworld.spoiler.create_playthrough(create_paths=False)
+        total = time.perf_counter() - start
+
+    stages: typing.Dict[str, float] = {}
+    for event in trace.events:
+        if event.category == "stage":
+            stages[event.name] = stages.get(event.name, 0.) + event.duration
+    return {"stages": stages, "total": total, "peak_rss": _get_peak_rss()}
+
+
+def _format_result(name: str, result: typing.Dict[str, typing.Any],
+                   baseline: typing.Optional[typing.Dict[str, typing.Any]]) -> typing.List[str]:
+    def compare(value: float, base: typing.Optional[float]) -> str:
+        if base is None:
+            return f"{value:10.3f}"
+        return f"{value:10.3f} {value - base:+9.3f} ({(value / base - 1) * 100 if base else 0:+6.1f}%)"
+
+    base_stages = baseline["stages"] if baseline else {}
+    lines = [f"{name}:"]
+    for stage, value in result["stages"].items():
+        lines.append(f"  {stage:<24} {compare(value, base_stages.get(stage))}")
+    lines.append(f"  {'total':<24} {compare(result['total'], baseline['total'] if baseline else None)}")
+    if result["peak_rss"]:
+        base_rss = baseline.get("peak_rss") if baseline else None
+        rss = compare(result["peak_rss"] / 1024 / 1024, base_rss / 1024 / 1024 if base_rss else None)
+        lines.append(f"  {'peak RSS (MiB)':<24} {rss}")
+    return lines
+
+
+def find_regressions(results: typing.Dict[str, typing.Dict[str, typing.Any]],
+                     baseline: typing.Dict[str, typing.Dict[str, typing.Any]],
+                     threshold: float = .1, min_seconds: float = .05) -> typing.List[str]:
+    """Stages, totals and peak RSS that are more than threshold worse than in the baseline.
+    Stages are only counted if they got slower by at least min_seconds, to ignore noise of short stages."""
+    regressions: typing.List[str] = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        timings = [*((stage, value, base["stages"].get(stage)) for stage, value in result["stages"].items()),
+                   ("total", result["total"], base["total"])]
+        for stage, value, base_value in timings:
+            if base_value is not None and value > base_value * (1 + threshold) and value - base_value >= min_seconds:
+                regressions.append(f"{name} {stage}: {base_value:.3f}s -> {value:.3f}s")
+        if result["peak_rss"] and base.get("peak_rss") and result["peak_rss"] > base["peak_rss"] * (1 + threshold):
+            regressions.append(f"{name} peak RSS: {base['peak_rss'] / 1024 / 1024:.1f} MiB -> "
+                               f"{result['peak_rss'] / 1024 / 1024:.1f} MiB")
+    return regressions
+
+
+def run_generation_benchmark(mix_names: typing.Optional[typing.Iterable[str]] = None,
+                             baseline_path: str = default_baseline_path, save_baseline: bool = False,
+                             threshold: float = .1, repeat: int = 1) -> bool:
+    """Generate each mix repeat times, keeping the fastest of each stage, and compare to the baseline at baseline_path.
+    Returns False if anything regressed by more than threshold."""
+    import concurrent.futures
+    import json
+    import logging
+    import multiprocessing
+
+    from Utils import init_logging
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    baseline: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        logger.info(f"Comparing to baseline {baseline_path}")
+
+    results: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    for name in mix_names or mixes:
+        seed, players = mixes[name]
+        runs = []
+        for _ in range(repeat):
+            # a fresh process for every run, so worlds' caches and peak RSS don't carry over
+            with concurrent.futures.ProcessPoolExecutor(1, multiprocessing.get_context("spawn")) as pool:
+                runs.append(pool.submit(_generate_mix, seed, players).result())
+        result = {
+            "players": len(players),
+            "seed": seed,
+            "stages": {stage: min(run["stages"].get(stage, 0.) for run in runs) for stage in runs[0]["stages"]},
+            "total": min(run["total"] for run in runs),
+            "peak_rss": min((run["peak_rss"] for run in runs if run["peak_rss"]), default=None),
+        }
+        results[name] = result
+        logger.info("\n".join(_format_result(name, result, baseline.get(name))))
+
+    regressions = find_regressions(results, baseline, threshold)
+    for regression in regressions:
+        logger.warning(f"Regression: {regression}")
+    if baseline and not regressions:
+        logger.info(f"No regressions above {threshold * 100:.0f}%.")
+    if save_baseline:
+        with open(baseline_path, "w") as f:
+            json.dump({**baseline, **results}, f, indent=2)
+        logger.info(f"Saved baseline to {baseline_path}")
+    return not regressions
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time complete generations of fixed game mixes.")
+    parser.add_argument("mixes", nargs="*", help=f"mixes to generate, all if none are given, from {list(mixes)}")
+    parser.add_argument("--baseline", default=default_baseline_path, help="JSON file to compare to")
+    parser.add_argument("--save_baseline", action="store_true", help="save the results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=.1, help="slowdown to report as regression, .1 is 10%%")
+    parser.add_argument("--repeat", type=int, default=1, help="generate every mix this often, keeping the fastest")
+    args = parser.parse_args()
+    unknown_mixes = set(args.mixes) - set(mixes)
+    if unknown_mixes:
+        parser.error(f"unknown mixes {sorted(unknown_mixes)}")
+
+    from path_change import change_home
+    change_home()
+    exit(0 if run_generation_benchmark(args.mixes, args.baseline, args.save_baseline, args.threshold, args.repeat)
+         else 1)
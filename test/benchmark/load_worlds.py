@@ -21,7 +21,56 @@ def run_load_worlds_benchmark():
         logger.info(f"{module} took {module.time_taken:.4f} seconds.")
 
 
+def run_data_package_cache_benchmark():
+    """Compare building the data packages of all worlds to checking and reading them from the data package cache,
+    as lazy starts of the generator do."""
+    import logging
+    import time
+
+    from Utils import init_logging
+    from worlds import get_core_key, read_data_package_cache, world_sources, write_data_package_cache
+    from worlds.AutoWorld import AutoWorldRegister
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    sources_by_module = {world_source.module_name: world_source for world_source in world_sources}
+    packages = {}
+    start = time.perf_counter()
+    for game, world_type in AutoWorldRegister.world_types.items():
+        packages[game] = world_type.get_data_package_data()
+    build_time = time.perf_counter() - start
+
+    sources = {}
+    for game, world_type in AutoWorldRegister.world_types.items():
+        world_source = sources_by_module.get(".".join(world_type.__module__.split(".", 2)[:2]))
+        if world_source:
+            source = sources.setdefault(world_source.resolved_path, {"key": world_source.cache_key, "games": {}})
+            source["games"][game] = packages[game]
+    write_data_package_cache(sources)
+
+    # start over from checking the files, as a new start would
+    get_core_key.cache_clear()
+    for world_source in world_sources:
+        vars(world_source).pop("mtime", None)
+        vars(world_source).pop("cache_key", None)
+    start = time.perf_counter()
+    cached_sources = read_data_package_cache()
+    cached_games = 0
+    for world_source in world_sources:
+        cached_source = cached_sources.get(world_source.resolved_path)
+        if cached_source and cached_source["key"] == world_source.cache_key:
+            cached_games += len(cached_source["games"])
+    read_time = time.perf_counter() - start
+
+    logger.info(f"Building {len(packages)} data packages took {build_time:.4f} seconds.")
+    logger.info(f"Checking and reading {cached_games} cached data packages took {read_time:.4f} seconds.")
+    if read_time:
+        logger.info(f"Saved {build_time - read_time:.4f} seconds ({build_time / read_time:.1f}x).")
+
+
 if __name__ == "__main__":
     from path_change import change_home
     change_home()
     run_load_worlds_benchmark()
+    run_data_package_cache_benchmark()
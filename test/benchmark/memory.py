@@ -0,0 +1,101 @@
+def run_memory_benchmark():
+    """Bytes per Location and Entrance compared to keeping the same attributes in a __dict__,
+    and traced bytes per location of every world with default options, set up like test_memory does."""
+    import gc
+    import logging
+    import tracemalloc
+
+    from Utils import init_logging
+    from BaseClasses import Entrance, Location, LocationProgressType
+    from worlds import AutoWorld
+    from test.general import setup_solo_multiworld
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class DictLocation:
+        """How Location was laid out before, for comparison."""
+        game = "Generic"
+        locked = False
+        show_in_spoiler = True
+        progress_type = LocationProgressType.DEFAULT
+        always_allow = staticmethod(lambda state, item: False)
+        access_rule = staticmethod(lambda state: True)
+        item_rule = staticmethod(lambda item: True)
+        _item = None
+
+        def __init__(self, player, name="", address=None, parent=None):
+            self.player = player
+            self.name = name
+            self.address = address
+            self.parent_region = parent
+
+    class DictEntrance:
+        """How Entrance was laid out before, for comparison."""
+        access_rule = staticmethod(lambda state: True)
+        hide_path = False
+        connected_region = None
+        addresses = None
+        target = None
+
+        def __init__(self, player, name="", parent=None):
+            self.name = name
+            self.parent_region = parent
+            self.player = player
+
+    class WorldLocation(Location):
+        """A world's Location subclass that doesn't declare __slots__, like most worlds."""
+        game = "Benchmark"
+
+    def traced_bytes_per_object(create, count: int = 100_000) -> float:
+        gc.collect()
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        objects = [create(n) for n in range(count)]
+        size = tracemalloc.get_traced_memory()[0] - start
+        tracemalloc.stop()
+        del objects
+        return size / count
+
+    def rule(state) -> bool:
+        return True
+
+    def with_rule(location):
+        # worlds set at least a rule on most of their locations and entrances
+        location.access_rule = rule
+        return location
+
+    names = [f"Location {n}" for n in range(100_000)]  # created up front, so they aren't counted
+    for name, create in (
+            ("Location with __dict__ (before)", lambda n: with_rule(DictLocation(1, names[n], n))),
+            ("Location", lambda n: with_rule(Location(1, names[n], n))),
+            ("Location subclass without __slots__", lambda n: with_rule(WorldLocation(1, names[n], n))),
+            ("Entrance with __dict__ (before)", lambda n: with_rule(DictEntrance(1, names[n]))),
+            ("Entrance", lambda n: with_rule(Entrance(1, names[n]))),
+    ):
+        logger.info(f"{traced_bytes_per_object(create):8.1f} bytes per {name}")
+
+    for game, world_type in sorted(AutoWorld.AutoWorldRegister.world_types.items()):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            multiworld = setup_solo_multiworld(world_type)
+        except Exception as e:
+            tracemalloc.stop()
+            logger.info(f"{game} could not be set up: {e!r}")
+            continue
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        locations = len(multiworld.get_locations())
+        slotted = "slotted" if not hasattr(next(iter(multiworld.get_locations()), Location(1)), "__dict__") \
+            else "with __dict__"
+        if locations:
+            logger.info(f"{game}: {locations} locations {slotted}, {size / locations:10.1f} bytes of the multiworld "
+                        f"per location, {len(multiworld.regions)} regions")
+        del multiworld
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_memory_benchmark()
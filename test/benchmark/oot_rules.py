@@ -0,0 +1,80 @@
+"""Time taken by Ocarina of Time's create_regions and set_rules, where its logic is parsed, for growing player counts.
+
+Parsed rules are shared between the OoT worlds of a process, so every count is run in a fresh process,
+once as generation does and once with the shared rules cleared before every world, as if each parsed its own."""
+import typing
+
+player_counts = (1, 10, 50)
+# cycled through for the players, so not every world reads the same settings
+option_sets: typing.Tuple[typing.Dict[str, typing.Any], ...] = (
+    {},
+    {"starting_age": "adult", "bridge": "open"},
+    {"shopsanity": "fixed_number", "shuffle_scrubs": "low"},
+)
+
+
+def _time_oot_rules(players: int, share_rules: bool) -> typing.Tuple[float, float]:
+    """Seconds taken by create_regions and set_rules of players OoT worlds."""
+    import argparse
+    import logging
+    import time
+
+    from BaseClasses import CollectionState, MultiWorld
+    from worlds import AutoWorld
+    from worlds.AutoWorld import call_all, call_single, call_stage
+    from worlds.oot import RuleParser
+
+    logging.disable(logging.WARNING)
+    world_type = AutoWorld.AutoWorldRegister.world_types["Ocarina of Time"]
+    multiworld = MultiWorld(players)
+    multiworld.game = {player: world_type.game for player in multiworld.player_ids}
+    multiworld.player_name = {player: f"Player{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(players)
+    args = argparse.Namespace()
+    for name, option in world_type.options_dataclass.type_hints.items():
+        setattr(args, name, {player: option.from_any(option_sets[(player - 1) % len(option_sets)].get(name,
+                                                                                                       option.default))
+                             for player in multiworld.player_ids})
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+    call_all(multiworld, "generate_early")
+
+    def time_step(step: str) -> float:
+        start = time.perf_counter()
+        for player in multiworld.player_ids:
+            if not share_rules:
+                RuleParser.parsed_rules.clear()
+                RuleParser.compiled_rules.clear()
+            call_single(multiworld, step, player)
+        call_stage(multiworld, step)
+        return time.perf_counter() - start
+
+    create_regions = time_step("create_regions")
+    call_all(multiworld, "create_items")
+    return create_regions, time_step("set_rules")
+
+
+def run_oot_rules_benchmark(counts: typing.Iterable[int] = player_counts) -> None:
+    import concurrent.futures
+    import logging
+    import multiprocessing
+
+    from Utils import init_logging
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    for players in counts:
+        for share_rules in (False, True):
+            # a fresh process for every run, so no rules are left over from the one before
+            with concurrent.futures.ProcessPoolExecutor(1, multiprocessing.get_context("spawn")) as pool:
+                create_regions, set_rules = pool.submit(_time_oot_rules, players, share_rules).result()
+            logger.info(f"{players:3} OoT players, {'shared' if share_rules else 'separate'} rules: "
+                        f"create_regions {create_regions:7.3f}s, set_rules {set_rules:6.3f}s, "
+                        f"{(create_regions + set_rules) / players:6.3f}s per player")
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_oot_rules_benchmark()
@@ -0,0 +1,161 @@
+def run_patching_benchmark():
+    """Apply a large token file to ROMs of 4 to 64 MB, compared to how tokens were applied before,
+    and calculate their SNES checksum with and without NumPy."""
+    import logging
+    import random
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    import worlds.Files
+    from worlds.Files import APPatchExtension, APTokenMixin, APTokenTypes
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class TokenPatch(APTokenMixin):
+        def __init__(self) -> None:
+            self.files = {}
+
+        def get_file(self, file: str) -> bytes:
+            return self.files[file]
+
+    def apply_tokens_one_by_one(rom: bytes, token_data: bytes) -> bytes:
+        """How tokens were applied before, for comparison."""
+        rom_data = bytearray(rom)
+        token_count = int.from_bytes(token_data[0:4], "little")
+        bpr = 4
+        for _ in range(token_count):
+            token_type = token_data[bpr:bpr + 1][0]
+            offset = int.from_bytes(token_data[bpr + 1:bpr + 5], "little")
+            size = int.from_bytes(token_data[bpr + 5:bpr + 9], "little")
+            data = token_data[bpr + 9:bpr + 9 + size]
+            if token_type in [APTokenTypes.AND_8, APTokenTypes.OR_8, APTokenTypes.XOR_8]:
+                if token_type == APTokenTypes.AND_8:
+                    rom_data[offset] = rom_data[offset] & data[0]
+                elif token_type == APTokenTypes.OR_8:
+                    rom_data[offset] = rom_data[offset] | data[0]
+                else:
+                    rom_data[offset] = rom_data[offset] ^ data[0]
+            elif token_type in [APTokenTypes.COPY, APTokenTypes.RLE]:
+                length = int.from_bytes(data[:4], "little")
+                value = int.from_bytes(data[4:], "little")
+                if token_type == APTokenTypes.COPY:
+                    rom_data[offset: offset + length] = rom_data[value: value + length]
+                else:
+                    rom_data[offset: offset + length] = bytes([value] * length)
+            else:
+                rom_data[offset:offset + len(data)] = data
+            bpr += 9 + size
+        return bytes(rom_data)
+
+    rng = random.Random(0)
+    token_count = 500_000
+    numpy_import = worlds.Files._import_numpy
+    APPatchExtension.calc_snes_crc(None, bytes(0x8000))  # get NumPy imported
+    for size in (4, 16, 64):
+        rom_size = size * 1024 * 1024
+        rom = rng.randbytes(rom_size)
+        patch = TokenPatch()
+        for _ in range(token_count // 100):
+            # tokens tend to come in runs of one kind, like writing a table or flipping flags
+            token_type = rng.choice(list(APTokenTypes))
+            start = rng.randrange(rom_size - 0x10000)
+            for offset in range(start, start + 100 * 0x100, 0x100):
+                if token_type == APTokenTypes.WRITE:
+                    patch.write_token(token_type, offset, rng.randbytes(rng.randrange(1, 16)))
+                elif token_type == APTokenTypes.COPY:
+                    patch.write_token(token_type, offset, (rng.randrange(1, 64), rng.randrange(rom_size - 64)))
+                elif token_type == APTokenTypes.RLE:
+                    patch.write_token(token_type, offset, (rng.randrange(1, 64), rng.randrange(0x100)))
+                else:
+                    patch.write_token(token_type, offset, rng.randrange(0x100))
+        token_data = patch.get_token_binary()
+        patch.files["token_data.bin"] = token_data
+
+        with TimeIt(f"{size} MB, {token_count} tokens applied one by one", logger):
+            expected = apply_tokens_one_by_one(rom, token_data)
+        with TimeIt(f"{size} MB, {token_count} tokens applied", logger):
+            result = APPatchExtension.apply_tokens(patch, rom, "token_data.bin")
+        assert result == expected, "Applying tokens gave a different result."
+
+        for numpy in (False, True):
+            if not numpy:
+                worlds.Files._import_numpy = lambda: None
+            try:
+                with TimeIt(f"{size} MB SNES checksum {'with' if numpy else 'without'} NumPy", logger):
+                    APPatchExtension.calc_snes_crc(patch, rom)
+            finally:
+                worlds.Files._import_numpy = numpy_import
+
+
+def run_patch_pipeline_benchmark():
+    """Compare peak memory of APProcedurePatch.patch with a mapped base and in place steps,
+    to keeping the base in memory and copying the rom for each step."""
+    import hashlib
+    import logging
+    import os
+    import random
+    import tempfile
+    import tracemalloc
+
+    from time_it import TimeIt
+
+    from Utils import cache_path, init_logging
+    from worlds.Files import APPatchExtension, APProcedurePatch, APTokenMixin, APTokenTypes
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    rom_size = 64 * 1024 * 1024
+
+    class BenchmarkProcedurePatch(APProcedurePatch, APTokenMixin):
+        game = "Benchmark Patch Pipeline"
+        hash = hashlib.md5(random.Random(0).randbytes(rom_size)).hexdigest()
+        patch_file_ending = ".apbenchmarkpipeline"
+        procedure = [
+            ("apply_tokens", ["token_data.bin"]),
+            ("calc_snes_crc", []),
+        ]
+
+        @classmethod
+        def get_source_data(cls) -> bytes:
+            return random.Random(0).randbytes(rom_size)
+
+    cache_backup = getattr(cache_path, "cached_path", None)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_path.cached_path = temp_dir
+        try:
+            patch = BenchmarkProcedurePatch(os.path.join(temp_dir, "benchmark.apbenchmarkpipeline"), 1, "Player")
+            rng = random.Random(0)
+            for _ in range(100_000):
+                patch.write_token(APTokenTypes.WRITE, rng.randrange(rom_size - 16), rng.randbytes(16))
+            patch.write_file("token_data.bin", patch.get_token_binary())
+            patch.write()
+            BenchmarkProcedurePatch.get_source_buffer().close()  # have the cache file created, like a second run
+
+            tracemalloc.start()
+            with TimeIt("64 MB copying the rom for each step", logger):
+                data = BenchmarkProcedurePatch.get_source_data_with_cache()
+                data = APPatchExtension.apply_tokens(patch, data, "token_data.bin")
+                data = APPatchExtension.calc_snes_crc(patch, data)
+            del data
+            del BenchmarkProcedurePatch.source_data
+            logger.info(f"Peak memory: {tracemalloc.get_traced_memory()[1] / 1024 / 1024:.1f} MiB")
+            tracemalloc.reset_peak()
+            with TimeIt("64 MB patching from the mapped base in place", logger):
+                BenchmarkProcedurePatch(patch.path).patch(os.path.join(temp_dir, "benchmark.sfc"))
+            logger.info(f"Peak memory: {tracemalloc.get_traced_memory()[1] / 1024 / 1024:.1f} MiB")
+            tracemalloc.stop()
+        finally:
+            if cache_backup is None:
+                del cache_path.cached_path
+            else:
+                cache_path.cached_path = cache_backup
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_patching_benchmark()
+    run_patch_pipeline_benchmark()
@@ -1,10 +1,11 @@
+import copy
 from typing import List, Iterable
 import unittest
 
 from Options import Accessibility
 from test.general import generate_items, generate_locations, generate_test_multiworld
 from Fill import FillError, balance_multiworld_progression, fill_restrictive, \
-    distribute_early_items, distribute_items_restrictive
+    distribute_early_items, distribute_items_restrictive, swap_location_item
 from BaseClasses import Entrance, LocationProgressType, MultiWorld, Region, Item, Location, \
     ItemClassification
 from worlds.generic.Rules import CollectionRule, add_item_rule, locality_rules, set_rule
@@ -698,6 +699,35 @@ class TestDistributeItemsRestrictive(unittest.TestCase):
             self.assertEqual(item.player, item.location.player)
             self.assertFalse(item.location.advancement, False)
 
+    def test_locality_table(self) -> None:
+        """Test that the locality table agrees with the item rules set up by locality_rules"""
+        multiworld = generate_test_multiworld(3)
+        players = [generate_player_data(multiworld, player, location_count=5, basic_item_count=5)
+                   for player in multiworld.player_ids]
+        multiworld.worlds[1].options.local_items.value = set(names(players[0].basic_items[:2]))
+        multiworld.worlds[2].options.non_local_items.value = set(names(players[1].basic_items[1:4]))
+        custom_location = players[2].locations[0]
+        custom_location.item_rule = lambda item: item.player != 1
+        locality_rules(multiworld)
+
+        locality = multiworld.locality
+        self.assertIsNotNone(locality)
+        for location in multiworld.get_locations():
+            for item in multiworld.itempool:
+                self.assertEqual(location.item_rule(item),
+                                 locality.allows(location.player, item) and
+                                 (location is not custom_location or item.player != 1))
+                if location.item_rule in locality.locality_only_rules:
+                    self.assertEqual(location.item_rule(item), location.player not in locality.blocked_players(item))
+        self.assertNotIn(custom_location.item_rule, locality.locality_only_rules)
+        self.assertEqual(locality.blocked_players(players[0].basic_items[0]), {2, 3})
+        self.assertEqual(locality.blocked_players(players[1].basic_items[1]), {2})
+        self.assertEqual(locality.blocked_players(players[2].basic_items[0]), set())
+
+        distribute_items_restrictive(multiworld)
+        for item in multiworld.get_items():
+            self.assertTrue(item.location.item_rule(item))
+
     def test_early_items(self) -> None:
         """Test that the early items API successfully places items early"""
         mw = generate_test_multiworld(2)
@@ -858,3 +888,123 @@ class TestBalanceMultiworldProgression(unittest.TestCase):
 
         self.assertRegionContains(
             self.player1.regions[2], self.player2.prog_items[0])
+
+
+class TestFilledLocations(unittest.TestCase):
+    def test_fill_state_is_tracked(self) -> None:
+        """Test that filled, unfilled and advancement locations follow placements, swaps and removals"""
+        multiworld = generate_test_multiworld(2)
+        player1 = generate_player_data(multiworld, 1, 3, 1, 1)
+        player2 = generate_player_data(multiworld, 2, 1)
+        loc0, loc1, loc2 = player1.locations
+        self.assertEqual(multiworld.get_unfilled_locations(1), [loc0, loc1, loc2])
+        self.assertEqual(multiworld.get_filled_locations(), [])
+
+        loc1.item = player1.basic_items[0]
+        multiworld.push_item(loc0, player1.prog_items[0], False)
+        self.assertEqual(multiworld.get_unfilled_locations(1), [loc2])
+        self.assertEqual(multiworld.get_filled_locations(1), [loc0, loc1])
+        self.assertEqual(multiworld.get_advancement_locations(), [loc0])
+
+        swap_location_item(loc0, loc1)
+        self.assertEqual(multiworld.get_advancement_locations(1), [loc1])
+
+        loc0.item = None
+        self.assertEqual(multiworld.get_filled_locations(), [loc1])
+        self.assertEqual(multiworld.get_unfilled_locations(), [loc0, loc2, player2.locations[0]])
+
+        player1.menu.locations.remove(loc1)
+        self.assertEqual(multiworld.get_filled_locations(), [])
+        self.assertEqual(multiworld.get_advancement_locations(), [])
+        loc1.item = None
+        self.assertEqual(multiworld.get_unfilled_locations(1), [loc0, loc2])
+
+        unregistered = Location(1, "unregistered", None, player1.menu)
+        unregistered.item = player1.prog_items[0]
+        self.assertEqual(multiworld.get_filled_locations(), [])
+        player1.menu.locations.append(unregistered)
+        self.assertEqual(multiworld.get_advancement_locations(), [unregistered])
+
+        copied = copy.copy(unregistered)
+        copied.item = None
+        self.assertEqual(multiworld.get_filled_locations(), [unregistered])
+
+    def test_fill_state_keeps_registration_order(self) -> None:
+        """Test that filled and unfilled locations are in the order of get_locations, however they were filled"""
+        multiworld = generate_test_multiworld()
+        player1 = generate_player_data(multiworld, 1, 16, 0, 16)
+        for location, item in zip(reversed(player1.locations), player1.basic_items):
+            location.item = item
+            filled = [location for location in multiworld.get_locations() if location.item]
+            self.assertEqual(multiworld.get_filled_locations(), filled)
+            self.assertEqual(multiworld.get_unfilled_locations(), [location for location in multiworld.get_locations()
+                                                                   if not location.item])
+        for location in player1.locations[::3]:
+            location.item = None
+        self.assertEqual(multiworld.get_unfilled_locations(1), player1.locations[::3])
+
+    def test_classification_changes_after_placement(self) -> None:
+        """Test that advancement locations follow classifications that worlds change after placing items"""
+        multiworld = generate_test_multiworld()
+        player1 = generate_player_data(multiworld, 1, 2, 1, 1)
+        loc0, loc1 = player1.locations
+        multiworld.push_item(loc0, player1.prog_items[0], False)
+        multiworld.push_item(loc1, player1.basic_items[0], False)
+
+        loc0.item.classification = ItemClassification.filler
+        loc1.item.classification = ItemClassification.progression
+        self.assertEqual(multiworld.get_advancement_locations(), [loc1])
+
+    def test_item_locations_are_tracked(self) -> None:
+        """Test that items can be found by name after placements, swaps and removals"""
+        multiworld = generate_test_multiworld(2)
+        player1 = generate_player_data(multiworld, 1, 2, 1, 1)
+        player2 = generate_player_data(multiworld, 2, 1)
+        prog_item, basic_item = player1.prog_items[0], player1.basic_items[0]
+        loc0, loc1 = player1.locations
+
+        multiworld.push_item(loc0, prog_item, False)
+        multiworld.push_item(player2.locations[0], basic_item, False)
+        self.assertIs(multiworld.find_item(prog_item.name, 1), loc0)
+        self.assertCountEqual(multiworld.find_items_in_locations({prog_item.name, basic_item.name}, 1),
+                              [loc0, player2.locations[0]])
+        self.assertEqual(multiworld.find_item_locations(prog_item.name, 2), [])
+
+        swap_location_item(loc0, player2.locations[0])
+        self.assertEqual(multiworld.find_item_locations(prog_item.name, 1), [player2.locations[0]])
+        self.assertEqual(multiworld.find_item_locations(basic_item.name, 1), [loc0])
+
+        player1.menu.locations.remove(loc0)
+        self.assertEqual(multiworld.find_item_locations(basic_item.name, 1), [])
+        with self.assertRaises(StopIteration):
+            multiworld.find_item(basic_item.name, 1)
+
+    def test_item_locations_keep_location_order(self) -> None:
+        """Test that found items are in the order of get_locations, not in the order they were placed"""
+        multiworld = generate_test_multiworld(2)
+        player1 = generate_player_data(multiworld, 1, 3, 0, 3)
+        player2 = generate_player_data(multiworld, 2, 1, 0, 1)
+        items = player1.basic_items
+        for item in items:
+            item.name = "Item"
+        multiworld.push_item(player2.locations[0], player2.basic_items[0], False)
+        for location, item in zip(reversed(player1.locations), items):
+            multiworld.push_item(location, item, False)
+        player2.basic_items[0].player = 1
+        player2.basic_items[0].name = "Item"
+
+        self.assertIs(multiworld.find_item("Item", 1), player1.locations[0])
+        self.assertEqual(multiworld.find_item_locations("Item", 1), [*player1.locations, player2.locations[0]])
+
+    def test_item_locations_follow_renames(self) -> None:
+        """Test that placed items are found by their new name, as some worlds rename them after placement"""
+        multiworld = generate_test_multiworld()
+        player1 = generate_player_data(multiworld, 1, 1, 1)
+        item = player1.prog_items[0]
+        multiworld.push_item(player1.locations[0], item, False)
+        old_name = item.name
+
+        item.name = "Victory"
+        self.assertIs(multiworld.find_item("Victory", 1), player1.locations[0])
+        self.assertEqual(multiworld.find_item_locations(old_name, 1), [])
+        self.assertEqual(multiworld.get_filled_locations(), player1.locations)
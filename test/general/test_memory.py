@@ -14,3 +14,44 @@ class TestWorldMemory(unittest.TestCase):
                 weak = weakref.ref(setup_solo_multiworld(world_type))
                 gc.collect()
                 self.assertFalse(weak(), "World leaked a reference")
+
+
+class TestSlottedClasses(unittest.TestCase):
+    def test_slot_defaults(self):
+        """Tests that slotted attributes get their defaults, which subclasses can override with class attributes."""
+        from BaseClasses import Entrance, Location
+
+        class OverridingLocation(Location):
+            locked = True
+
+            def access_rule(self, state) -> bool:
+                return False
+
+        location = Location(1, "Location")
+        self.assertFalse(location.locked)
+        self.assertIsNone(location.item)
+        self.assertTrue(location.access_rule(None))
+        self.assertIs(Location.access_rule, location.access_rule)
+        self.assertIsNone(Entrance(1, "Entrance").connected_region)
+
+        overriding = OverridingLocation(1, "Overriding Location")
+        self.assertTrue(overriding.locked)
+        self.assertFalse(overriding.access_rule(None))
+        overriding.locked = False
+        self.assertFalse(overriding.locked)
+
+    def test_custom_attributes(self):
+        """Tests that attributes not in __slots__, like the class level ones, can still be set on instances."""
+        from BaseClasses import Location, LocationProgressType, MultiWorld, Region
+
+        location = Location(1, "Location")
+        self.assertFalse(hasattr(location, "__dict__") and location.__dict__)
+        location.progress_type = LocationProgressType.EXCLUDED
+        location.custom = "custom"
+        self.assertEqual(location.progress_type, LocationProgressType.EXCLUDED)
+        self.assertEqual(Location.progress_type, LocationProgressType.DEFAULT)
+        self.assertEqual(location.custom, "custom")
+
+        region = Region("Region", 1, MultiWorld(1))
+        region.links = []
+        self.assertEqual(region.links, [])
@@ -0,0 +1,214 @@
+import hashlib
+import os
+import random
+import unittest
+from tempfile import TemporaryDirectory
+from typing import Dict
+
+from worlds.Files import APDeltaPatch, APPatchExtension, APProcedurePatch, APTokenMixin, APTokenTypes, write_delta_patch
+import worlds.Files
+
+
+class TokenPatch(APTokenMixin):
+    """Stands in for the APProcedurePatch calling the patch extension functions."""
+    files: Dict[str, bytes]
+
+    def __init__(self) -> None:
+        self.files = {}
+
+    def get_file(self, file: str) -> bytes:
+        return self.files[file]
+
+
+class PipelinePatchExtension(APPatchExtension):
+    game = "Test Patch Pipeline"
+
+    @staticmethod
+    def append_footer(caller: APProcedurePatch, rom: bytes) -> bytes:
+        assert isinstance(rom, bytes), "Extensions not working in place should get bytes"
+        return rom + b"footer"
+
+
+class PipelineProcedurePatch(APProcedurePatch, APTokenMixin):
+    game = "Test Patch Pipeline"
+    hash = hashlib.md5(random.Random(0).randbytes(0x8000)).hexdigest()
+    patch_file_ending = ".aptestpipeline"
+    procedure = [
+        ("apply_tokens", ["token_data.bin"]),
+        ("calc_snes_crc", []),
+        ("append_footer", []),
+        ("apply_tokens", ["token_data.bin"]),
+    ]
+
+    @classmethod
+    def get_source_data(cls) -> bytes:
+        return random.Random(0).randbytes(0x8000)
+
+
+class TestDeltaPatch(APDeltaPatch):
+    game = "Test Delta Patch"
+    hash = hashlib.md5(random.Random(1).randbytes(0x8000)).hexdigest()
+    patch_file_ending = ".aptestdelta"
+    result_file_ending = ".bin"
+
+    @classmethod
+    def get_source_data(cls) -> bytes:
+        return random.Random(1).randbytes(0x8000)
+
+
+def apply_tokens_one_by_one(rom: bytes, tokens: TokenPatch) -> bytes:
+    rom_data = bytearray(rom)
+    for token_type, offset, args in tokens._tokens:
+        if token_type == APTokenTypes.WRITE:
+            rom_data[offset:offset + len(args)] = args
+        elif token_type == APTokenTypes.COPY:
+            rom_data[offset:offset + args[0]] = rom_data[args[1]:args[1] + args[0]]
+        elif token_type == APTokenTypes.RLE:
+            rom_data[offset:offset + args[0]] = bytes([args[1]] * args[0])
+        elif token_type == APTokenTypes.AND_8:
+            rom_data[offset] &= args
+        elif token_type == APTokenTypes.OR_8:
+            rom_data[offset] |= args
+        else:
+            rom_data[offset] ^= args
+    return bytes(rom_data)
+
+
+class TestTokens(unittest.TestCase):
+    def apply(self, rom: bytes, patch: TokenPatch) -> bytes:
+        patch.files["token_data.bin"] = patch.get_token_binary()
+        return APPatchExtension.apply_tokens(patch, rom, "token_data.bin")
+
+    def test_token_types(self) -> None:
+        """Tests that each token type changes the rom as documented."""
+        patch = TokenPatch()
+        patch.write_token(APTokenTypes.WRITE, 0, b"\x01\x02\x03")
+        patch.write_token(APTokenTypes.COPY, 4, (3, 0))
+        patch.write_token(APTokenTypes.RLE, 8, (4, 0xAB))
+        patch.write_token(APTokenTypes.AND_8, 0, 0x02)
+        patch.write_token(APTokenTypes.OR_8, 1, 0x10)
+        patch.write_token(APTokenTypes.XOR_8, 2, 0xFF)
+        patch.write_token(APTokenTypes.WRITE, 14, b"\xEE\xEE\xEE")
+        self.assertEqual(self.apply(bytes(16), patch),
+                         b"\x00\x12\xFC\x00\x01\x02\x03\x00\xAB\xAB\xAB\xAB\x00\x00\xEE\xEE\xEE")
+
+    def test_many_tokens(self) -> None:
+        """Tests that many mixed tokens give the same result as applying them one by one."""
+        rng = random.Random(0)
+        rom = rng.randbytes(0x10000)
+        patch = TokenPatch()
+        for _ in range(500):
+            token_type = rng.choice(list(APTokenTypes))
+            for _ in range(rng.choice((1, 200))):
+                offset = rng.randrange(0x100)
+                if token_type == APTokenTypes.WRITE:
+                    patch.write_token(token_type, offset, rng.randbytes(rng.randrange(1, 0x100)))
+                elif token_type in (APTokenTypes.COPY, APTokenTypes.RLE):
+                    patch.write_token(token_type, offset, (rng.randrange(0x100), rng.randrange(0x100)))
+                else:
+                    patch.write_token(token_type, offset, rng.randrange(0x100))
+        self.assertEqual(self.apply(rom, patch), apply_tokens_one_by_one(rom, patch))
+
+    def test_snes_crc(self) -> None:
+        """Tests that the SNES checksum and its complement are written to the header."""
+        rom = bytearray(random.Random(0).randbytes(0x80000))
+        rom = APPatchExtension.calc_snes_crc(TokenPatch(), bytes(rom))
+        crc = int.from_bytes(rom[0x7FDE:0x7FE0], "little")
+        self.assertEqual(int.from_bytes(rom[0x7FDC:0x7FDE], "little"), crc ^ 0xFFFF)
+        self.assertEqual(crc, (sum(rom[:0x7FDC]) + sum(rom[0x7FE0:]) + 0x01FE) & 0xFFFF)
+        self.assertEqual(APPatchExtension.calc_snes_crc(TokenPatch(), rom), rom)
+        numpy_import = worlds.Files._import_numpy
+        worlds.Files._import_numpy = lambda: None
+        try:
+            self.assertEqual(APPatchExtension.calc_snes_crc(TokenPatch(), rom), rom, "Differs without NumPy")
+        finally:
+            worlds.Files._import_numpy = numpy_import
+
+
+class TestProcedurePatch(unittest.TestCase):
+    def test_patch_pipeline(self) -> None:
+        """Tests that patching from the mapped base data gives the same result as applying each step to bytes."""
+        from Utils import cache_path
+
+        cache_backup = getattr(cache_path, "cached_path", None)
+        with TemporaryDirectory() as temp_dir:
+            cache_path.cached_path = temp_dir
+            try:
+                patch = PipelineProcedurePatch(os.path.join(temp_dir, "test.aptestpipeline"), 1, "Tester")
+                patch.write_token(APTokenTypes.WRITE, 0x100, b"\x01\x02\x03")
+                patch.write_token(APTokenTypes.XOR_8, 0x7FFF, 0xFF)
+                patch.write_file("token_data.bin", patch.get_token_binary())
+                patch.write()
+
+                expected = PipelineProcedurePatch.get_source_data()
+                expected = APPatchExtension.apply_tokens(patch, expected, "token_data.bin")
+                expected = APPatchExtension.calc_snes_crc(patch, expected)
+                expected = PipelinePatchExtension.append_footer(patch, expected)
+                expected = APPatchExtension.apply_tokens(patch, expected, "token_data.bin")
+
+                target = os.path.join(temp_dir, "test.sfc")
+                PipelineProcedurePatch(patch.path).patch(target)
+                with open(target, "rb") as f:
+                    self.assertEqual(f.read(), expected)
+                with open(cache_path("base_data", PipelineProcedurePatch.hash), "rb") as f:
+                    self.assertEqual(f.read(), PipelineProcedurePatch.get_source_data(), "Base data was modified")
+            finally:
+                if cache_backup is None:
+                    del cache_path.cached_path
+                else:
+                    cache_path.cached_path = cache_backup
+
+    def test_write_delta_patch(self) -> None:
+        """Tests that the delta patch written for a patched file, as output jobs do, gives back that file."""
+        from Utils import cache_path
+
+        cache_backup = getattr(cache_path, "cached_path", None)
+        with TemporaryDirectory() as temp_dir:
+            cache_path.cached_path = temp_dir
+            try:
+                patched = bytearray(TestDeltaPatch.get_source_data())
+                patched[0x100:0x200] = bytes(0x100)
+                patched_path = os.path.join(temp_dir, "AP_test_P1.bin")
+                with open(patched_path, "wb") as f:
+                    f.write(patched)
+                write_delta_patch(TestDeltaPatch, patched_path, 1, "Tester")
+                self.assertFalse(os.path.exists(patched_path))
+
+                target = os.path.join(temp_dir, "test.bin")
+                TestDeltaPatch(os.path.join(temp_dir, "AP_test_P1.aptestdelta")).patch(target)
+                with open(target, "rb") as f:
+                    self.assertEqual(f.read(), patched)
+            finally:
+                if cache_backup is None:
+                    del cache_path.cached_path
+                else:
+                    cache_path.cached_path = cache_backup
+
+    def test_wrong_base_data(self) -> None:
+        """Tests that base data not matching the hash of the patch is used, but not cached."""
+        from Utils import cache_path
+
+        class WrongBasePatch(PipelineProcedurePatch):
+            @classmethod
+            def get_source_data(cls) -> bytes:
+                return bytes(0x8000)
+
+        cache_backup = getattr(cache_path, "cached_path", None)
+        with TemporaryDirectory() as temp_dir:
+            cache_path.cached_path = temp_dir
+            try:
+                self.assertEqual(WrongBasePatch.get_source_buffer(), bytes(0x8000))
+                self.assertFalse(os.path.exists(cache_path("base_data", WrongBasePatch.hash)))
+
+                # caches written before they were checked get replaced
+                os.makedirs(cache_path("base_data"))
+                with open(cache_path("base_data", PipelineProcedurePatch.hash), "wb") as f:
+                    f.write(bytes(0x8000))
+                buffer = PipelineProcedurePatch.get_source_buffer()
+                self.assertEqual(buffer[:], PipelineProcedurePatch.get_source_data())
+                buffer.close()
+            finally:
+                if cache_backup is None:
+                    del cache_path.cached_path
+                else:
+                    cache_path.cached_path = cache_backup
@@ -0,0 +1,89 @@
+import functools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from Utils import local_path
+from worlds import (lazy_world_loading, network_data_package, read_data_package_cache, read_manifest, world_sources,
+                    write_data_package_cache, write_manifest)
+from worlds.AutoWorld import AutoWorldRegister
+
+# run in a separate process, as the main module decides whether worlds may be loaded lazily
+start_script = """
+import json
+import sys
+
+lazy_worlds_supported = {supported}
+
+import worlds
+from worlds.AutoWorld import AutoWorldRegister
+
+result = {{"lazy": worlds.lazy_world_loading, "loaded": [source.path for source in worlds.world_sources if source.loaded]}}
+result["module"] = AutoWorldRegister.world_types[sys.argv[1]].__module__
+result["requested"] = [source.path for source in worlds.world_sources if source.loaded]
+result["package"] = worlds.network_data_package["games"][sys.argv[1]]
+with open(sys.argv[2], "w") as f:
+    json.dump(result, f)
+"""
+
+
+class TestWorldManifest(unittest.TestCase):
+    game = "Clique"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.cache_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.cache_dir.cleanup)
+
+    def start(self, supported: bool) -> dict:
+        env = dict(os.environ, ARCHIPELAGO_LAZY_WORLDS="1", XDG_CACHE_HOME=self.cache_dir.name)
+        result_path = os.path.join(self.cache_dir.name, "result.json")
+        process = subprocess.run([sys.executable, "-c", start_script.format(supported=supported), self.game,
+                                  result_path], cwd=local_path(), env=env, stdin=subprocess.DEVNULL,
+                                 capture_output=True, text=True, timeout=300)
+        self.assertEqual(process.returncode, 0, process.stderr)
+        with open(result_path) as f:
+            return json.load(f)
+
+    def test_lazy_start(self) -> None:
+        """Verify that only the generator loads worlds lazily, and that it finds the same world and data package"""
+        world = AutoWorldRegister.world_types[self.game]
+        world_source = next(source for source in world_sources if world.__module__.startswith(source.module_name))
+
+        with self.subTest("unsupported"):
+            result = self.start(False)
+            self.assertFalse(result["lazy"])
+            self.assertIn(world_source.path, result["loaded"])
+
+        with self.subTest("first lazy start"):
+            result = self.start(True)
+            self.assertTrue(result["lazy"])
+            self.assertIn(world_source.path, result["loaded"])
+
+        with self.subTest("lazy start"):
+            result = self.start(True)
+            self.assertNotIn(world_source.path, result["loaded"])
+            self.assertIn(world_source.path, result["requested"])
+            self.assertEqual(result["module"], world.__module__)
+            self.assertEqual(result["package"], json.loads(json.dumps(network_data_package["games"][self.game])))
+
+    def test_regular_start(self) -> None:
+        """Verify that regular starts don't go through the files of worlds to check the manifest"""
+        self.assertFalse(lazy_world_loading)
+        for world_source in world_sources:
+            self.assertNotIn("mtime", vars(world_source), world_source)
+
+    def test_core_change(self) -> None:
+        """Verify that a different Archipelago version or core files invalidate the manifest and data package cache"""
+        with mock.patch("worlds.cache_path", functools.partial(os.path.join, self.cache_dir.name)):
+            write_manifest({"source": {}})
+            write_data_package_cache({"source": {}})
+            self.assertEqual(read_manifest(), {"source": {}})
+            self.assertEqual(read_data_package_cache(), {"source": {}})
+            with mock.patch("worlds.get_core_key", return_value="changed"):
+                self.assertEqual(read_manifest(), {})
+                self.assertEqual(read_data_package_cache(), {})
@@ -1,6 +1,7 @@
 # A bunch of tests to verify MultiServer and custom webhost server work as expected.
 # This spawns processes and may modify your local AP, so this is not run as part of unit testing.
 # Run with `python test/hosting` instead,
+# For measuring server performance under many clients, see test/hosting/load.py.
 import logging
 import traceback
 from tempfile import TemporaryDirectory
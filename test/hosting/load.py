@@ -0,0 +1,362 @@
+# Load generator for MultiServer, simulating many websocket clients sending realistic traffic.
+# This spawns processes and may modify your local AP, so this is not run as part of unit testing.
+# Run with `python -m test.hosting.load` from the AP root, see `--help` for options.
+# Results are compared to load_baseline.json, exiting with 1 on a regression, like test/benchmark/generation.py.
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from threading import Event, Thread
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+__all__ = [
+    "LoadClient",
+    "LoadReport",
+    "best_summary",
+    "find_regressions",
+    "run_load",
+    "sample_rss",
+]
+
+
+# relative weights of the actions a load client picks from, after connecting
+default_weights: Dict[str, int] = {
+    "LocationChecks": 4,
+    "Set": 4,
+    "Bounce": 1,
+    "DeathLink": 1,
+    "Hint": 1,
+}
+
+shared_key = "load_test_shared"
+
+default_baseline_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "load_baseline.json")
+
+
+@dataclass
+class LoadReport:
+    clients: int = 0
+    duration: float = 0.
+    connect_latencies: List[float] = field(default_factory=list)
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    sent: int = 0
+    received: int = 0
+    errors: List[str] = field(default_factory=list)
+    peak_rss: Optional[int] = None
+
+    @staticmethod
+    def percentile(values: Sequence[float], percent: float) -> float:
+        if not values:
+            return float("nan")
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def format(self) -> str:
+        lines = [f"{self.clients} clients, {self.duration:.2f}s, "
+                 f"{self.sent / self.duration:.0f} msgs/s sent, {self.received / self.duration:.0f} msgs/s received"]
+        for name, values in (("Connect", self.connect_latencies), *sorted(self.latencies.items())):
+            lines.append(f"{name:>16}: n={len(values):<6} p50={self.percentile(values, 50) * 1000:8.2f}ms "
+                         f"p99={self.percentile(values, 99) * 1000:8.2f}ms")
+        if self.peak_rss is not None:
+            lines.append(f"Server peak RSS: {self.peak_rss / 1024 / 1024:.1f} MiB")
+        if self.errors:
+            lines.append(f"{len(self.errors)} errors, first: {self.errors[0]}")
+        return "\n".join(lines)
+
+    def summary(self) -> Dict[str, float]:
+        """The numbers compared to a baseline: seconds of latency percentiles, messages per second and peak RSS."""
+        summary = {"sent/s": self.sent / self.duration, "received/s": self.received / self.duration}
+        for name, values in (("Connect", self.connect_latencies), *sorted(self.latencies.items())):
+            summary[f"{name} p50"] = self.percentile(values, 50)
+            summary[f"{name} p99"] = self.percentile(values, 99)
+        if self.peak_rss is not None:
+            summary["peak RSS"] = self.peak_rss
+        return summary
+
+
+class LoadClient:
+    """Async client for the AP network protocol that measures round trip times.
+
+    Every action is sent in the same frame as a `Get` probe. The server processes commands of a frame in order,
+    so the time until the probe's `Retrieved` arrives is the time the server took to handle the action."""
+
+    host: str
+    game: str
+    slot: str
+    tags: List[str]
+    report: LoadReport
+
+    slot_id: int
+    missing_locations: List[int]
+    checked_locations: List[int]
+
+    def __init__(self, host: str, game: str, slot: str, report: LoadReport, tags: Sequence[str] = ()) -> None:
+        self.host = host
+        self.game = game
+        self.slot = slot
+        self.tags = list(tags)
+        self.report = report
+        self.slot_id = 0
+        self.missing_locations = []
+        self.checked_locations = []
+        self._ws: Any = None
+        self._reader: Optional["asyncio.Task[None]"] = None
+        self._waiting: Dict[int, "asyncio.Future[None]"] = {}
+        self._next_probe = 0
+
+    async def _send(self, msgs: List[Dict[str, Any]]) -> None:
+        self.report.sent += len(msgs)
+        await self._ws.send(json.dumps(msgs))
+
+    async def _recv(self) -> List[Dict[str, Any]]:
+        msgs = json.loads(await self._ws.recv())
+        self.report.received += len(msgs)
+        return msgs
+
+    async def _read(self) -> None:
+        from websockets import ConnectionClosed
+
+        try:
+            while True:
+                for msg in await self._recv():
+                    if msg["cmd"] == "Retrieved" and "load_probe" in msg:
+                        future = self._waiting.pop(msg["load_probe"], None)
+                        if future and not future.done():
+                            future.set_result(None)
+                    elif msg["cmd"] == "InvalidPacket":
+                        self.report.errors.append(f"{self.slot}: {msg}")
+        except ConnectionClosed:
+            pass
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection closed"))
+
+    async def connect(self) -> None:
+        import websockets
+
+        start = time.perf_counter()
+        self._ws = await websockets.connect(f"ws://{self.host}", max_size=None)
+        await self._recv()  # RoomInfo
+        await self._send([{
+            "cmd": "Connect",
+            "game": self.game,
+            "name": self.slot,
+            "password": None,
+            "uuid": "",
+            "version": {"class": "Version", "major": 0, "minor": 4, "build": 6},
+            "items_handling": 0b111,
+            "tags": self.tags,
+            "slot_data": False,
+        }, {
+            "cmd": "SetNotify",
+            "keys": [shared_key, f"load_test_{self.slot}"],
+        }])
+        while True:
+            for msg in await self._recv():
+                if msg["cmd"] == "ConnectionRefused":
+                    raise ConnectionError(", ".join(msg.get("errors", [msg["cmd"]])))
+                if msg["cmd"] == "Connected":
+                    self.slot_id = msg["slot"]
+                    self.missing_locations = list(msg["missing_locations"])
+                    self.checked_locations = list(msg["checked_locations"])
+                    self.report.connect_latencies.append(time.perf_counter() - start)
+                    self._reader = asyncio.create_task(self._read())
+                    return
+
+    async def close(self) -> None:
+        if self._ws:
+            await self._ws.close()
+        if self._reader:
+            await self._reader
+
+    async def request(self, name: str, msgs: List[Dict[str, Any]]) -> None:
+        """Send msgs and record the time until the server is done processing them under name."""
+        probe = self._next_probe
+        self._next_probe += 1
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[probe] = future
+        start = time.perf_counter()
+        await self._send([*msgs, {"cmd": "Get", "keys": [], "load_probe": probe}])
+        await future
+        self.report.latencies.setdefault(name, []).append(time.perf_counter() - start)
+
+    def _location_checks(self) -> List[Dict[str, Any]]:
+        if self.missing_locations:
+            location = self.missing_locations.pop()
+            self.checked_locations.append(location)
+        else:
+            location = random.choice(self.checked_locations)  # resend, like clients do on reconnect
+        return [{"cmd": "LocationChecks", "locations": [location]}]
+
+    def _set(self) -> List[Dict[str, Any]]:
+        if random.random() < .5:
+            return [{"cmd": "Set", "key": shared_key, "default": 0, "want_reply": True,
+                     "operations": [{"operation": "add", "value": 1}]}]
+        return [{"cmd": "Set", "key": f"load_test_{self.slot}", "default": {}, "want_reply": True,
+                 "operations": [{"operation": "update", "value": {str(random.randrange(100)): time.time()}}]}]
+
+    def _bounce(self) -> List[Dict[str, Any]]:
+        return [{"cmd": "Bounce", "slots": [self.slot_id], "data": {"time": time.time()}}]
+
+    def _death_link(self) -> List[Dict[str, Any]]:
+        return [{"cmd": "Bounce", "tags": ["DeathLink"],
+                 "data": {"time": time.time(), "source": self.slot, "cause": "Load test"}}]
+
+    def _hint(self) -> List[Dict[str, Any]]:
+        locations = self.missing_locations + self.checked_locations
+        return [{"cmd": "LocationScouts", "locations": [random.choice(locations)], "create_as_hint": 2}]
+
+    async def run(self, actions: int, weights: Dict[str, int], interval: float) -> None:
+        builders: Dict[str, Callable[[], List[Dict[str, Any]]]] = {
+            "LocationChecks": self._location_checks,
+            "Set": self._set,
+            "Bounce": self._bounce,
+            "DeathLink": self._death_link,
+            "Hint": self._hint,
+        }
+        names = list(weights)
+        for _ in range(actions):
+            name = random.choices(names, [weights[name] for name in names])[0]
+            await self.request(name, builders[name]())
+            if interval:
+                # jitter, so clients don't end up in lock step
+                await asyncio.sleep(random.uniform(0, 2 * interval))
+
+
+async def run_load(host: str, slots: Sequence[str], game: str, actions: int = 50, interval: float = 0.,
+                   death_link_ratio: float = .5, weights: Optional[Dict[str, int]] = None,
+                   seed: Optional[int] = None) -> LoadReport:
+    """Connect one client per slot to the server at host, then let each of them send actions requests."""
+    random.seed(seed)
+    report = LoadReport(clients=len(slots))
+    clients = [LoadClient(host, game, slot, report, ["DeathLink"] if random.random() < death_link_ratio else [])
+               for slot in slots]
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(client.connect() for client in clients))
+        await asyncio.gather(*(client.run(actions, weights or default_weights, interval) for client in clients))
+    finally:
+        report.duration = time.perf_counter() - start
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+    return report
+
+
+def best_summary(summaries: Sequence[Dict[str, float]]) -> Dict[str, float]:
+    """Best of each number of summaries of repeated runs, which is the least affected by noise."""
+    best: Dict[str, float] = {}
+    for name in summaries[0]:
+        values = [summary[name] for summary in summaries if name in summary]
+        best[name] = max(values) if name.endswith("/s") else min(values)
+    return best
+
+
+def find_regressions(summary: Dict[str, float], baseline: Dict[str, float],
+                     threshold: float = .2, min_seconds: float = .001) -> List[str]:
+    """Numbers of summary that are more than threshold worse than in baseline.
+    Latencies are only counted if they got slower by at least min_seconds, to ignore noise of fast requests."""
+    regressions: List[str] = []
+    for name, value in summary.items():
+        base = baseline.get(name)
+        if base is None or base != base:  # missing or nan
+            continue
+        if name.endswith("/s"):
+            if value < base * (1 - threshold):
+                regressions.append(f"{name}: {base:.0f} -> {value:.0f}")
+        elif name == "peak RSS":
+            if value > base * (1 + threshold):
+                regressions.append(f"{name}: {base / 1024 / 1024:.1f} MiB -> {value / 1024 / 1024:.1f} MiB")
+        elif value > base * (1 + threshold) and value - base >= min_seconds:
+            regressions.append(f"{name}: {base * 1000:.2f}ms -> {value * 1000:.2f}ms")
+    return regressions
+
+
+def sample_rss(pid: int, stop: Event, interval: float = .1) -> Callable[[], Optional[int]]:
+    """Start sampling the resident set size of process pid until stop is set. Returns a getter for the peak."""
+    peak: List[Optional[int]] = [None]
+
+    def sample() -> None:
+        try:
+            import psutil
+            process = psutil.Process(pid)
+            while not stop.is_set():
+                peak[0] = max(peak[0] or 0, process.memory_info().rss)
+                stop.wait(interval)
+        except Exception:  # psutil missing or process gone, report what we have
+            pass
+
+    Thread(target=sample, daemon=True).start()
+    return lambda: peak[0]
+
+
+if __name__ == "__main__":
+    import argparse
+    import warnings
+    from tempfile import TemporaryDirectory
+
+    from test.hosting.generate import generate_local
+    from test.hosting.serve import LocalServeGame
+
+    warnings.simplefilter("ignore", ResourceWarning)
+    warnings.simplefilter("ignore", UserWarning)
+
+    parser = argparse.ArgumentParser(description="Generate a multiworld, host it with MultiServer and put it under load.")
+    parser.add_argument("--players", type=int, default=200, help="number of slots and connected clients")
+    parser.add_argument("--actions", type=int, default=50, help="number of requests sent by each client")
+    parser.add_argument("--interval", type=float, default=0., help="average delay in seconds between requests")
+    parser.add_argument("--death_link_ratio", type=float, default=.5, help="share of clients with DeathLink tag")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the traffic pattern, fixed to compare runs")
+    parser.add_argument("--game", default="Clique", help="game to generate for each slot")
+    parser.add_argument("--baseline", default=default_baseline_path, help="JSON file to compare to")
+    parser.add_argument("--save_baseline", action="store_true", help="save the results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=.2, help="slowdown to report as regression, .2 is 20%%")
+    parser.add_argument("--repeat", type=int, default=3, help="run this often, keeping the best of every number")
+    args = parser.parse_args()
+    # baselines are kept per scenario, as the numbers depend on all of these
+    scenario = (f"{args.players} {args.game}, {args.actions} actions, {args.interval}s interval, "
+                f"{args.death_link_ratio} DeathLink, seed {args.seed}")
+
+    summaries: List[Dict[str, float]] = []
+    errors: List[str] = []
+    for _ in range(args.repeat):
+        # a fresh multiworld and server for every run, so no run starts with the checks of the one before
+        with TemporaryDirectory() as tempdir:
+            print(f"Generating {args.players} slots of {args.game}")
+            multidata = generate_local([args.game] * args.players, tempdir)
+            with LocalServeGame(multidata) as host:
+                stop_sampling = Event()
+                get_peak_rss = sample_rss(host.pid, stop_sampling)
+                try:
+                    print(f"Running {args.players} clients with {args.actions} actions each against {host.address}")
+                    result = asyncio.run(run_load(host.address, [f"Player{n}" for n in range(1, args.players + 1)],
+                                                  args.game, args.actions, args.interval, args.death_link_ratio,
+                                                  seed=args.seed))
+                finally:
+                    stop_sampling.set()
+                result.peak_rss = get_peak_rss()
+            print(result.format())
+        summaries.append(result.summary())
+        errors.extend(result.errors)
+    summary = best_summary(summaries)
+
+    baselines: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+    regressions: List[str] = []
+    if scenario in baselines:
+        regressions = find_regressions(summary, baselines[scenario], args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if not regressions:
+            print(f"No regressions above {args.threshold * 100:.0f}% compared to {args.baseline}.")
+    else:
+        print(f"No baseline for {scenario} in {args.baseline}.")
+    if args.save_baseline:
+        baselines[scenario] = summary
+        with open(args.baseline, "w") as f:
+            json.dump(baselines, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    exit(1 if errors or regressions else 0)
@@ -65,6 +65,12 @@ class LocalServeGame(ServeGame):
         self.address = ""
         self._multidata = multidata
 
+    @property
+    def pid(self) -> int:
+        """Process ID of the running MultiServer"""
+        assert self._proc.pid is not None, "Server not running"
+        return self._proc.pid
+
     def __enter__(self) -> "LocalServeGame":
         from multiprocessing import Manager, Process, set_start_method
 
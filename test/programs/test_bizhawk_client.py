@@ -0,0 +1,106 @@
+import asyncio
+import base64
+import json
+import unittest
+from typing import List, Optional
+
+from worlds import _bizhawk
+
+
+class FakeConnector:
+    """Answers one message per frame in the order received, like connector_bizhawk_generic.lua."""
+    server: Optional[asyncio.AbstractServer]
+
+    def __init__(self) -> None:
+        self.server = None
+        self.memory = bytearray(range(256))
+        self.messages: List[str] = []
+        self.handlers: List[asyncio.Task] = []
+        self.queued_at_first_answer = 0
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await asyncio.gather(*self.handlers)
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.handlers.append(asyncio.current_task())
+        await asyncio.sleep(0.05)  # let the client send everything it wants to
+        while line := await reader.readline():
+            if not self.messages:
+                self.queued_at_first_answer = 1 + reader._buffer.count(b"\n")
+            message = line.decode("utf-8").strip()
+            self.messages.append(message)
+            if message == "VERSION":
+                writer.write(b"1\n")
+            else:
+                writer.write(json.dumps([self.process(req) for req in json.loads(message)]).encode() + b"\n")
+            await writer.drain()
+            await asyncio.sleep(0.01)  # next frame
+        writer.close()
+
+    def process(self, req: dict) -> dict:
+        if req["type"] == "READ":
+            data = self.memory[req["address"]:req["address"] + req["size"]]
+            return {"type": "READ_RESPONSE", "value": base64.b64encode(data).decode("ascii")}
+        if req["type"] == "WRITE":
+            data = base64.b64decode(req["value"])
+            self.memory[req["address"]:req["address"] + len(data)] = data
+            return {"type": "WRITE_RESPONSE"}
+        return {"type": "PONG"}
+
+
+class TestBizHawkContext(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.connector = FakeConnector()
+        port = await self.connector.start()
+        self.ctx = _bizhawk.BizHawkContext()
+        self.ctx.streams = await asyncio.open_connection("127.0.0.1", port)
+        self.ctx.connection_status = _bizhawk.ConnectionStatus.TENTATIVE
+
+    async def asyncTearDown(self) -> None:
+        _bizhawk.disconnect(self.ctx)
+        await self.connector.stop()
+
+    async def test_pipelined_requests(self) -> None:
+        """Verify that requests are sent without waiting for earlier responses, and get their own responses."""
+        results = await asyncio.gather(
+            _bizhawk.get_script_version(self.ctx),
+            _bizhawk.read(self.ctx, [(0x10, 4, "RAM")]),
+            _bizhawk.ping(self.ctx),
+            _bizhawk.read(self.ctx, [(0x20, 2, "RAM"), (0x30, 1, "RAM")]),
+        )
+        self.assertEqual(results, [1, [bytes([0x10, 0x11, 0x12, 0x13])], None, [bytes([0x20, 0x21]), bytes([0x30])]])
+        self.assertEqual(self.connector.queued_at_first_answer, 4)
+        self.assertEqual(self.ctx.connection_status, _bizhawk.ConnectionStatus.CONNECTED)
+        self.assertFalse(self.ctx._pending)
+
+    async def test_shared_reads(self) -> None:
+        """Verify that identical reads in flight are sent once, and a write in between makes later reads go out."""
+        read_list = [(0x40, 2, "RAM")]
+        results = await asyncio.gather(
+            _bizhawk.read(self.ctx, read_list),
+            _bizhawk.read(self.ctx, read_list),
+            _bizhawk.write(self.ctx, [(0x40, [0xAA], "RAM")]),
+            _bizhawk.read(self.ctx, read_list),
+        )
+        self.assertEqual(results, [[bytes([0x40, 0x41])], [bytes([0x40, 0x41])], None, [bytes([0xAA, 0x41])]])
+        self.assertEqual(len(self.connector.messages), 3)
+        self.assertFalse(self.ctx._read_futures)
+
+    async def test_connection_closed(self) -> None:
+        """Verify that every request in flight fails when the connector goes away."""
+        _, writer = self.ctx.streams
+        requests = [asyncio.ensure_future(_bizhawk.ping(self.ctx)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.ctx._connection_lost(writer, "Connection closed")
+        for request in requests:
+            with self.assertRaises(_bizhawk.RequestFailedError):
+                await request
+        self.assertIsNone(self.ctx.streams)
+        with self.assertRaises(_bizhawk.NotConnectedError):
+            await _bizhawk.ping(self.ctx)
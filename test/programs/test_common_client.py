@@ -1,6 +1,9 @@
+import os
+import tempfile
 import unittest
 
 import NetUtils
+import Utils
 from CommonClient import CommonContext
 
 
@@ -104,3 +107,56 @@ class TestCommonContext(unittest.IsolatedAsyncioTestCase):
         assert self.ctx.item_names.lookup_in_slot(-1, 3) == "Nothing"
         assert self.ctx.item_names.lookup_in_game(-1, "__TestGame1") == "Nothing"
         assert self.ctx.item_names.lookup_in_game(-1, "__TestGame2") == "Nothing"
+
+
+class TestDataPackageStore(unittest.IsolatedAsyncioTestCase):
+    game_package = {
+        "checksum": "0123456789abcdef",
+        "version": 0,
+        "item_name_to_id": {"Test Item 1": 2**54 + 1, "Test Item 2": 2**54 + 2},
+        "location_name_to_id": {"Test Location 1": 2**54 + 1},
+    }
+
+    async def asyncSetUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = Utils.DataPackageStore(os.path.join(self.temp_dir.name, "datapackage.sqlite3"))
+        self.ctx = CommonContext()
+        self.ctx.data_package_store = self.store
+
+    async def asyncTearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    async def test_store(self):
+        self.assertIsNone(self.store.get_version("__TestGame1", "0123456789abcdef"))
+        self.store.store_game("__TestGame1", self.game_package)
+        self.store.store_game("__TestGame1", self.game_package)
+        self.assertEqual(self.store.get_version("__TestGame1", "0123456789abcdef"), 0)
+        self.assertIsNone(self.store.get_version("__TestGame2", "0123456789abcdef"))
+        self.assertEqual(self.store.get_name("0123456789abcdef", "item", 2**54 + 2), "Test Item 2")
+        self.assertIsNone(self.store.get_name("0123456789abcdef", "location", 2**54 + 2))
+        self.assertEqual(self.store.get_id("0123456789abcdef", "location", "Test Location 1"), 2**54 + 1)
+        self.assertEqual(self.store.get_ids("0123456789abcdef", "item"), self.game_package["item_name_to_id"])
+
+    async def test_lookups_from_store(self):
+        """Verify that a game in the store is looked up from it, without downloading its data package."""
+        self.store.store_game("__TestGame1", self.game_package)
+        sent = []
+
+        async def send_msgs(msgs):
+            sent.extend(msgs)
+
+        self.ctx.send_msgs = send_msgs
+        await self.ctx.prepare_data_package({"__TestGame1"}, {}, {"__TestGame1": "0123456789abcdef"})
+        self.assertEqual(sent, [])
+        self.assertEqual(self.ctx.checksums["__TestGame1"], "0123456789abcdef")
+        names = self.ctx.item_names["__TestGame1"]
+        self.assertEqual(names[2**54 + 1], "Test Item 1")
+        self.assertEqual(names[2**54 + 3], f"Unknown item (ID: {2**54 + 3})")
+        self.assertEqual(names[-1], "Nothing")
+        self.assertIn(2**54 + 2, names)
+        self.assertNotIn(2**54 + 3, names)
+        self.assertEqual(self.ctx.location_names.lookup_in_game(2**54 + 1, "__TestGame1"), "Test Location 1")
+
+        await self.ctx.prepare_data_package({"__TestGame2"}, {}, {"__TestGame2": "fedcba9876543210"})
+        self.assertEqual(sent, [{"cmd": "GetDataPackage", "games": ["__TestGame2"]}])
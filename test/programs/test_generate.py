@@ -72,6 +72,27 @@ class TestGenerateMain(unittest.TestCase):
 
         self.assertOutput(self.output_tempdir.name)
 
+    def test_generate_trace(self):
+        import json
+        trace_path = os.path.join(self.output_tempdir.name, "trace.json")
+        sys.argv = [sys.argv[0], '--seed', '0',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name,
+                    '--trace', trace_path, '--trace_memory', '--trace_profile']
+        Main.main(*Generate.main())
+
+        self.assertOutput(self.output_tempdir.name)
+        with open(trace_path) as f:
+            events = [event for event in json.load(f)["traceEvents"] if event["ph"] == "X"]
+        names = {(event["cat"], event["name"]) for event in events}
+        for stage in ("generate_early", "create_regions", "set_rules", "fill", "output", "spoiler"):
+            self.assertIn(("stage", stage), names)
+        self.assertIn(("world", "create_regions"), names)
+        world_event = next(event for event in events if event["cat"] == "world" and "player" in event["args"])
+        self.assertEqual(world_event["args"]["player"], 1)
+        self.assertIn("peak_memory_delta_kib", world_event["args"])
+        self.assertTrue(os.path.exists(os.path.join(self.output_tempdir.name, "trace_P1.prof")))
+
     def test_generate_yaml(self):
         # override host.yaml
         from settings import get_settings
@@ -108,6 +129,7 @@ class TestGenerateWeights(TestGenerateMain):
     # don't need to run these tests
     test_generate_absolute = None
     test_generate_relative = None
+    test_generate_trace = None
 
     def test_generate_yaml(self):
         from settings import get_settings
@@ -137,3 +159,84 @@ class TestGenerateWeights(TestGenerateMain):
                     result, getattr(namespace, option_name)[player].value,
                     "Generated results from weights file did not match expected value."
                 )
+
+    def test_generate_yaml_processes(self):
+        """Tests that rolling options in processes does not depend on the number of processes."""
+        from settings import get_settings
+        from Utils import user_path, local_path
+        settings = get_settings()
+        settings.generator.player_files_path = settings.generator.PlayerFilesPath(self.yaml_input_dir)
+        settings.generator.players = 5
+        settings._filename = None
+        user_path_backup = user_path.cached_path
+        user_path.cached_path = local_path()
+        results = []
+        try:
+            for processes in (1, 2):
+                sys.argv = [sys.argv[0], "--seed", "1", "--processes", str(processes)]
+                namespace, seed = Generate.main()
+                results.append({option_name: [getattr(namespace, option_name)[player].value for player in range(1, 6)]
+                                for option_name in ("accessibility", "progression_balancing")})
+        finally:
+            user_path.cached_path = user_path_backup
+
+        self.assertEqual(results[0], results[1], "Rolled options depend on the number of processes.")
+
+
+def write_job_output(path: str, content: str) -> None:
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class TestOutputJobs(unittest.TestCase):
+    def test_output_job(self) -> None:
+        """Tests that an output job replaces generate_output and runs with and without a process pool."""
+        import concurrent.futures
+        import functools
+        from test.general import generate_test_multiworld
+
+        multiworld = generate_test_multiworld()
+        world = multiworld.worlds[1]
+        world.generate_output = lambda output_directory: self.fail("generate_output should be skipped")
+        world.generate_output_job = lambda output_directory: functools.partial(
+            write_job_output, os.path.join(output_directory, "output.txt"), "Output of job")
+        with concurrent.futures.ProcessPoolExecutor(1) as job_pool:
+            for pool in (None, job_pool):
+                with self.subTest(pool=pool), TemporaryDirectory() as output_dir:
+                    Main.generate_player_output(multiworld, 1, output_dir, pool)
+                    with open(os.path.join(output_dir, "output.txt")) as f:
+                        self.assertEqual(f.read(), "Output of job")
+
+
+class TestOutputArchive(unittest.TestCase):
+    def test_archive_content(self) -> None:
+        """Tests that the output archive contains all files, with compressed ones stored as is."""
+        import zipfile
+        import zlib
+
+        files = {
+            "AP_test_Spoiler.txt": b"Playthrough:\n" * 10000,
+            "AP_test.archipelago": bytes([3]) + zlib.compress(os.urandom(100000), 9),
+            "AP_test_P1.aptest": os.urandom(1000),
+            "empty.txt": b"",
+            "data/AP_test_P2.txt": b"Patch data\n" * 10000,
+        }
+        with TemporaryDirectory() as input_dir, TemporaryDirectory() as output_dir:
+            for name, content in files.items():
+                os.makedirs(os.path.dirname(os.path.join(input_dir, name)), exist_ok=True)
+                with open(os.path.join(input_dir, name), "wb") as f:
+                    f.write(content)
+            for level in (0, 1, 9):
+                with self.subTest(level=level):
+                    archive = os.path.join(output_dir, f"AP_{level}.zip")
+                    Main.write_output_archive(archive, input_dir, level)
+                    with zipfile.ZipFile(archive) as zf:
+                        self.assertIsNone(zf.testzip())
+                        self.assertEqual({info.filename: zf.read(info) for info in zf.infolist()}, files)
+                        spoiler = zf.getinfo("AP_test_Spoiler.txt")
+                        self.assertEqual(spoiler.compress_type,
+                                         zipfile.ZIP_DEFLATED if level else zipfile.ZIP_STORED)
+                        self.assertEqual(zf.getinfo("AP_test.archipelago").compress_type, zipfile.ZIP_STORED)
+                        self.assertEqual(zf.getinfo("AP_test_P1.aptest").compress_type, zipfile.ZIP_STORED)
+            with self.assertRaises(ValueError):
+                Main.write_output_archive(os.path.join(output_dir, "AP_invalid.zip"), input_dir, 10)
@@ -1,5 +1,9 @@
+import asyncio
+import json
 import unittest
-from MultiServer import Context, ServerCommandProcessor
+from typing import Dict, Iterable, List
+
+from MultiServer import Client, Context, ServerCommandProcessor, process_client_cmd
 
 
 class TestResolvePlayerName(unittest.TestCase):
@@ -38,3 +42,135 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class TestDataStorage(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.ctx = Context("", 0, "", "", 0, 0, False)
+        self.received: Dict[Client, List[list]] = {}
+
+        async def broadcast_send_encoded_msgs(endpoints: Iterable[Client], msg: str) -> bool:
+            for endpoint in endpoints:
+                self.received.setdefault(endpoint, []).append(json.loads(msg))
+            return True
+
+        self.ctx.broadcast_send_encoded_msgs = broadcast_send_encoded_msgs
+
+    def make_client(self, slot: int) -> Client:
+        client = Client(None, self.ctx)
+        client.auth = True
+        client.team = 0
+        client.slot = slot
+        return client
+
+    async def set_all(self, client: Client, sets: List[dict]) -> None:
+        """Process Set packages sent together, like server() does."""
+        for args in sets:
+            await process_client_cmd(self.ctx, client, {"cmd": "Set", **args})
+        self.ctx.flush_set_replies()
+        await asyncio.sleep(0)
+
+    async def test_notifications(self) -> None:
+        """Verify exact, prefix and glob subscriptions, and that Sets sent together are replied to in one message."""
+        exact, prefix, glob, setter = (self.make_client(slot) for slot in range(1, 5))
+        await process_client_cmd(self.ctx, exact, {"cmd": "SetNotify", "keys": ["shared", "x*", "[x]"]})
+        await process_client_cmd(self.ctx, prefix, {"cmd": "SetNotify", "patterns": ["shared*"]})
+        await process_client_cmd(self.ctx, glob, {"cmd": "SetNotify", "keys": [], "patterns": ["slot_?_data", "[x]"]})
+
+        operations = [{"operation": "update", "value": {"a": 1}}]
+        await self.set_all(setter, [
+            {"key": "shared", "default": {}, "operations": operations},
+            {"key": "shared_2", "default": 0, "operations": [{"operation": "add", "value": 1}], "want_reply": False},
+            {"key": "slot_1_data", "default": 0, "operations": [{"operation": "add", "value": 1}]},
+            {"key": "shared", "default": {}, "operations": [{"operation": "update", "value": {"b": 2}}]},
+        ])
+
+        def replies(client: Client) -> List[list]:
+            return [[(reply["key"], reply["value"]) for reply in msg] for msg in self.received.get(client, [])]
+
+        self.assertEqual(replies(exact), [[("shared", {"a": 1}), ("shared", {"a": 1, "b": 2})]])
+        self.assertEqual(replies(prefix), [[("shared", {"a": 1}), ("shared_2", 1), ("shared", {"a": 1, "b": 2})]])
+        self.assertEqual(replies(glob), [[("slot_1_data", 1)]])
+        self.assertEqual(replies(setter),
+                         [[("shared", {"a": 1}), ("slot_1_data", 1), ("shared", {"a": 1, "b": 2})]])
+        self.assertEqual(self.ctx.get_stored_data_notification_clients("x"), {glob})
+        self.assertEqual(self.ctx.get_stored_data_notification_clients("[x]"), {exact})
+        self.assertEqual(self.ctx.get_stored_data_notification_clients("x*"), {exact})
+        self.assertEqual(self.ctx.get_stored_data_notification_clients("xy"), set())
+        self.assertEqual(self.ctx.get_stored_data_notification_clients("other"), set())
+
+    async def test_save_changed_keys(self) -> None:
+        """Verify that saving only pickles keys changed since the last save, and loads what was saved."""
+        setter = self.make_client(1)
+        await self.set_all(setter, [{"key": f"key_{n}", "default": [], "want_reply": False,
+                                     "operations": [{"operation": "add", "value": [n]}]} for n in range(3)])
+        first = self.ctx.get_stored_data_entries()
+        await self.set_all(setter, [{"key": "key_1", "default": [], "want_reply": False,
+                                     "operations": [{"operation": "add", "value": [4]}]}])
+        second = self.ctx.get_stored_data_entries()
+        self.assertIs(first["key_0"], second["key_0"])
+        self.assertIsNot(first["key_1"], second["key_1"])
+
+        loaded = Context("", 0, "", "", 0, 0, False)
+        loaded.set_save(self.ctx.get_save())
+        self.assertEqual(loaded.stored_data, {"key_0": [0], "key_1": [1, 4], "key_2": [2]})
+        self.assertIs(loaded.get_stored_data_entries()["key_2"], second["key_2"])
+
+        loaded.stored_data = {"replaced": True}
+        self.assertEqual(list(loaded.get_stored_data_entries()), ["replaced"])
+
+
+class TestBounce(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.ctx = Context("", 0, "", "", 0, 0, False)
+        self.ctx.games = {1: "Game A", 2: "Game A", 3: "Game B"}
+        self.ctx.clients = {0: {slot: [] for slot in self.ctx.games}, 1: {slot: [] for slot in self.ctx.games}}
+        self.ctx.player_names = {(team, slot): f"Player{slot}" for team in self.ctx.clients for slot in self.ctx.games}
+        self.received: Dict[Client, List[list]] = {}
+
+        async def broadcast_send_encoded_msgs(endpoints: Iterable[Client], msg: str) -> bool:
+            for endpoint in endpoints:
+                self.received.setdefault(endpoint, []).append(json.loads(msg))
+            return True
+
+        self.ctx.broadcast_send_encoded_msgs = broadcast_send_encoded_msgs
+
+    def connect(self, team: int, slot: int, tags: List[str]) -> Client:
+        """Authenticate a client the way Connect does, without going through the checks of the package."""
+        client = Client(None, self.ctx)
+        client.auth = True
+        client.team = team
+        client.slot = slot
+        client.tags = tags
+        self.ctx.endpoints.append(client)
+        self.ctx.clients[team][slot].append(client)
+        self.ctx.update_bounce_index(client)
+        return client
+
+    async def bounce(self, client: Client, **targets: list) -> None:
+        self.received.clear()
+        await process_client_cmd(self.ctx, client, {"cmd": "Bounce", "data": {}, **targets})
+
+    async def test_routing(self) -> None:
+        """Verify that bounces reach clients by game, tag and slot of the same team, following tag changes."""
+        a1 = self.connect(0, 1, ["DeathLink"])
+        a2 = self.connect(0, 2, [])
+        b3 = self.connect(0, 3, ["DeathLink", "RingLink"])
+        other_team = self.connect(1, 1, ["DeathLink"])
+
+        await self.bounce(a2, tags=["DeathLink"])
+        self.assertEqual(set(self.received), {a1, b3})
+        await self.bounce(a2, games=["Game A"], slots=[3])
+        self.assertEqual(set(self.received), {a1, a2, b3})
+        self.assertEqual(self.received[a1], [[{"cmd": "Bounced", "data": {}, "games": ["Game A"], "slots": [3]}]])
+        await self.bounce(other_team, tags=["RingLink"], slots=[2])
+        self.assertEqual(self.received, {})
+
+        await process_client_cmd(self.ctx, b3, {"cmd": "ConnectUpdate", "tags": ["RingLink"]})
+        await self.bounce(a1, tags=["DeathLink"])
+        self.assertEqual(set(self.received), {a1})
+
+        await self.ctx.disconnect(a1)
+        await self.bounce(a2, tags=["DeathLink"], games=["Game A"])
+        self.assertEqual(set(self.received), {a2})
+        self.assertNotIn("DeathLink", self.ctx.bounce_tag_clients[0])
@@ -0,0 +1,57 @@
+import json
+import unittest
+from typing import List
+
+from SNIClient import SNESState, SNIContext, merge_snes_reads, snes_read, snes_read_many
+
+
+class FakeSNISocket:
+    """Answers GetAddress requests from memory, splitting answers in chunks like SNI does for large reads."""
+    open = True
+    closed = False
+
+    def __init__(self, ctx: SNIContext, memory: bytes) -> None:
+        self.ctx = ctx
+        self.memory = memory
+        self.requests: List[List[str]] = []
+
+    async def send(self, message: str) -> None:
+        request = json.loads(message)
+        assert request["Opcode"] == "GetAddress"
+        self.requests.append(request["Operands"])
+        address, size = (int(operand, 16) for operand in request["Operands"])
+        data = self.memory[address:address + size]
+        for start in range(0, len(data), 0x40):
+            self.ctx.snes_recv_queue.put_nowait(data[start:start + 0x40])
+
+    async def close(self) -> None:
+        self.open = False
+        self.closed = True
+
+
+class TestSNIReads(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.ctx = SNIContext("", None, None)
+        self.memory = bytes(range(256)) * 16
+        self.socket = FakeSNISocket(self.ctx, self.memory)
+        self.ctx.snes_socket = self.socket
+        self.ctx.snes_state = SNESState.SNES_ATTACHED
+
+    def test_merge_reads(self) -> None:
+        self.assertEqual(merge_snes_reads([(0x20, 4), (0x10, 4), (0x12, 8)]), [(0x10, 0x0A), (0x20, 4)])
+        self.assertEqual(merge_snes_reads([(0x20, 4), (0x10, 4)], max_gap=0x0C), [(0x10, 0x14)])
+        self.assertEqual(merge_snes_reads([(0x10, 0x20), (0x14, 2)]), [(0x10, 0x20)])
+
+    async def test_read_many(self) -> None:
+        reads = [(0x800, 0x81), (0x10, 1), (0x443, 1), (0x12, 8), (0x42E, 4), (0x10, 1)]
+        data = await snes_read_many(self.ctx, reads)
+        self.assertEqual(data, [self.memory[address:address + size] for address, size in reads])
+        self.assertEqual(self.socket.requests, [["10", "a"], ["42e", "16"], ["800", "81"]])
+        self.assertTrue(self.ctx.snes_recv_queue.empty())
+        self.assertEqual(await snes_read(self.ctx, 0x100, 0x100), self.memory[0x100:0x200])
+
+    async def test_read_detached(self) -> None:
+        self.ctx.snes_state = SNESState.SNES_DISCONNECTED
+        self.assertIsNone(await snes_read_many(self.ctx, [(0x10, 1), (0x42E, 4)]))
+        self.assertEqual(self.socket.requests, [])
+        self.assertFalse(self.ctx.snes_request_lock.locked())
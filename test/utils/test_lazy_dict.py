@@ -0,0 +1,41 @@
+import unittest
+
+from Utils import LazyDict
+
+
+class TestLazyDict(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loads = []
+        self.lazy = LazyDict({"a": 1})
+        for key, value in (("b", 2), ("c", 3)):
+            self.lazy.pending[key] = lambda key=key, value=value: self.load(key, value)
+
+    def load(self, key: str, value: int) -> None:
+        self.loads.append(key)
+        self.lazy[key] = value
+
+    def test_load_on_access(self) -> None:
+        """Verify that pending keys are loaded once, when they are accessed"""
+        self.assertIn("b", self.lazy)
+        self.assertTrue(self.lazy)
+        self.assertEqual(self.loads, [])
+        self.assertEqual(self.lazy["b"], 2)
+        self.assertEqual(self.lazy.get("b"), 2)
+        self.assertEqual(self.loads, ["b"])
+        self.assertIsNone(self.lazy.get("d"))
+        with self.assertRaises(KeyError):
+            _ = self.lazy["d"]
+
+    def test_load_on_iteration(self) -> None:
+        """Verify that iterating loads all pending keys"""
+        self.assertEqual(dict(self.lazy.items()), {"a": 1, "b": 2, "c": 3})
+        self.assertEqual(len(self.lazy), 3)
+        self.assertEqual(sorted(self.loads), ["b", "c"])
+        self.assertFalse(self.lazy.pending)
+
+    def test_failed_load(self) -> None:
+        """Verify that a loader that does not provide its key results in a KeyError"""
+        self.lazy.pending["d"] = lambda: None
+        with self.assertRaises(KeyError):
+            _ = self.lazy["d"]
+        self.assertNotIn("d", self.lazy)
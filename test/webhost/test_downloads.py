@@ -0,0 +1,108 @@
+import json
+import os
+import tempfile
+import zipfile
+from io import BytesIO
+from uuid import uuid4
+
+from flask import url_for
+
+from . import TestBase
+
+
+class TestDownloads(TestBase):
+    blob_folder: tempfile.TemporaryDirectory
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.blob_folder = tempfile.TemporaryDirectory()
+        self.original_blob_folder = self.app.config["BLOB_FOLDER"]
+        self.app.config["BLOB_FOLDER"] = self.blob_folder.name
+
+    def tearDown(self) -> None:
+        self.app.config["BLOB_FOLDER"] = self.original_blob_folder
+        self.blob_folder.cleanup()
+
+    def test_blob_deduplication(self) -> None:
+        """Verify that identical files are stored once and can be read back."""
+        from WebHostLib.blobs import blob_path, open_blob, store_blob
+
+        data = os.urandom(3 * 1024 * 1024 + 1)
+        digest = store_blob(BytesIO(data))
+        self.assertEqual(store_blob(BytesIO(data)), digest)
+        self.assertNotEqual(store_blob(BytesIO(data[1:])), digest)
+        with open_blob(digest) as f:
+            self.assertEqual(f.read(), data)
+        self.assertEqual(len(os.listdir(os.path.dirname(blob_path(digest)))), 1, "No temporary files should remain")
+
+    def test_download_patch(self) -> None:
+        """Verify that a patch in the blob store is streamed with the room's server address."""
+        from pony.orm import db_session, flush
+        from WebHostLib.blobs import store_blob
+        from WebHostLib.models import Room, Seed, Slot, SlotBlob
+
+        patch = BytesIO()
+        content = os.urandom(1024 * 1024) + b"".join(str(n).encode() for n in range(200_000))
+        with zipfile.ZipFile(patch, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("archipelago.json", json.dumps({"patch_file_ending": ".aptest", "server": ""}))
+            zf.writestr("content.bin", content)
+        patch.seek(0)
+        best_compression = BytesIO()
+        with zipfile.ZipFile(best_compression, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+            zf.writestr("content.bin", content)
+            best_compress_size = zf.getinfo("content.bin").compress_size
+
+        with db_session:
+            owner = uuid4()
+            slot = Slot(player_id=1, player_name="Player1", game="Archipelago")
+            SlotBlob(slot=slot, digest=store_blob(patch))
+            seed = Seed(multidata=b"", owner=owner, slots={slot})
+            room = Room(seed=seed, owner=owner, last_port=38281)
+            flush()
+            room_id, slot_id = room.id, slot.id
+
+        try:
+            with self.app.app_context(), self.app.test_request_context():
+                response = self.client.get(url_for("download_patch", room_id=room_id, patch_id=slot_id))
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.is_streamed)
+                self.assertIn(".aptest", response.headers["Content-Disposition"])
+                with zipfile.ZipFile(BytesIO(response.data)) as zf:
+                    manifest = json.loads(zf.read("archipelago.json"))
+                    self.assertEqual(manifest["server"], f"{self.app.config['HOST_ADDRESS']}:38281")
+                    self.assertEqual(zf.read("content.bin"), content)
+                    self.assertEqual(zf.getinfo("content.bin").compress_type, zipfile.ZIP_DEFLATED)
+                    self.assertEqual(zf.getinfo("content.bin").compress_size, best_compress_size)
+        finally:
+            with db_session:
+                room = Room.get(id=room_id)
+                room.seed.slots.select().delete(bulk=True)
+                room.seed.delete()
+                room.delete()
+
+    def test_collect_blobs(self) -> None:
+        """Verify that files of deleted slots are removed from the blob store, and referenced ones are kept."""
+        from pony.orm import db_session
+        from WebHostLib.blobs import blob_path, collect_blobs, store_blob
+        from WebHostLib.models import Slot, SlotBlob
+
+        kept = store_blob(BytesIO(b"kept"))
+        deleted = store_blob(BytesIO(b"deleted"))
+        unreferenced = store_blob(BytesIO(b"unreferenced"))
+        with db_session:
+            kept_slot = Slot(player_id=1, player_name="Player1", game="Archipelago")
+            SlotBlob(slot=kept_slot, digest=kept)
+            deleted_slot = Slot(player_id=2, player_name="Player2", game="Archipelago")
+            SlotBlob(slot=deleted_slot, digest=deleted)
+        try:
+            self.assertEqual(collect_blobs(), 0, "Files of uploads in progress should be kept")
+            self.assertEqual(collect_blobs(min_age=-1), 1)
+            self.assertFalse(os.path.exists(blob_path(unreferenced)))
+            with db_session:
+                Slot[deleted_slot.id].delete()
+            self.assertEqual(collect_blobs(min_age=-1), 1)
+            self.assertFalse(os.path.exists(blob_path(deleted)))
+            self.assertTrue(os.path.exists(blob_path(kept)))
+        finally:
+            with db_session:
+                Slot[kept_slot.id].delete()
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import pickle
+from pathlib import Path
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+from . import TestBase
+
+
+class TestHibernation(TestBase):
+    room_id: UUID
+    data: ClassVar[bytes]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        with (Path(__file__).parent / "data" / "One_Archipelago.archipelago").open("rb") as f:
+            cls.data = f.read()
+
+    def setUp(self) -> None:
+        from pony.orm import db_session
+        from MultiServer import Context as MultiServerContext
+        from WebHostLib.models import GameDataPackage, Room, Seed
+
+        super().setUp()
+
+        multidata = MultiServerContext.decompress(self.data)
+        owner = uuid4()
+        with db_session:
+            for game, game_data in multidata["datapackage"].items():
+                if not GameDataPackage.get(checksum=game_data["checksum"]):
+                    GameDataPackage(checksum=game_data["checksum"],
+                                    data=pickle.dumps(game_data))
+            seed = Seed(multidata=self.data, owner=owner)
+            room = Room(seed=seed, owner=owner)
+            self.room_id = room.id
+
+    def tearDown(self) -> None:
+        from pony.orm import db_session
+        from WebHostLib.models import Room
+
+        with db_session:
+            room: Room = Room.get(id=self.room_id)
+            room.seed.delete()
+            room.delete()
+
+    def test_hibernate_and_wake(self) -> None:
+        """Verify that a hibernated room releases its game state and gets it back from the database on wake."""
+        from WebHostLib.customserver import WebHostContext, get_static_server_data_file, load_static_server_data
+
+        async def run() -> None:
+            static_server_data = load_static_server_data(get_static_server_data_file())
+            ctx = WebHostContext(static_server_data, logging.getLogger("TestHibernation"))
+            ctx.load(self.room_id)
+            self.assertEqual(set(ctx.gamespackage), set(ctx.games.values()) | {"Archipelago"})
+            ctx.saving = True  # init_save would start threads, which can't see the in-memory test database
+            try:
+                location_id = 1
+                ctx.location_checks[0, 1].add(location_id)
+                locations = dict(ctx.locations[1])
+                item_names = dict(ctx.item_names["Archipelago"])
+
+                self.assertTrue(ctx.hibernate())
+                self.assertTrue(ctx.hibernated)
+                self.assertFalse(hasattr(ctx, "locations"))
+                self.assertFalse(ctx.location_checks)
+                self.assertFalse(ctx.item_names)
+                self.assertFalse(ctx.hibernate(), "Hibernating twice should be refused")
+
+                ctx.wake()
+                self.assertFalse(ctx.hibernated)
+                self.assertEqual(dict(ctx.locations[1]), locations)
+                self.assertIn(location_id, ctx.location_checks[0, 1])
+                self.assertEqual(dict(ctx.item_names["Archipelago"]), item_names)
+            finally:
+                ctx.exit_event.set()
+
+        asyncio.run(run())
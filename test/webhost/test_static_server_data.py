@@ -0,0 +1,20 @@
+import unittest
+
+
+class TestStaticServerData(unittest.TestCase):
+    def test_shared_file_round_trip(self) -> None:
+        """Verify that the memory mapped static server data matches the data it was written from."""
+        from WebHostLib.customserver import (SharedStaticData, get_static_server_data, get_static_server_data_file,
+                                             load_static_server_data)
+
+        data = get_static_server_data()
+        shared = load_static_server_data(get_static_server_data_file())
+        self.assertEqual(set(shared), set(data))
+        for key, value in data.items():
+            with self.subTest(key=key):
+                self.assertEqual(set(shared[key]), set(value))
+                if isinstance(shared[key], SharedStaticData):
+                    self.assertFalse(shared[key]._loaded, "Entries should only be loaded on access")
+                for game, entry in value.items():
+                    self.assertEqual(shared[key][game], entry)
+                    self.assertIs(shared[key][game], shared[key][game], "Loaded entries should be reused")
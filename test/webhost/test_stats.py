@@ -0,0 +1,101 @@
+from datetime import date
+from typing import List
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+from flask import url_for
+
+from . import TestBase
+
+
+class TestStats(TestBase):
+    room_ids: List[UUID]
+
+    def setUp(self) -> None:
+        from pony.orm import db_session
+        from WebHostLib.models import GamesPlayed
+
+        super().setUp()
+        self.room_ids = []
+        with db_session:
+            GamesPlayed.select().delete(bulk=True)
+
+    def tearDown(self) -> None:
+        from pony.orm import db_session
+        from WebHostLib.models import GamesPlayed, Room
+
+        with db_session:
+            for room_id in self.room_ids:
+                room: Room = Room.get(id=room_id)
+                room.seed.slots.select().delete(bulk=True)
+                room.seed.delete()
+                room.delete()
+            GamesPlayed.select().delete(bulk=True)
+
+    def create_room(self, *games: str) -> None:
+        from pony.orm import db_session
+        from WebHostLib.models import Seed, Slot
+
+        with self.client.session_transaction() as session:
+            session["_id"] = owner = uuid4()
+        with db_session:
+            slots = {Slot(player_id=player_id, player_name=f"Player{player_id}", game=game)
+                     for player_id, game in enumerate(games, 1)}
+            seed_id = Seed(multidata=b"", owner=owner, slots=slots).id
+        with self.app.app_context(), self.app.test_request_context():
+            response = self.client.get(url_for("new_room", seed=seed_id))
+        self.assertEqual(response.status_code, 302)
+        with db_session:
+            self.room_ids.append(Seed[seed_id].rooms.select().first().id)
+
+    def test_counted_on_room_creation(self) -> None:
+        """Verify that creating rooms updates the played games statistics."""
+        from pony.orm import db_session
+        from WebHostLib.stats import get_db_data
+
+        self.create_room("A Link to the Past", "A Link to the Past", "Clique")
+        self.create_room("Clique")
+        with db_session:
+            total_games, games_played = get_db_data({"A Link to the Past", "Clique"})
+        self.assertEqual(total_games, {"A Link to the Past": 2, "Clique": 2})
+        self.assertEqual(games_played[date.today()], {"A Link to the Past": 2, "Clique": 2})
+
+    def test_concurrently_created_row(self) -> None:
+        """Verify that a room is created and counted when another process created its row of counts first."""
+        from pony.orm import db_session
+        from WebHostLib.models import GamesPlayed
+        from WebHostLib.stats import get_db_data
+
+        self.create_room("Clique")
+        get_for_update = GamesPlayed.get_for_update
+        reads = []
+
+        def miss_first_read(**kwargs):
+            # the first read happens before the other process committed its new row
+            reads.append(kwargs)
+            return get_for_update(**kwargs) if len(reads) > 1 else None
+
+        with patch.object(GamesPlayed, "get_for_update", miss_first_read):
+            self.create_room("Clique")
+        self.assertEqual(len(reads), 2)
+        self.assertEqual(len(self.room_ids), 2)
+        with db_session:
+            total_games, _ = get_db_data({"Clique"})
+        self.assertEqual(total_games, {"Clique": 2})
+
+    def test_backfill(self) -> None:
+        """Verify that the backfill command recounts existing rooms."""
+        from pony.orm import db_session
+        from WebHostLib.models import GamesPlayed
+        from WebHostLib.stats import get_db_data
+
+        self.create_room("A Link to the Past", "Clique")
+        with db_session:
+            GamesPlayed.select().delete(bulk=True)
+        result = self.app.test_cli_runner().invoke(args=["backfill_stats"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        result = self.app.test_cli_runner().invoke(args=["backfill_stats"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with db_session:
+            total_games, _ = get_db_data({"A Link to the Past", "Clique"})
+        self.assertEqual(total_games, {"A Link to the Past": 1, "Clique": 1})
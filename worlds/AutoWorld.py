@@ -12,6 +12,8 @@ from typing import (Any, Callable, ClassVar, Dict, FrozenSet, List, Mapping, Opt
 
 from Options import item_and_loc_options, ItemsAccessibility, OptionGroup, PerGameCommonOptions
 from BaseClasses import CollectionState
+from Tracing import get_active_trace, span
+from Utils import LazyDict
 
 if TYPE_CHECKING:
     from BaseClasses import MultiWorld, Item, Location, Tutorial, Region, Entrance
@@ -22,7 +24,7 @@ perf_logger = logging.getLogger("performance")
 
 
 class AutoWorldRegister(type):
-    world_types: Dict[str, Type[World]] = {}
+    world_types: Dict[str, Type[World]] = LazyDict()
     __file__: str
     zip_path: Optional[str]
     settings_key: str
@@ -81,7 +83,8 @@ class AutoWorldRegister(type):
         # construct class
         new_class = super().__new__(mcs, name, bases, dct)
         if "game" in dct:
-            if dct["game"] in AutoWorldRegister.world_types:
+            # check without importing worlds that are still pending in lazy mode
+            if dict.__contains__(AutoWorldRegister.world_types, dct["game"]):
                 raise RuntimeError(f"""Game {dct["game"]} already registered.""")
             AutoWorldRegister.world_types[dct["game"]] = new_class
         new_class.__file__ = sys.modules[new_class.__module__].__file__
@@ -147,7 +150,16 @@ class WebWorldRegister(type):
 def _timed_call(method: Callable[..., Any], *args: Any,
                 multiworld: Optional["MultiWorld"] = None, player: Optional[int] = None) -> Any:
     start = time.perf_counter()
-    ret = method(*args)
+    trace = get_active_trace()
+    if trace:
+        if player and multiworld:
+            with trace.span(method.__name__, "world", player, multiworld.game[player]), trace.profiled(player):
+                ret = method(*args)
+        else:
+            with trace.span(method.__name__, "world", game=getattr(getattr(method, "__self__", None), "game", None)):
+                ret = method(*args)
+    else:
+        ret = method(*args)
     taken = time.perf_counter() - start
     if taken > 1.0:
         if player and multiworld:
@@ -174,6 +186,11 @@ def call_single(multiworld: "MultiWorld", method_name: str, player: int, *args:
 
 
 def call_all(multiworld: "MultiWorld", method_name: str, *args: Any) -> None:
+    with span(method_name):
+        _call_all(multiworld, method_name, *args)
+
+
+def _call_all(multiworld: "MultiWorld", method_name: str, *args: Any) -> None:
     world_types: Set[AutoWorldRegister] = set()
     for player in multiworld.player_ids:
         prev_item_count = len(multiworld.itempool)
@@ -407,6 +424,16 @@ class World(metaclass=AutoWorldRegister):
         """
         pass
 
+    def generate_output_job(self, output_directory: str) -> Optional[Callable[[], None]]:
+        """
+        Opt-in alternative to generate_output for CPU heavy output, like building and diffing a ROM.
+        Gather everything needed from the multiworld and return a picklable callable that writes the output files,
+        for example a functools.partial of a module level function. generate_output is skipped if a job is returned.
+        If output_processes is set in host.yaml, the job runs in a separate process, so it can't modify the world.
+        Like generate_output, this gets called from a threadpool.
+        """
+        return None
+
     def fill_slot_data(self) -> Mapping[str, Any]:  # json of WebHostLib.models.Slot
         """
         What is returned from this function will be in the `slot_data` field
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import abc
+import hashlib
 import json
+import mmap
 import zipfile
 from enum import IntEnum
 import os
+import struct
 import threading
 
-from typing import ClassVar, Dict, List, Literal, Tuple, Any, Optional, Union, BinaryIO, overload, Sequence
+from typing import ClassVar, Callable, Dict, List, Literal, Tuple, Any, Optional, Union, BinaryIO, overload, \
+    Sequence, Type
 
 import bsdiff4
 
@@ -206,6 +210,19 @@ class APProcedurePatch(APAutoPatchInterface):
             cls.source_data = cls.get_source_data()
         return cls.source_data
 
+    @classmethod
+    def get_source_buffer(cls) -> Union[bytes, mmap.mmap]:
+        """
+        Get base data as a read-only buffer for patching.
+        It is cached on disk by its md5 digest and memory mapped, so processes patching from the same base share its
+        memory. Close the buffer when done, mapped files can't be replaced or removed on Windows while they are open.
+        """
+        base_hash = getattr(cls, "hash", None)
+        if isinstance(base_hash, str):
+            return _map_source_data(base_hash, cls.get_source_data)
+        data = cls.get_source_data()
+        return _map_source_data(hashlib.md5(data).hexdigest(), lambda: data)
+
     def __init__(self, *args: Any, **kwargs: Any):
         super(APProcedurePatch, self).__init__(*args, **kwargs)
         self.files = {}
@@ -251,21 +268,32 @@ class APProcedurePatch(APAutoPatchInterface):
 
     def patch(self, target: str) -> None:
         self.read()
-        base_data = self.get_source_data_with_cache()
-        patch_extender = AutoPatchExtensionRegister.get_handler(self.game)
-        assert not isinstance(self.procedure, str), f"{type(self)} must define procedures"
-        for step, args in self.procedure:
-            if isinstance(patch_extender, list):
-                extension = next((item for item in [getattr(extender, step, None) for extender in patch_extender]
-                                  if item is not None), None)
-            else:
-                extension = getattr(patch_extender, step, None)
-            if extension is not None:
-                base_data = extension(self, base_data, *args)
-            else:
-                raise NotImplementedError(f"Unknown procedure {step} for {self.game}.")
-        with open(target, 'wb') as f:
-            f.write(base_data)
+        source_buffer = self.get_source_buffer()
+        try:
+            base_data: Union[bytes, bytearray, mmap.mmap] = source_buffer
+            patch_extender = AutoPatchExtensionRegister.get_handler(self.game)
+            assert not isinstance(self.procedure, str), f"{type(self)} must define procedures"
+            for step, args in self.procedure:
+                if isinstance(patch_extender, list):
+                    extension = next((item for item in [getattr(extender, step, None) for extender in patch_extender]
+                                      if item is not None), None)
+                else:
+                    extension = getattr(patch_extender, step, None)
+                if extension is not None:
+                    # steps that can work in place share one bytearray, instead of copying the rom for each step
+                    if getattr(extension, "patches_in_place", False):
+                        if not isinstance(base_data, bytearray):
+                            base_data = bytearray(base_data)
+                    elif not isinstance(base_data, bytes):
+                        base_data = bytes(base_data)
+                    base_data = extension(self, base_data, *args)
+                else:
+                    raise NotImplementedError(f"Unknown procedure {step} for {self.game}.")
+            with open(target, 'wb') as f:
+                f.write(base_data)
+        finally:
+            if isinstance(source_buffer, mmap.mmap):
+                source_buffer.close()
 
 
 class APDeltaPatch(APProcedurePatch):
@@ -286,6 +314,19 @@ class APDeltaPatch(APProcedurePatch):
         super(APDeltaPatch, self).write_contents(opened_zipfile)
 
 
+def write_delta_patch(patch_type: Type[APDeltaPatch], patched_path: str, player: int, player_name: str,
+                      keep_patched: bool = False) -> None:
+    """Write the patch_type patch for the patched file at patched_path next to it, then remove that file.
+    This is where most of the time of writing a rom patch goes, see World.generate_output_job to run it separately."""
+    import os
+
+    patch = patch_type(os.path.splitext(patched_path)[0] + patch_type.patch_file_ending, player=player,
+                       player_name=player_name, patched_path=patched_path)
+    patch.write()
+    if not keep_patched:
+        os.unlink(patched_path)
+
+
 class APTokenTypes(IntEnum):
     WRITE = 0
     COPY = 1
@@ -364,6 +405,15 @@ class APTokenMixin:
         self._tokens.append((token_type, offset, data))
 
 
+def patches_in_place(extension: Callable[..., bytes]) -> Callable[..., bytes]:
+    """
+    Marks a patch extension function as able to work in place.
+    APProcedurePatch.patch then passes the rom as a bytearray, which the function may modify and return.
+    """
+    extension.patches_in_place = True  # type: ignore[attr-defined]
+    return extension
+
+
 class APPatchExtension(metaclass=AutoPatchExtensionRegister):
     """Class that defines patch extension functions for a given game.
     Patch extension functions must have the following two arguments in the following order:
@@ -375,6 +425,7 @@ class APPatchExtension(metaclass=AutoPatchExtensionRegister):
     Further arguments are passed in from the procedure as defined.
 
     Patch extension functions must return the changed bytes.
+    Functions decorated with `patches_in_place` get a bytearray instead, that they may change and return.
     """
     game: str
     required_extensions: ClassVar[Tuple[str, ...]] = ()
@@ -385,44 +436,101 @@ class APPatchExtension(metaclass=AutoPatchExtensionRegister):
         return bsdiff4.patch(rom, caller.get_file(patch))
 
     @staticmethod
+    @patches_in_place
     def apply_tokens(caller: APProcedurePatch, rom: bytes, token_file: str) -> bytes:
         """Applies the given token file from the patch onto the current file."""
-        token_data = caller.get_file(token_file)
-        rom_data = bytearray(rom)
+        token_data = memoryview(caller.get_file(token_file))
+        rom_data = rom if isinstance(rom, bytearray) else bytearray(rom)
+        # plain ints compare a lot faster than enum members, which adds up over many tokens
+        write, copy, rle = int(APTokenTypes.WRITE), int(APTokenTypes.COPY), int(APTokenTypes.RLE)
+        and_8, or_8, xor_8 = int(APTokenTypes.AND_8), int(APTokenTypes.OR_8), int(APTokenTypes.XOR_8)
+        unpack_header = _token_header.unpack_from
         token_count = int.from_bytes(token_data[0:4], "little")
         bpr = 4
         for _ in range(token_count):
-            token_type = token_data[bpr:bpr + 1][0]
-            offset = int.from_bytes(token_data[bpr + 1:bpr + 5], "little")
-            size = int.from_bytes(token_data[bpr + 5:bpr + 9], "little")
-            data = token_data[bpr + 9:bpr + 9 + size]
-            if token_type in [APTokenTypes.AND_8, APTokenTypes.OR_8, APTokenTypes.XOR_8]:
-                arg = data[0]
-                if token_type == APTokenTypes.AND_8:
-                    rom_data[offset] = rom_data[offset] & arg
-                elif token_type == APTokenTypes.OR_8:
-                    rom_data[offset] = rom_data[offset] | arg
-                else:
-                    rom_data[offset] = rom_data[offset] ^ arg
-            elif token_type in [APTokenTypes.COPY, APTokenTypes.RLE]:
-                length = int.from_bytes(data[:4], "little")
-                value = int.from_bytes(data[4:], "little")
-                if token_type == APTokenTypes.COPY:
-                    rom_data[offset: offset + length] = rom_data[value: value + length]
+            token_type, offset, size = unpack_header(token_data, bpr)
+            bpr += 9
+            if token_type == write:
+                rom_data[offset:offset + size] = token_data[bpr:bpr + size]
+            elif token_type == and_8:
+                rom_data[offset] &= token_data[bpr]
+            elif token_type == or_8:
+                rom_data[offset] |= token_data[bpr]
+            elif token_type == xor_8:
+                rom_data[offset] ^= token_data[bpr]
+            elif token_type == copy or token_type == rle:
+                length = int.from_bytes(token_data[bpr:bpr + 4], "little")
+                value = int.from_bytes(token_data[bpr + 4:bpr + size], "little")
+                if token_type == copy:
+                    rom_data[offset:offset + length] = rom_data[value:value + length]
                 else:
-                    rom_data[offset: offset + length] = bytes([value] * length)
+                    rom_data[offset:offset + length] = bytes((value,)) * length
             else:
-                rom_data[offset:offset + len(data)] = data
-            bpr += 9 + size
-        return bytes(rom_data)
+                rom_data[offset:offset + size] = token_data[bpr:bpr + size]
+            bpr += size
+        return rom_data if rom_data is rom else bytes(rom_data)
 
     @staticmethod
+    @patches_in_place
     def calc_snes_crc(caller: APProcedurePatch, rom: bytes) -> bytes:
         """Calculates and applies a valid CRC for the SNES rom header."""
-        rom_data = bytearray(rom)
         if len(rom) < 0x8000:
             raise Exception("Tried to calculate SNES CRC on file too small to be a SNES ROM.")
-        crc = (sum(rom_data[:0x7FDC] + rom_data[0x7FE0:]) + 0x01FE) & 0xFFFF
+        numpy = _import_numpy()
+        if numpy:
+            rom_sum = int(numpy.frombuffer(rom, numpy.uint8).sum(dtype=numpy.uint64))
+        else:
+            rom_sum = sum(rom)
+        crc = (rom_sum - sum(rom[0x7FDC:0x7FE0]) + 0x01FE) & 0xFFFF
         inv = crc ^ 0xFFFF
+        rom_data = rom if isinstance(rom, bytearray) else bytearray(rom)
         rom_data[0x7FDC:0x7FE0] = [inv & 0xFF, (inv >> 8) & 0xFF, crc & 0xFF, (crc >> 8) & 0xFF]
-        return bytes(rom_data)
+        return rom_data if rom_data is rom else bytes(rom_data)
+
+
+_token_header = struct.Struct("<BII")  # type, offset, size
+
+
+def _map_source_data(key: str, get_data: Callable[[], bytes]) -> Union[bytes, mmap.mmap]:
+    """Memory map the base data cached on disk under its md5 digest key, writing the cache file with get_data first
+    if needed. Data that does not match key is never cached, so a wrong base file can't stick around.
+    Falls back to the data itself if the cache can't be used."""
+    import os
+    from Utils import cache_path
+
+    path = cache_path("base_data", key)
+    buffer = _open_source_map(path)
+    if buffer is not None:
+        if hashlib.md5(buffer).hexdigest() == key:
+            return buffer
+        buffer.close()  # written before it was checked, replace it below
+    data = get_data()
+    if not data or hashlib.md5(data).hexdigest() != key:
+        return data  # empty files can't be mapped, and the patch will report a wrong base
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        return data
+    buffer = _open_source_map(path)
+    return data if buffer is None else buffer
+
+
+def _open_source_map(path: str) -> Optional[mmap.mmap]:
+    try:
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def _import_numpy() -> Any:
+    """NumPy is optional, it is only used to speed up patching if it is installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
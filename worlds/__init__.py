@@ -1,5 +1,8 @@
+import functools
+import hashlib
 import importlib
 import importlib.util
+import json
 import logging
 import os
 import sys
@@ -7,9 +10,9 @@ import warnings
 import zipimport
 import time
 import dataclasses
-from typing import Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
-from Utils import local_path, user_path
+from Utils import LazyDict, cache_path, local_path, restricted_loads, user_path
 
 local_folder = os.path.dirname(__file__)
 user_folder = user_path("worlds") if user_path() != local_path() else user_path("custom_worlds")
@@ -27,8 +30,22 @@ __all__ = {
     "GamesPackage",
     "DataPackage",
     "failed_world_loads",
+    "lazy_world_loading",
 }
 
+# Set ARCHIPELAGO_LAZY_WORLDS=1 to only import worlds the first time their game is requested.
+# This is only supported by programs that set `lazy_worlds_supported = True` in their main module, currently the
+# generator. Everything else relies on registries filled in by importing worlds, like AutoPatchRegister,
+# AutoSNIClientRegister, BizHawk clients, launcher components and WebHost templates, so it imports all worlds.
+# Lazy loading uses a manifest of the worlds, which is written by the first lazy start and kept up to date by later ones.
+lazy_world_loading: bool = False
+if os.environ.get("ARCHIPELAGO_LAZY_WORLDS", "0") not in ("", "0"):
+    lazy_world_loading = getattr(sys.modules.get("__main__"), "lazy_worlds_supported", False)
+    if not lazy_world_loading:
+        logging.warning("ARCHIPELAGO_LAZY_WORLDS is only supported by the generator, importing all worlds.")
+manifest_version = 1
+data_package_cache_version = 1
+
 
 failed_world_loads: List[str] = []
 
@@ -51,6 +68,7 @@ class WorldSource:
     is_zip: bool = False
     relative: bool = True  # relative to regular world import folder
     time_taken: float = -1.0
+    loaded: Optional[bool] = dataclasses.field(default=None, compare=False)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.path}, is_zip={self.is_zip}, relative={self.relative})"
@@ -61,7 +79,37 @@ class WorldSource:
             return os.path.join(local_folder, self.path)
         return self.path
 
+    @property
+    def module_name(self) -> str:
+        return f"worlds.{os.path.basename(self.path).rsplit('.', 1)[0]}"
+
+    @functools.cached_property
+    def mtime(self) -> float:
+        """Latest modification time of any file belonging to this world"""
+        if self.is_zip:
+            return os.stat(self.resolved_path).st_mtime
+        mtime = os.stat(self.resolved_path).st_mtime
+        for root, dirs, files in os.walk(self.resolved_path):
+            dirs[:] = [directory for directory in dirs if directory != "__pycache__"]
+            for file in files:
+                mtime = max(mtime, os.stat(os.path.join(root, file)).st_mtime)
+        return mtime
+
+    @functools.cached_property
+    def cache_key(self) -> str:
+        """Identifies the current version of this world for caches"""
+        if self.is_zip:
+            with open(self.resolved_path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        return repr(self.mtime)
+
     def load(self) -> bool:
+        if self.loaded is not None:
+            return self.loaded
+        self.loaded = self._load()
+        return self.loaded
+
+    def _load(self) -> bool:
         try:
             start = time.perf_counter()
             if self.is_zip:
@@ -115,15 +163,169 @@ for folder in (folder for folder in (user_folder, local_folder) if folder):
             elif entry.is_file() and entry.name.endswith(".apworld"):
                 world_sources.append(WorldSource(file_name, is_zip=True, relative=relative))
 
-# import all submodules to trigger AutoWorldRegister
+
+class WorldManifestEntry(TypedDict):
+    module: str
+    checksum: str
+    item_ids: Optional[List[int]]  # lowest and highest id
+    location_ids: Optional[List[int]]
+
+
+def _id_range(ids: Dict[str, int]) -> Optional[List[int]]:
+    return [min(ids.values()), max(ids.values())] if ids else None
+
+
+@functools.lru_cache(maxsize=None)
+def get_core_key() -> str:
+    """Identifies the Archipelago version and core files, which world data depends on as well,
+    for example through the default name groups of AutoWorld."""
+    from Utils import __version__
+
+    mtime = 0.0
+    for folder in (local_path(), local_folder):
+        for entry in os.scandir(folder):
+            if entry.name.endswith((".py", ".pyc")) and entry.is_file():
+                mtime = max(mtime, entry.stat().st_mtime)
+    return f"{__version__} {mtime!r}"
+
+
+def read_manifest() -> Dict[str, Any]:
+    """Returns the cached manifest of world sources by resolved path, or an empty dict if there is no valid one."""
+    try:
+        with open(cache_path("worlds", "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == manifest_version and manifest.get("core") == get_core_key():
+            return manifest["sources"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def write_manifest(sources: Dict[str, Any]) -> None:
+    path = cache_path("worlds", "manifest.json")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": manifest_version, "core": get_core_key(), "sources": sources}, f)
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:  # not being able to cache is not fatal
+        logging.debug(f"Could not write world manifest: {e}")
+
+
+def read_data_package_cache() -> Dict[str, Any]:
+    """Returns the cached data packages by resolved world source path, or an empty dict if there are none."""
+    try:
+        with open(cache_path("worlds", "datapackage.pickle"), "rb") as f:
+            cache = restricted_loads(f.read())
+        if cache.get("version") == data_package_cache_version and cache.get("core") == get_core_key():
+            return cache["sources"]
+    except Exception:  # missing, unreadable or from an incompatible version, rebuild
+        pass
+    return {}
+
+
+def write_data_package_cache(sources: Dict[str, Any]) -> None:
+    import pickle
+
+    path = cache_path("worlds", "datapackage.pickle")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump({"version": data_package_cache_version, "core": get_core_key(), "sources": sources}, f,
+                        pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:  # not being able to cache is not fatal
+        logging.debug(f"Could not write data package cache: {e}")
+
+
+# import all submodules to trigger AutoWorldRegister, unless they can be imported on demand
+from .AutoWorld import AutoWorldRegister
+
 world_sources.sort()
+# checking the manifest is up to date means going through all files of all worlds, so it is only used when lazy
+manifest = read_manifest() if lazy_world_loading else {}
 for world_source in world_sources:
-    world_source.load()
+    entry = manifest.get(world_source.resolved_path)
+    if entry and entry["mtime"] == world_source.mtime:
+        for game in entry["games"]:
+            AutoWorldRegister.world_types.pending[game] = world_source.load
+    else:
+        world_source.load()
 
-# Build the data package for each game.
-from .AutoWorld import AutoWorldRegister
+# Data packages of unchanged worlds are reused from the previous lazy start, saving the sorting and hashing.
+data_package_cache = read_data_package_cache() if lazy_world_loading else {}
+cached_packages: Dict[str, GamesPackage] = {}
+for world_source in world_sources:
+    cached_source = data_package_cache.get(world_source.resolved_path)
+    if cached_source and cached_source["key"] == world_source.cache_key:
+        cached_packages.update(cached_source["games"])
+
+
+def _get_games_package(game: str, world: "AutoWorldRegister") -> GamesPackage:
+    package = cached_packages.get(game)
+    # ids are cheap to compare and catch worlds that build their data from outside their own source,
+    # order matters as it is part of the checksum
+    if package and list(package["item_name_to_id"].items()) == list(world.item_name_to_id.items()) \
+            and list(package["location_name_to_id"].items()) == list(world.location_name_to_id.items()):
+        return package
+    return world.get_data_package_data()
+
+
+def _load_games_package(game: str) -> None:
+    games_packages[game] = AutoWorldRegister.world_types[game].get_data_package_data()
+
+
+# Build the data package for each game, lazily for worlds that were not imported yet.
+games_packages: Dict[str, GamesPackage] = LazyDict({
+    world_name: _get_games_package(world_name, world)
+    for world_name, world in dict.items(AutoWorldRegister.world_types)
+})
+for game in AutoWorldRegister.world_types.pending:
+    if game in cached_packages:
+        games_packages[game] = cached_packages[game]
+    else:
+        games_packages.pending[game] = functools.partial(_load_games_package, game)
 
 network_data_package: DataPackage = {
-    "games": {world_name: world.get_data_package_data() for world_name, world in AutoWorldRegister.world_types.items()},
+    "games": games_packages,
 }
 
+# Update the manifest and data package cache with worlds that were imported during this lazy start.
+if lazy_world_loading:
+    sources_by_module = {world_source.module_name: world_source for world_source in world_sources}
+    updated_sources: Dict[str, Dict[str, Any]] = {}
+    updated_packages: Dict[str, Dict[str, Any]] = {}
+    for world_name, world in dict.items(AutoWorldRegister.world_types):
+        world_source = sources_by_module.get(".".join(world.__module__.split(".", 2)[:2]))
+        if not world_source:
+            continue
+        package_entry = updated_packages.setdefault(world_source.resolved_path,
+                                                    {"key": world_source.cache_key, "games": {}})
+        package_entry["games"][world_name] = games_packages[world_name]
+        source_entry = updated_sources.setdefault(world_source.resolved_path,
+                                                  {"mtime": world_source.mtime, "games": {}})
+        source_entry["games"][world_name] = WorldManifestEntry(
+            module=world.__module__,
+            checksum=games_packages[world_name]["checksum"],
+            item_ids=_id_range(world.item_name_to_id),
+            location_ids=_id_range(world.location_name_to_id),
+        )
+    known_paths = {world_source.resolved_path for world_source in world_sources}
+    if (any(manifest.get(path) != source_entry for path, source_entry in updated_sources.items())
+            or not known_paths.issuperset(manifest)):
+        manifest = {path: source_entry for path, source_entry in manifest.items() if path in known_paths}
+        manifest.update(updated_sources)
+        write_manifest(manifest)
+    packages_changed = not known_paths.issuperset(data_package_cache)
+    for path, package_entry in updated_packages.items():
+        cached_source = data_package_cache.get(path)
+        if not cached_source or cached_source["key"] != package_entry["key"] or any(
+                cached_source["games"].get(game) is not package for game, package in package_entry["games"].items()):
+            packages_changed = True
+    if packages_changed:
+        data_package_cache = {path: package_entry for path, package_entry in data_package_cache.items()
+                              if path in known_paths}
+        data_package_cache.update(updated_packages)
+        write_data_package_cache(data_package_cache)
+    del sources_by_module, updated_sources, updated_packages, known_paths, packages_changed
+del manifest, data_package_cache
@@ -7,6 +7,7 @@ naively passed to BizHawk without validation or modification.
 
 import asyncio
 import base64
+import collections
 import enum
 import json
 import sys
@@ -47,46 +48,76 @@ class BizHawkContext:
     streams: typing.Optional[typing.Tuple[asyncio.StreamReader, asyncio.StreamWriter]]
     connection_status: ConnectionStatus
     _lock: asyncio.Lock
+    _read_lock: asyncio.Lock
+    _pending: typing.Deque["asyncio.Future[bytes]"]
+    _read_futures: typing.Dict[typing.Hashable, "asyncio.Future[typing.Optional[typing.List[bytes]]]"]
     _port: typing.Optional[int]
 
     def __init__(self) -> None:
         self.streams = None
         self.connection_status = ConnectionStatus.NOT_CONNECTED
         self._lock = asyncio.Lock()
+        self._read_lock = asyncio.Lock()
+        self._pending = collections.deque()
+        self._read_futures = {}
         self._port = None
 
+    def _fail_pending(self, reason: str, cause: typing.Optional[BaseException] = None) -> None:
+        """Fails every message still waiting for a response with a RequestFailedError."""
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                exc = RequestFailedError(reason)
+                exc.__cause__ = cause
+                future.set_exception(exc)
+
+    def _connection_lost(self, writer: asyncio.StreamWriter, reason: str,
+                         cause: typing.Optional[BaseException] = None) -> None:
+        writer.close()
+        if self.streams is not None and self.streams[1] is writer:
+            self.streams = None
+            self.connection_status = ConnectionStatus.NOT_CONNECTED
+        self._fail_pending(reason, cause)
+
     async def _send_message(self, message: str):
-        async with self._lock:
-            if self.streams is None:
-                raise NotConnectedError("You tried to send a request before a connection to BizHawk was made")
+        """Sends message and returns the connector's response to it.
+
+        Messages don't wait for the response to the previous one before being sent, so several can be in flight at
+        once. The connector answers messages in the order it received them, so responses are handed to the waiting
+        messages in the order they were sent."""
+        if self.streams is None:
+            raise NotConnectedError("You tried to send a request before a connection to BizHawk was made")
 
-            try:
-                reader, writer = self.streams
+        reader, writer = self.streams
+        response: "asyncio.Future[bytes]" = asyncio.get_running_loop().create_future()
+        try:
+            async with self._lock:
                 writer.write(message.encode("utf-8") + b"\n")
+                self._pending.append(response)
                 await asyncio.wait_for(writer.drain(), timeout=5)
 
-                res = await asyncio.wait_for(reader.readline(), timeout=5)
+            # whoever holds the read lock reads responses for everyone that sent before them, until their own arrives
+            async with self._read_lock:
+                while not response.done():
+                    res = await asyncio.wait_for(reader.readline(), timeout=5)
 
-                if res == b"":
-                    writer.close()
-                    self.streams = None
-                    self.connection_status = ConnectionStatus.NOT_CONNECTED
-                    raise RequestFailedError("Connection closed")
+                    if res == b"":
+                        self._connection_lost(writer, "Connection closed")
+                        break
 
-                if self.connection_status == ConnectionStatus.TENTATIVE:
-                    self.connection_status = ConnectionStatus.CONNECTED
+                    future = self._pending.popleft()
+                    if not future.done():  # the sender may have been cancelled
+                        future.set_result(res)
+        except asyncio.TimeoutError as exc:
+            self._connection_lost(writer, "Connection timed out", exc)
+        except ConnectionResetError as exc:
+            self._connection_lost(writer, "Connection reset", exc)
 
-                return res.decode("utf-8")
-            except asyncio.TimeoutError as exc:
-                writer.close()
-                self.streams = None
-                self.connection_status = ConnectionStatus.NOT_CONNECTED
-                raise RequestFailedError("Connection timed out") from exc
-            except ConnectionResetError as exc:
-                writer.close()
-                self.streams = None
-                self.connection_status = ConnectionStatus.NOT_CONNECTED
-                raise RequestFailedError("Connection reset") from exc
+        res = response.result()  # raises RequestFailedError if the connection was lost
+        if self.connection_status == ConnectionStatus.TENTATIVE:
+            self.connection_status = ConnectionStatus.CONNECTED
+
+        return res.decode("utf-8")
 
 
 async def connect(ctx: BizHawkContext) -> bool:
@@ -116,6 +147,7 @@ def disconnect(ctx: BizHawkContext) -> None:
         ctx.streams[1].close()
         ctx.streams = None
     ctx.connection_status = ConnectionStatus.NOT_CONNECTED
+    ctx._fail_pending("Disconnected")
 
 
 async def get_script_version(ctx: BizHawkContext) -> int:
@@ -126,6 +158,9 @@ async def send_requests(ctx: BizHawkContext, req_list: typing.List[typing.Dict[s
     """Sends a list of requests to the BizHawk connector and returns their responses.
 
     It's likely you want to use the wrapper functions instead of this."""
+    if any(req["type"] not in ("GUARD", "READ") for req in req_list):
+        # memory may change from here on, later reads can't share the result of reads already in flight
+        ctx._read_futures.clear()
     responses = json.loads(await ctx._send_message(json.dumps(req_list)))
     errors: typing.List[ConnectorError] = []
 
@@ -239,7 +274,44 @@ async def guarded_read(ctx: BizHawkContext, read_list: typing.Sequence[typing.Tu
     - `domain` is the name of the region of memory the address corresponds to
 
     Returns None if any item in guard_list failed to validate. Otherwise returns a list of bytes in the order they
-    were requested."""
+    were requested.
+
+    An identical read that is still waiting for its response shares that response instead of being sent again, so
+    polling the same memory from several places costs one request."""
+    key = (tuple((address, size, domain) for address, size, domain in read_list),
+           tuple((address, bytes(expected_data), domain) for address, expected_data, domain in guard_list))
+    shared = ctx._read_futures.get(key)
+    if shared is not None:
+        try:
+            ret = await asyncio.shield(shared)
+        except asyncio.CancelledError:
+            if not shared.cancelled():
+                raise
+            # the caller that sent the read was cancelled, send it again
+        else:
+            return None if ret is None else list(ret)
+
+    shared = asyncio.get_running_loop().create_future()
+    ctx._read_futures[key] = shared
+    try:
+        ret = await _guarded_read(ctx, read_list, guard_list)
+    except asyncio.CancelledError:
+        shared.cancel()
+        raise
+    except BaseException as exc:
+        shared.set_exception(exc)
+        shared.exception()  # only raised to callers that shared the read, don't log it as never retrieved
+        raise
+    else:
+        shared.set_result(ret)
+    finally:
+        if ctx._read_futures.get(key) is shared:
+            del ctx._read_futures[key]
+    return None if ret is None else list(ret)
+
+
+async def _guarded_read(ctx: BizHawkContext, read_list: typing.Sequence[typing.Tuple[int, int, str]],
+                        guard_list: typing.Sequence[typing.Tuple[int, typing.Sequence[int], str]]) -> typing.Optional[typing.List[bytes]]:
     res = await send_requests(ctx, [{
         "type": "GUARD",
         "address": address,
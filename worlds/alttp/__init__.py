@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import random
@@ -7,6 +8,7 @@ import typing
 import settings
 from BaseClasses import Item, CollectionState, Tutorial, MultiWorld
 from worlds.AutoWorld import World, WebWorld, LogicMixin
+from worlds.Files import write_delta_patch
 from .Client import ALTTPSNIClient
 from .Dungeons import create_dungeons, Dungeon
 from .EntranceShuffle import link_entrances, link_inverted_entrances, plando_connect
@@ -551,6 +553,9 @@ class ALTTPWorld(World):
                     or self.options.killable_thieves)
 
     def generate_output(self, output_directory: str):
+        self.generate_output_job(output_directory)()
+
+    def generate_output_job(self, output_directory: str):
         multiworld = self.multiworld
         player = self.player
 
@@ -596,11 +601,10 @@ class ALTTPWorld(World):
 
             rompath = os.path.join(output_directory, f"{self.multiworld.get_out_file_name_base(self.player)}.sfc")
             rom.write_to_file(rompath)
-            patch = LttPDeltaPatch(os.path.splitext(rompath)[0]+LttPDeltaPatch.patch_file_ending, player=player,
-                                   player_name=multiworld.player_name[player], patched_path=rompath)
-            patch.write()
-            os.unlink(rompath)
             self.rom_name = rom.name
+            # diffing against the base rom is the slow part, so that is left to the output job
+            return functools.partial(write_delta_patch, LttPDeltaPatch, rompath, player,
+                                     multiworld.player_name[player])
         except:
             raise
         finally:
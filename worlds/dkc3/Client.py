@@ -20,11 +20,13 @@ ROMHASH_SIZE = 0x15
 DKC3_RECV_PROGRESS_ADDR = WRAM_START + 0x632
 DKC3_FILE_NAME_ADDR = WRAM_START + 0x5D9
 DEATH_LINK_ACTIVE_ADDR = DKC3_ROMNAME_START + 0x15     # DKC3_TODO: Find a permanent home for this
+DKC3_BOOMER_COST_ADDR = ROM_START + 0x349857
 
 
 class DKC3SNIClient(SNIClient):
     game = "Donkey Kong Country 3"
     patch_suffix = ".apdkc3"
+    boomer_cost: int = 0
 
     async def deathlink_kill_player(self, ctx):
         pass
@@ -32,16 +34,20 @@ class DKC3SNIClient(SNIClient):
 
 
     async def validate_rom(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read_many
 
-        rom_name = await snes_read(ctx, DKC3_ROMHASH_START, ROMHASH_SIZE)
-        if rom_name is None or rom_name == bytes([0] * ROMHASH_SIZE) or rom_name[:2] != b"D3":
+        read_data = await snes_read_many(ctx, [(DKC3_ROMHASH_START, ROMHASH_SIZE), (DKC3_BOOMER_COST_ADDR, 1)])
+        if read_data is None:
+            return False
+        rom_name, boomer_cost = read_data
+        if rom_name == bytes([0] * ROMHASH_SIZE) or rom_name[:2] != b"D3":
             return False
 
         ctx.game = self.game
         ctx.items_handling = 0b111  # remote items
 
         ctx.rom = rom_name
+        self.boomer_cost = boomer_cost[0]
 
         #death_link = await snes_read(ctx, DEATH_LINK_ACTIVE_ADDR, 1)
         ## DKC3_TODO: Handle Deathlink
@@ -52,16 +58,16 @@ class DKC3SNIClient(SNIClient):
 
 
     async def game_watcher(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read, snes_read_many
         # DKC3_TODO: Handle Deathlink
-        save_file_name = await snes_read(ctx, DKC3_FILE_NAME_ADDR, 0x5)
+        read_data = await snes_read_many(ctx, [(DKC3_FILE_NAME_ADDR, 0x5), (WRAM_START + 0x5FE, 0x81)])
+        save_file_name, location_ram_data = read_data if read_data is not None else (None, None)
         if save_file_name is None or save_file_name[0] == 0x00 or save_file_name == bytes([0x55] * 0x05):
             # We haven't loaded a save file
             return
 
         new_checks = []
         from .Rom import location_rom_data, item_rom_data, boss_location_ids, level_unlock_map
-        location_ram_data = await snes_read(ctx, WRAM_START + 0x5FE, 0x81)
         for loc_id, loc_data in location_rom_data.items():
             if loc_id not in ctx.locations_checked:
                 data = location_ram_data[loc_data[0] - 0x5FE]
@@ -72,13 +78,14 @@ class DKC3SNIClient(SNIClient):
                     # DKC3_TODO: Handle non-included checks
                     new_checks.append(loc_id)
 
-        verify_save_file_name = await snes_read(ctx, DKC3_FILE_NAME_ADDR, 0x5)
+        read_data = await snes_read_many(ctx, [(DKC3_FILE_NAME_ADDR, 0x5), (DKC3_ROMHASH_START, ROMHASH_SIZE),
+                                               (DKC3_RECV_PROGRESS_ADDR, 1)])
+        verify_save_file_name, rom, recv_count = read_data if read_data is not None else (None, None, None)
         if verify_save_file_name is None or verify_save_file_name[0] == 0x00 or verify_save_file_name == bytes([0x55] * 0x05) or verify_save_file_name != save_file_name:
             # We have somehow exited the save file (or worse)
             ctx.rom = None
             return
 
-        rom = await snes_read(ctx, DKC3_ROMHASH_START, ROMHASH_SIZE)
         if rom != ctx.rom:
             ctx.rom = None
             # We have somehow loaded a different ROM
@@ -92,7 +99,6 @@ class DKC3SNIClient(SNIClient):
             await ctx.send_msgs([{"cmd": 'LocationChecks', "locations": [new_check_id]}])
 
         # DKC3_TODO: Make this actually visually display new things received (ASM Hook required)
-        recv_count = await snes_read(ctx, DKC3_RECV_PROGRESS_ADDR, 1)
         recv_index = recv_count[0]
 
         if recv_index < len(ctx.items_received):
@@ -181,8 +187,10 @@ class DKC3SNIClient(SNIClient):
             await snes_flush_writes(ctx)
 
         # Handle Collected Locations
-        levels_to_tiles = await snes_read(ctx, ROM_START + 0x3FF800, 0x60)
-        tiles_to_levels = await snes_read(ctx, ROM_START + 0x3FF860, 0x60)
+        read_data = await snes_read_many(ctx, [(ROM_START + 0x3FF800, 0x60), (ROM_START + 0x3FF860, 0x60)])
+        if read_data is None:
+            return
+        levels_to_tiles, tiles_to_levels = read_data
         for loc_id in ctx.checked_locations:
             if loc_id not in ctx.locations_checked and loc_id not in boss_location_ids:
                 loc_data = location_rom_data[loc_id]
@@ -213,18 +221,18 @@ class DKC3SNIClient(SNIClient):
                 ctx.locations_checked.add(loc_id)
 
         # Calculate Boomer Cost Text
-        boomer_cost_text = await snes_read(ctx, WRAM_START + 0xAAFD, 2)
+        read_data = await snes_read_many(ctx, [(WRAM_START + 0xAAFD, 2), (WRAM_START + 0xAB9B, 2)])
+        if read_data is None:
+            return
+        boomer_cost_text, boomer_final_cost_text = read_data
         if boomer_cost_text[0] == 0x31 and boomer_cost_text[1] == 0x35:
-            boomer_cost = await snes_read(ctx, ROM_START + 0x349857, 1)
-            boomer_cost_tens = int(boomer_cost[0]) // 10
-            boomer_cost_ones = int(boomer_cost[0]) % 10
+            boomer_cost_tens = self.boomer_cost // 10
+            boomer_cost_ones = self.boomer_cost % 10
             snes_buffered_write(ctx, WRAM_START + 0xAAFD, bytes([0x30 + boomer_cost_tens, 0x30 + boomer_cost_ones]))
             await snes_flush_writes(ctx)
 
-        boomer_final_cost_text = await snes_read(ctx, WRAM_START + 0xAB9B, 2)
         if boomer_final_cost_text[0] == 0x32 and boomer_final_cost_text[1] == 0x35:
-            boomer_cost = await snes_read(ctx, ROM_START + 0x349857, 1)
-            boomer_cost_tens = boomer_cost[0] // 10
-            boomer_cost_ones = boomer_cost[0] % 10
+            boomer_cost_tens = self.boomer_cost // 10
+            boomer_cost_ones = self.boomer_cost % 10
             snes_buffered_write(ctx, WRAM_START + 0xAB9B, bytes([0x30 + boomer_cost_tens, 0x30 + boomer_cost_ones]))
             await snes_flush_writes(ctx)
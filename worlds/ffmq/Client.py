@@ -76,11 +76,11 @@ class FFMQClient(SNIClient):
         return True
 
     async def game_watcher(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read, snes_read_many
 
-        check_1 = await snes_read(ctx, 0xF53749, 6)
-        received = await snes_read(ctx, RECEIVED_DATA[0], RECEIVED_DATA[1])
-        data = await snes_read(ctx, READ_DATA_START, READ_DATA_END - READ_DATA_START)
+        read_data = await snes_read_many(ctx, [(0xF53749, 6), RECEIVED_DATA,
+                                               (READ_DATA_START, READ_DATA_END - READ_DATA_START)])
+        check_1, received, data = read_data if read_data is not None else (None, None, None)
         check_2 = await snes_read(ctx, 0xF53749, 6)
         if not validate_read_state(check_1, check_2):
             return
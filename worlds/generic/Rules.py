@@ -31,6 +31,53 @@ def locality_needed(multiworld: MultiWorld) -> bool:
             return True
 
 
+class LocalityTable:
+    """
+    The restrictions of local_items and non_local_items as bit sets, so fill can test an item against many locations
+    at once instead of calling each location's item_rule. Each forbidden item name of an item player gets a bit,
+    and each location player has a mask of them per item player.
+    """
+    item_bits: typing.Dict[int, typing.Dict[str, int]]
+    """item player -> item name -> bit"""
+    forbidden: typing.Dict[int, typing.Dict[int, int]]
+    """location player -> item player -> bit set of the items that may not be placed in the location player's world"""
+    locality_only_rules: typing.Set[ItemRule]
+    """item_rules that check nothing but locality, so blocked_players tells all about them"""
+
+    def __init__(self, forbid_data: typing.Mapping[int, typing.Mapping[int, typing.Set[str]]]) -> None:
+        self.item_bits = {}
+        for blockers in forbid_data.values():
+            for item_player, item_names in blockers.items():
+                bits = self.item_bits.setdefault(item_player, {})
+                for item_name in sorted(item_names):
+                    bits.setdefault(item_name, 1 << len(bits))
+        self.forbidden = {
+            location_player: {item_player: sum(self.item_bits[item_player][item_name] for item_name in item_names)
+                              for item_player, item_names in blockers.items() if item_names}
+            for location_player, blockers in forbid_data.items()
+        }
+        self.locality_only_rules = set()
+        self._blocked_players: typing.Dict[typing.Tuple[int, str], typing.FrozenSet[int]] = {}
+
+    def item_bit(self, item: "BaseClasses.Item") -> int:
+        return self.item_bits.get(item.player, {}).get(item.name, 0)
+
+    def allows(self, location_player: int, item: "BaseClasses.Item") -> bool:
+        """If item may be placed in a location of location_player, as far as locality is concerned."""
+        return not self.forbidden.get(location_player, {}).get(item.player, 0) & self.item_bit(item)
+
+    def blocked_players(self, item: "BaseClasses.Item") -> typing.FrozenSet[int]:
+        """The players in whose locations item may not be placed."""
+        key = item.player, item.name
+        blocked = self._blocked_players.get(key)
+        if blocked is None:
+            bit = self.item_bit(item)
+            blocked = self._blocked_players[key] = frozenset(
+                location_player for location_player, forbidden in self.forbidden.items()
+                if forbidden.get(item.player, 0) & bit)
+        return blocked
+
+
 def locality_rules(multiworld: MultiWorld):
     if locality_needed(multiworld):
 
@@ -63,6 +110,8 @@ def locality_rules(multiworld: MultiWorld):
                     if sending_player in receiving_group["players"]:
                         forbid(sending_player, receiving_group_id, receiving_group["non_local_items"])
 
+        multiworld.locality = locality = LocalityTable(forbid_data)
+
         # create fewer lambda's to save memory and cache misses
         func_cache = {}
         for location in multiworld.get_locations():
@@ -74,6 +123,7 @@ def locality_rules(multiworld: MultiWorld):
                     lambda i, sending_blockers = forbid_data[location.player], \
                                             old_rule = location.item_rule: \
                     i.name not in sending_blockers[i.player]
+                locality.locality_only_rules.add(location.item_rule)
             # special rule, needs to also be fulfilled.
             else:
                 func_cache[location.player, location.item_rule] = location.item_rule = \
@@ -261,14 +261,23 @@ class KDL3SNIClient(SNIClient):
 
     async def game_watcher(self, ctx: "SNIContext") -> None:
         try:
-            from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
-            rom = await snes_read(ctx, KDL3_ROMNAME, 0x15)
+            from SNIClient import snes_buffered_write, snes_flush_writes, snes_read, snes_read_many
+            # read what this tick needs in two round trips, the second for what depends on the current save
+            read_data = await snes_read_many(ctx, [
+                (KDL3_ROMNAME, 0x15), (KDL3_HALKEN, 6), (KDL3_NINTEN, 6), (KDL3_IS_DEMO, 1), (KDL3_GAME_SAVE, 1),
+                (KDL3_GOAL_ADDR, 1), (KDL3_CURRENT_BGM, 1), (KDL3_GAME_STATE, 1), (KDL3_KIRBY_HP, 1),
+                (KDL3_CURRENT_WORLD, 2), (KDL3_CURRENT_LEVEL, 2), (KDL3_RECV_COUNT, 2), (KDL3_GIFTING_FLAG, 1),
+                (KDL3_GIFTING_SEND, 1), (KDL3_WORLD_UNLOCK, 1), (KDL3_COMPLETED_STAGES, 60), (KDL3_HEART_STARS, 35),
+                (KDL3_BOSS_STATUS, 2)])
+            if read_data is None:
+                return
+            (rom, halken, ninten, is_demo, current_save, goal, current_bgm, game_state, current_hp, current_world_data,
+             current_level_data, recv_count, gifting_status, gift, world_unlocks, stages_raw, heart_stars,
+             boss_flag_bytes) = read_data
             if rom != ctx.rom:
                 ctx.rom = None
-            halken = await snes_read(ctx, KDL3_HALKEN, 6)
             if halken != b"halken":
                 return
-            ninten = await snes_read(ctx, KDL3_NINTEN, 6)
             if ninten != b"ninten":
                 return
             if not ctx.slot:
@@ -282,8 +291,8 @@ class KDL3SNIClient(SNIClient):
             # can't check debug anymore, without going and copying the value. might be important later.
             if not self.levels:
                 self.levels = dict()
-                for i in range(5):
-                    level_data = await snes_read(ctx, KDL3_LEVEL_ADDR + (14 * i), 14)
+                levels_data = await snes_read_many(ctx, [(KDL3_LEVEL_ADDR + (14 * i), 14) for i in range(5)])
+                for i, level_data in enumerate(levels_data):
                     self.levels[i] = [int.from_bytes(level_data[idx:idx+1], "little")
                                       for idx in range(0, len(level_data), 2)]
                 self.levels[5] = [0x0205,  # Hyper Zone
@@ -298,15 +307,22 @@ class KDL3SNIClient(SNIClient):
             if self.stars is None:
                 stars = await snes_read(ctx, KDL3_STARS_FLAG, 1)
                 self.stars = stars[0] == 0x01
-            is_demo = await snes_read(ctx, KDL3_IS_DEMO, 1)
             # 1 - recording a demo, 2 - playing back recorded, 3+ is a demo
             if is_demo[0] > 0x00:
                 return
-            current_save = await snes_read(ctx, KDL3_GAME_SAVE, 1)
-            goal = await snes_read(ctx, KDL3_GOAL_ADDR, 1)
-            boss_butch_status = await snes_read(ctx, KDL3_BOSS_BUTCH_STATUS + (current_save[0] * 2), 1)
-            mg5_status = await snes_read(ctx, KDL3_MG5_STATUS + (current_save[0] * 2), 1)
-            jumping_status = await snes_read(ctx, KDL3_JUMPING_STATUS + (current_save[0] * 2), 1)
+            save_reads = [(KDL3_BOSS_BUTCH_STATUS + (current_save[0] * 2), 1),
+                          (KDL3_MG5_STATUS + (current_save[0] * 2), 1),
+                          (KDL3_JUMPING_STATUS + (current_save[0] * 2), 1)]
+            if self.consumables:
+                save_reads.append((KDL3_CONSUMABLES, 1920))
+            if self.stars:
+                save_reads.append((KDL3_STARS, 1920))
+            read_data = await snes_read_many(ctx, save_reads)
+            if read_data is None:
+                return
+            boss_butch_status, mg5_status, jumping_status = read_data[:3]
+            consumables = read_data[3] if self.consumables else None
+            stars = read_data[-1] if self.stars else None
             if boss_butch_status[0] == 0xFF:
                 return  # save file is not created, ignore
             if (goal[0] == 0x00 and boss_butch_status[0] == 0x01) \
@@ -315,19 +331,15 @@ class KDL3SNIClient(SNIClient):
                     or (goal[0] == 0x03 and jumping_status[0] == 0x03):
                 await ctx.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
                 ctx.finished_game = True
-            current_bgm = await snes_read(ctx, KDL3_CURRENT_BGM, 1)
             if current_bgm[0] in (0x00, 0x21, 0x22, 0x23, 0x25, 0x2A, 0x2B):
                 return  # null, title screen, opening, save select, true and false endings
-            game_state = await snes_read(ctx, KDL3_GAME_STATE, 1)
             if "DeathLink" in ctx.tags and game_state[0] == 0x00 and ctx.last_death_link + 1 < time.time():
-                current_hp = await snes_read(ctx, KDL3_KIRBY_HP, 1)
-                current_world = struct.unpack("H", await snes_read(ctx, KDL3_CURRENT_WORLD, 2))[0]
-                current_level = struct.unpack("H", await snes_read(ctx, KDL3_CURRENT_LEVEL, 2))[0]
+                current_world = struct.unpack("H", current_world_data)[0]
+                current_level = struct.unpack("H", current_level_data)[0]
                 currently_dead = current_hp[0] == 0x00
                 message = deathlink_messages[self.levels[current_world][current_level]]
                 await ctx.handle_deathlink_state(currently_dead, f"{ctx.player_names[ctx.slot]}{message}")
 
-            recv_count = await snes_read(ctx, KDL3_RECV_COUNT, 2)
             recv_amount = unpack("H", recv_count)[0]
             if recv_amount < len(ctx.items_received):
                 item = ctx.items_received[recv_amount]
@@ -350,10 +362,8 @@ class KDL3SNIClient(SNIClient):
                     self.item_queue.append(item_idx | 0x80)
 
             # handle gifts here
-            gifting_status = await snes_read(ctx, KDL3_GIFTING_FLAG, 0x01)
             if hasattr(ctx, "gifting") and ctx.gifting:
                 if gifting_status[0]:
-                    gift = await snes_read(ctx, KDL3_GIFTING_SEND, 0x01)
                     if gift[0]:
                         # we have a gift to send
                         await self.pick_gift_recipient(ctx, gift[0])
@@ -368,10 +378,8 @@ class KDL3SNIClient(SNIClient):
 
             new_checks = []
             # level completion status
-            world_unlocks = await snes_read(ctx, KDL3_WORLD_UNLOCK, 1)
             if world_unlocks[0] > 0x06:
                 return  # save is not loaded, ignore
-            stages_raw = await snes_read(ctx, KDL3_COMPLETED_STAGES, 60)
             stages = struct.unpack("HHHHHHHHHHHHHHHHHHHHHHHHHHHHHH", stages_raw)
             for i in range(30):
                 loc_id = 0x770000 + i
@@ -381,7 +389,6 @@ class KDL3SNIClient(SNIClient):
                     snes_buffered_write(ctx, KDL3_COMPLETED_STAGES + (i * 2), struct.pack("H", 1))
 
             # heart star status
-            heart_stars = await snes_read(ctx, KDL3_HEART_STARS, 35)
             for i in range(5):
                 start_ind = i * 7
                 for j in range(6):
@@ -392,14 +399,12 @@ class KDL3SNIClient(SNIClient):
                     elif loc_id in ctx.checked_locations:
                         snes_buffered_write(ctx, KDL3_HEART_STARS + level_ind, bytes([0x01]))
             if self.consumables:
-                consumables = await snes_read(ctx, KDL3_CONSUMABLES, 1920)
                 for consumable in consumable_addrs:
                     # TODO: see if this can be sped up in any way
                     loc_id = 0x770300 + consumable
                     if loc_id not in ctx.checked_locations and consumables[consumable_addrs[consumable]] == 0x01:
                         new_checks.append(loc_id)
             if self.stars:
-                stars = await snes_read(ctx, KDL3_STARS, 1920)
                 for star in star_addrs:
                     if star not in ctx.checked_locations and stars[star_addrs[star]] == 0x01:
                         new_checks.append(star)
@@ -413,7 +418,6 @@ class KDL3SNIClient(SNIClient):
             await snes_flush_writes(ctx)
 
             # boss status
-            boss_flag_bytes = await snes_read(ctx, KDL3_BOSS_STATUS, 2)
             boss_flag = int.from_bytes(boss_flag_bytes, "little")
             for bitmask, boss in zip(range(1, 11, 2), boss_locations.keys()):
                 if boss_flag & (1 << bitmask) > 0 and boss not in ctx.checked_locations:
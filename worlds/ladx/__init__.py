@@ -1,5 +1,6 @@
 import binascii
 import dataclasses
+import functools
 import os
 import pkgutil
 import tempfile
@@ -11,6 +12,7 @@ import settings
 from BaseClasses import Entrance, Item, ItemClassification, Location, Tutorial, MultiWorld
 from Fill import fill_restrictive
 from worlds.AutoWorld import WebWorld, World
+from worlds.Files import write_delta_patch
 from .Common import *
 from .Items import (DungeonItemData, DungeonItemType, ItemName, LinksAwakeningItem, TradeItemData,
                     ladxr_item_to_la_item_name, links_awakening_items, links_awakening_items_by_name)
@@ -445,6 +447,9 @@ class LinksAwakeningWorld(World):
             raise FileNotFoundError(rom_file)
 
     def generate_output(self, output_directory: str):
+        self.generate_output_job(output_directory)()
+
+    def generate_output_job(self, output_directory: str):
         # copy items back to locations
         for r in self.multiworld.get_regions(self.player):
             for loc in r.locations:
@@ -489,11 +494,9 @@ class LinksAwakeningWorld(World):
             bsdiff4.file_patch_inplace(out_path, title_patch.name)
             os.unlink(title_patch.name)
 
-        patch = LADXDeltaPatch(os.path.splitext(out_path)[0]+LADXDeltaPatch.patch_file_ending, player=self.player,
-                               player_name=self.player_name, patched_path=out_path)
-        patch.write()
-        if not DEVELOPER_MODE:
-            os.unlink(out_path)
+        # diffing against the base rom is the slow part, so that is left to the output job
+        return functools.partial(write_delta_patch, LADXDeltaPatch, out_path, self.player, self.player_name,
+                                 keep_patched=DEVELOPER_MODE)
 
     def generate_multi_key(self):
         return bytearray(self.random.getrandbits(8) for _ in range(10)) + self.player.to_bytes(2, 'big')
@@ -47,9 +47,16 @@ class L2ACSNIClient(SNIClient):
         return True
 
     async def game_watcher(self, ctx: SNIContext) -> None:
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read, snes_read_many
 
-        rom: Optional[bytes] = await snes_read(ctx, L2AC_ROMNAME_START, 0x15)
+        # everything this tick needs, in one round trip
+        read_data: Optional[List[bytes]] = await snes_read_many(ctx, [
+            (L2AC_ROMNAME_START, 0x15), (L2AC_SIGN_ADDR, 16), (L2AC_TX_ADDR + 16, 16), (L2AC_GOAL_ADDR, 10),
+            (L2AC_DEATH_ADDR, 3), (L2AC_TX_ADDR, 12), (L2AC_RX_ADDR, 4)])
+        if read_data is None:
+            ctx.rom = None
+            return
+        rom, signature, uuid_data, goal_data, death_data, tx_data, rx_data = read_data
         if rom != ctx.rom:
             ctx.rom = None
             return
@@ -58,14 +65,9 @@ class L2ACSNIClient(SNIClient):
             # not successfully connected to a multiworld server, cannot process the game sending items
             return
 
-        signature: Optional[bytes] = await snes_read(ctx, L2AC_SIGN_ADDR, 16)
         if signature != b"ArchipelagoLufia":
             return
 
-        uuid_data: Optional[bytes] = await snes_read(ctx, L2AC_TX_ADDR + 16, 16)
-        if uuid_data is None:
-            return
-
         coop_uuid: uuid.UUID = uuid.UUID(bytes=uuid_data)
         if coop_uuid.version != 4:
             coop_uuid = uuid.uuid4()
@@ -76,13 +78,11 @@ class L2ACSNIClient(SNIClient):
 
         # Goal
         if not ctx.finished_game:
-            goal_data: Optional[bytes] = await snes_read(ctx, L2AC_GOAL_ADDR, 10)
             if goal_data is not None and goal_data[goal_data[0]] == 0x01:
                 await ctx.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
                 ctx.finished_game = True
 
         # DeathLink TX
-        death_data: Optional[bytes] = await snes_read(ctx, L2AC_DEATH_ADDR, 3)
         if death_data is not None:
             await ctx.update_death_link(bool(death_data[0]))
             if death_data[1] != 0x00:
@@ -93,7 +93,6 @@ class L2ACSNIClient(SNIClient):
                     await ctx.send_death(f"{player_name} was totally defeated by {enemy_name}.")
 
         # TX
-        tx_data: Optional[bytes] = await snes_read(ctx, L2AC_TX_ADDR, 12)
         if tx_data is not None:
             snes_blue_chests_checked: int = int.from_bytes(tx_data[:2], "little")
             snes_ap_items_found: int = int.from_bytes(tx_data[6:8], "little")
@@ -137,7 +136,6 @@ class L2ACSNIClient(SNIClient):
                 snes_buffered_write(ctx, L2AC_TX_ADDR + 4, client_ap_items_found.to_bytes(2, "little"))
 
         # RX
-        rx_data: Optional[bytes] = await snes_read(ctx, L2AC_RX_ADDR, 4)
         if rx_data is not None:
             snes_items_received = int.from_bytes(rx_data[:2], "little")
 
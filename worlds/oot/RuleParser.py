@@ -30,6 +30,15 @@ kwarg_defaults = {
 
 allowed_globals = {'TimeOfDay': TimeOfDay}
 
+# Parsed rules don't depend on the player, who is a keyword arg of the generated lambdas,
+# so rules are shared between all OoT worlds of the process, and only bound to each player.
+# rule string -> [(settings and spot read while parsing with the values they had, ast dump, events added)]
+parsed_rules = defaultdict(list)
+# ast dump -> code of the lambda, evaluated with a player's globals to bind it
+compiled_rules = {}
+missing = object()
+immutable_types = (str, int, float, type(None), tuple, frozenset)
+
 rule_aliases = {}
 nonaliases = set()
 
@@ -50,6 +59,10 @@ def isliteral(expr):
     return isinstance(expr, (ast.Num, ast.Str, ast.Bytes, ast.NameConstant))
 
 
+def player_arg():
+    return ast.Name(id='player', ctx=ast.Load())
+
+
 class Rule_AST_Transformer(ast.NodeTransformer):
 
     def __init__(self, world, player):
@@ -67,10 +80,54 @@ class Rule_AST_Transformer(ast.NodeTransformer):
         self.rule_cache = {}
         self.kwarg_defaults = kwarg_defaults.copy()  # otherwise this gets contaminated between players
         self.kwarg_defaults['player'] = self.player
+        # the defaults of the kwargs are looked up in here when binding a compiled rule
+        self.rule_globals = {**allowed_globals, **self.kwarg_defaults}
+        # what the rule being parsed depends on, None outside of parse_rule
+        self._reads = None
+        self._added_events = None
+        self._shareable = False
+
+    def _read_setting(self, name):
+        value = self.world.__dict__.get(name, missing)
+        if self._reads is not None:
+            self._reads.append(('setting', name, value))
+        return value
+
+    def _spot_region_name(self):
+        region = self.current_spot if type(self.current_spot) == OOTRegion else self.current_spot.parent_region
+        if self._reads is not None:
+            self._reads.append(('region', None, region.name))
+        return region.name
+
+    def _spot_type(self):
+        if self._reads is not None:
+            self._reads.append(('type', None, self.current_spot.type))
+        return self.current_spot.type
+
+    def _add_event(self, event):
+        self.events.add(event)
+        if self._added_events is not None:
+            self._added_events.append(event)
+
+    def _reads_match(self, reads):
+        for kind, name, value in reads:
+            if kind == 'setting':
+                current = self.world.__dict__.get(name, missing)
+            elif kind == 'region':
+                current = (self.current_spot if type(self.current_spot) == OOTRegion
+                           else self.current_spot.parent_region).name
+            else:
+                current = self.current_spot.type
+            if current is not value and current != value:
+                return False
+        return True
 
 
     def visit_Name(self, node):
-        if node.id in dir(self):
+        if node.id in self.kwarg_defaults:
+            # already visited, like the player arg of generated calls
+            return node
+        elif node.id in dir(self):
             return getattr(self, node.id)(node)
         elif node.id in rule_aliases:
             args, repl = rule_aliases[node.id]
@@ -84,23 +141,23 @@ class Rule_AST_Transformer(ast.NodeTransformer):
                     value=ast.Name(id='state', ctx=ast.Load()),
                     attr='has',
                     ctx=ast.Load()),
-                args=[ast.Str(escaped_items[node.id]), ast.Constant(self.player)],
+                args=[ast.Str(escaped_items[node.id]), player_arg()],
                 keywords=[])
-        elif node.id in self.world.__dict__:
+        elif (setting := self._read_setting(node.id)) is not missing:
             # Settings are constant
-            return ast.parse('%r' % self.world.__dict__[node.id], mode='eval').body
+            return ast.parse('%r' % setting, mode='eval').body
         elif node.id in State.__dict__:
             return self.make_call(node, node.id, [], [])
-        elif node.id in self.kwarg_defaults or node.id in allowed_globals:
+        elif node.id in allowed_globals:
             return node
         elif event_name.match(node.id):
-            self.events.add(node.id.replace('_', ' '))
+            self._add_event(node.id.replace('_', ' '))
             return ast.Call(
                 func=ast.Attribute(
                     value=ast.Name(id='state', ctx=ast.Load()),
                     attr='has',
                     ctx=ast.Load()),
-                args=[ast.Str(node.id.replace('_', ' ')), ast.Constant(self.player)],
+                args=[ast.Str(node.id.replace('_', ' ')), player_arg()],
                 keywords=[])
         else:
             raise Exception('Parse Error: invalid node name %s' % node.id, self.current_spot.name, ast.dump(node, False))
@@ -111,7 +168,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
                 value=ast.Name(id='state', ctx=ast.Load()),
                 attr='has',
                 ctx=ast.Load()),
-            args=[ast.Str(node.s), ast.Constant(self.player)],
+            args=[ast.Str(node.s), player_arg()],
             keywords=[])
 
     # python 3.8 compatibility: ast walking now uses visit_Constant for Constant subclasses
@@ -137,20 +194,20 @@ class Rule_AST_Transformer(ast.NodeTransformer):
 
         if isinstance(count, ast.Name):
             # Must be a settings constant
-            count = ast.parse('%r' % self.world.__dict__[count.id], mode='eval').body
+            count = ast.parse('%r' % self._read_setting(count.id), mode='eval').body
 
         if iname in escaped_items:
             iname = escaped_items[iname]
 
         if iname not in item_table:
-            self.events.add(iname)
+            self._add_event(iname)
 
         return ast.Call(
             func=ast.Attribute(
                 value=ast.Name(id='state', ctx=ast.Load()),
                 attr='has',
                 ctx=ast.Load()),
-            args=[ast.Str(iname), ast.Constant(self.player), count],
+            args=[ast.Str(iname), player_arg(), count],
             keywords=[])
 
 
@@ -182,7 +239,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
         new_args = []
         for child in node.args:
             if isinstance(child, ast.Name):
-                if child.id in self.world.__dict__:
+                if (setting := self._read_setting(child.id)) is not missing:
                     # child = ast.Attribute(
                     #     value=ast.Attribute(
                     #         value=ast.Name(id='state', ctx=ast.Load()),
@@ -190,7 +247,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
                     #         ctx=ast.Load()),
                     #     attr=child.id,
                     #     ctx=ast.Load())
-                    child = ast.Constant(getattr(self.world, child.id))
+                    child = ast.Constant(setting)
                 elif child.id in rule_aliases:
                     child = self.visit(child)
                 elif child.id in escaped_items:
@@ -221,7 +278,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
                                 ctx=ast.Load()),
                             attr='worlds',
                             ctx=ast.Load()),
-                        slice=ast.Index(value=ast.Constant(self.player)),
+                        slice=ast.Index(value=player_arg()),
                         ctx=ast.Load()),
                     attr=node.value.id,
                     ctx=ast.Load()),
@@ -242,7 +299,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
         # Fast check for json can_use
         if (len(node.ops) == 1 and isinstance(node.ops[0], ast.Eq)
                 and isinstance(node.left, ast.Name) and isinstance(node.comparators[0], ast.Name)
-                and node.left.id not in self.world.__dict__ and node.comparators[0].id not in self.world.__dict__):
+                and self._read_setting(node.left.id) is missing and self._read_setting(node.comparators[0].id) is missing):
             return ast.NameConstant(node.left.id == node.comparators[0].id)
 
         node.left = escape_or_string(node.left)
@@ -325,7 +382,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
                     value=ast.Name(id='state', ctx=ast.Load()),
                     attr='has_any' if early_return else 'has_all',
                     ctx=ast.Load()),
-                args=[ast.Tuple(elts=[ast.Str(i) for i in items], ctx=ast.Load()), ast.Constant(self.player)],
+                args=[ast.Tuple(elts=[ast.Str(i) for i in items], ctx=ast.Load()), player_arg()],
                 keywords=[])] + new_values
         else:
             node.values = new_values
@@ -342,7 +399,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
             raise Exception('Parse Error: No such function State.%s' % name, self.current_spot.name, ast.dump(node, False))
 
         for (k, v) in self.kwarg_defaults.items():
-            keywords.append(ast.keyword(arg=f'{k}', value=ast.Constant(v)))
+            keywords.append(ast.keyword(arg=f'{k}', value=ast.Name(id=k, ctx=ast.Load())))
 
         return ast.Call(
             func=ast.Attribute(
@@ -354,6 +411,8 @@ class Rule_AST_Transformer(ast.NodeTransformer):
 
 
     def replace_subrule(self, target, node):
+        # subrules become events of this world, which other players can't share
+        self._shareable = False
         rule = ast.dump(node, False)
         if rule in self.replaced_rules[target]:
             return self.replaced_rules[target][rule]
@@ -367,7 +426,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
                 value=ast.Name(id='state', ctx=ast.Load()),
                 attr='has',
                 ctx=ast.Load()),
-            args=[ast.Str(subrule_name), ast.Constant(self.player)],
+            args=[ast.Str(subrule_name), player_arg()],
             keywords=[])
         # Cache the subrule for any others in this region
         # (and reserve the item name in the process)
@@ -400,26 +459,28 @@ class Rule_AST_Transformer(ast.NodeTransformer):
         self.delayed_rules.clear()
 
 
-    def make_access_rule(self, body):
-        rule_str = ast.dump(body, False)
+    def make_access_rule(self, body, rule_str=None):
+        if rule_str is None:
+            rule_str = ast.dump(body, False)
         if rule_str not in self.rule_cache:
-            # requires consistent iteration on dicts
-            kwargs = [ast.arg(arg=k) for k in self.kwarg_defaults.keys()]
-            kwd = list(map(ast.Constant, self.kwarg_defaults.values()))
             try:
-                self.rule_cache[rule_str] = eval(compile(
-                    ast.fix_missing_locations(
-                        ast.Expression(ast.Lambda(
-                            args=ast.arguments(
-                                posonlyargs=[],
-                                args=[ast.arg(arg='state')],
-                                defaults=[],
-                                kwonlyargs=kwargs,
-                                kw_defaults=kwd),
-                            body=body))),
-                    '<string>', 'eval'),
-                    # globals/locals. if undefined, everything in the namespace *now* would be allowed
-                    allowed_globals)
+                if rule_str not in compiled_rules:
+                    # requires consistent iteration on dicts
+                    kwargs = [ast.arg(arg=k) for k in self.kwarg_defaults.keys()]
+                    kwd = [ast.Name(id=k, ctx=ast.Load()) for k in self.kwarg_defaults.keys()]
+                    compiled_rules[rule_str] = compile(
+                        ast.fix_missing_locations(
+                            ast.Expression(ast.Lambda(
+                                args=ast.arguments(
+                                    posonlyargs=[],
+                                    args=[ast.arg(arg='state')],
+                                    defaults=[],
+                                    kwonlyargs=kwargs,
+                                    kw_defaults=kwd),
+                                body=body))),
+                        '<string>', 'eval')
+                # globals/locals. if undefined, everything in the namespace *now* would be allowed
+                self.rule_cache[rule_str] = eval(compiled_rules[rule_str], self.rule_globals)
             except TypeError as e:
                 raise Exception('Parse Error: %s' % e, self.current_spot.name, ast.dump(body, False))
         return self.rule_cache[rule_str]
@@ -448,30 +509,30 @@ class Rule_AST_Transformer(ast.NodeTransformer):
     ## Handlers for compile-time optimizations (former State functions)
 
     def at_day(self, node):
-        if self.world.ensure_tod_access:
+        if self._read_setting('ensure_tod_access'):
             # tod has DAY or (tod == NONE and (ss or find a path from a provider))
             # parsing is better than constructing this expression by hand
-            r = self.current_spot if type(self.current_spot) == OOTRegion else self.current_spot.parent_region
-            return ast.parse(f"(state.has('Ocarina', player) and state.has('Suns Song', player)) or state._oot_reach_at_time('{r.name}', TimeOfDay.DAY, [], player)", mode='eval').body
+            region_name = self._spot_region_name()
+            return ast.parse(f"(state.has('Ocarina', player) and state.has('Suns Song', player)) or state._oot_reach_at_time('{region_name}', TimeOfDay.DAY, [], player)", mode='eval').body
         return ast.NameConstant(True)
 
     def at_dampe_time(self, node):
-        if self.world.ensure_tod_access:
+        if self._read_setting('ensure_tod_access'):
             # tod has DAMPE or (tod == NONE and (find a path from a provider))
             # parsing is better than constructing this expression by hand
-            r = self.current_spot if type(self.current_spot) == OOTRegion else self.current_spot.parent_region
-            return ast.parse(f"state._oot_reach_at_time('{r.name}', TimeOfDay.DAMPE, [], player)", mode='eval').body
+            region_name = self._spot_region_name()
+            return ast.parse(f"state._oot_reach_at_time('{region_name}', TimeOfDay.DAMPE, [], player)", mode='eval').body
         return ast.NameConstant(True)
 
     def at_night(self, node):
-        if self.current_spot.type == 'GS Token' and self.world.logic_no_night_tokens_without_suns_song:
+        if self._spot_type() == 'GS Token' and self._read_setting('logic_no_night_tokens_without_suns_song'):
             # Using visit here to resolve 'can_play' rule
             return self.visit(ast.parse('can_play(Suns_Song)', mode='eval').body)
-        if self.world.ensure_tod_access:
+        if self._read_setting('ensure_tod_access'):
             # tod has DAMPE or (tod == NONE and (ss or find a path from a provider))
             # parsing is better than constructing this expression by hand
-            r = self.current_spot if type(self.current_spot) == OOTRegion else self.current_spot.parent_region
-            return ast.parse(f"(state.has('Ocarina', player) and state.has('Suns Song', player)) or state._oot_reach_at_time('{r.name}', TimeOfDay.DAMPE, [], player)", mode='eval').body
+            region_name = self._spot_region_name()
+            return ast.parse(f"(state.has('Ocarina', player) and state.has('Suns Song', player)) or state._oot_reach_at_time('{region_name}', TimeOfDay.DAMPE, [], player)", mode='eval').body
         return ast.NameConstant(True)
 
 
@@ -479,7 +540,26 @@ class Rule_AST_Transformer(ast.NodeTransformer):
     # If spot is None, here() rules won't work.
     def parse_rule(self, rule_string, spot=None):
         self.current_spot = spot
-        return self.make_access_rule(self.visit(ast.parse(rule_string, mode='eval').body))
+        # reuse the parse of any player for whom the settings and spot it read were the same
+        for reads, rule_str, events in parsed_rules[rule_string]:
+            if self._reads_match(reads):
+                self.events.update(events)
+                return self.make_access_rule(None, rule_str)
+
+        self._reads, self._added_events, self._shareable = [], [], True
+        try:
+            body = self.visit(ast.parse(rule_string, mode='eval').body)
+            reads, events, shareable = self._reads, self._added_events, self._shareable
+        finally:
+            self._reads = self._added_events = None
+        rule_str = ast.dump(body, False)
+        access_rule = self.make_access_rule(body, rule_str)
+        # settings that can change in place can't be compared to those of other players later
+        if shareable and all(value is missing or isinstance(value, immutable_types) for _, _, value in reads):
+            # a setting is read once per mention, and can't change within a parse
+            reads = tuple({(kind, name): (kind, name, value) for kind, name, value in reads}.values())
+            parsed_rules[rule_string].append((reads, rule_str, tuple(events)))
+        return access_rule
 
     def parse_spot_rule(self, spot):
         rule = spot.rule_string.split('#', 1)[0].strip()
@@ -493,21 +573,21 @@ class Rule_AST_Transformer(ast.NodeTransformer):
 
     # Hijacking functions
     def current_spot_child_access(self, node): 
-        r = self.current_spot if type(self.current_spot) == OOTRegion else self.current_spot.parent_region
-        return ast.parse(f"state._oot_reach_as_age('{r.name}', 'child', {self.player})", mode='eval').body
+        region_name = self._spot_region_name()
+        return ast.parse(f"state._oot_reach_as_age('{region_name}', 'child', player)", mode='eval').body
 
     def current_spot_adult_access(self, node): 
-        r = self.current_spot if type(self.current_spot) == OOTRegion else self.current_spot.parent_region
-        return ast.parse(f"state._oot_reach_as_age('{r.name}', 'adult', {self.player})", mode='eval').body
+        region_name = self._spot_region_name()
+        return ast.parse(f"state._oot_reach_as_age('{region_name}', 'adult', player)", mode='eval').body
 
     def current_spot_starting_age_access(self, node): 
-        return self.current_spot_child_access(node) if self.world.starting_age == 'child' else self.current_spot_adult_access(node)
+        return self.current_spot_child_access(node) if self._read_setting('starting_age') == 'child' else self.current_spot_adult_access(node)
 
     def has_bottle(self, node): 
-        return ast.parse(f"state._oot_has_bottle({self.player})", mode='eval').body
+        return ast.parse("state._oot_has_bottle(player)", mode='eval').body
 
     def can_live_dmg(self, node):
-        return ast.parse(f"state._oot_can_live_dmg({self.player}, {node.args[0].value})", mode='eval').body
+        return ast.parse(f"state._oot_can_live_dmg(player, {node.args[0].value})", mode='eval').body
 
     def region_has_shortcuts(self, node):
-        return ast.parse(f"state._oot_region_has_shortcuts({self.player}, '{node.args[0].value}')", mode='eval').body
+        return ast.parse(f"state._oot_region_has_shortcuts(player, '{node.args[0].value}')", mode='eval').body
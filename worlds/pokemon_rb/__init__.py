@@ -18,7 +18,7 @@ from .regions import create_regions
 from .options import PokemonRBOptions
 from .rom_addresses import rom_addresses
 from .text import encode_text
-from .rom import generate_output, get_base_rom_bytes, get_base_rom_path, RedDeltaPatch, BlueDeltaPatch
+from .rom import generate_output, generate_output_job, get_base_rom_bytes, get_base_rom_path, RedDeltaPatch, BlueDeltaPatch
 from .pokemon import process_pokemon_data, process_move_data, verify_hm_moves
 from .encounters import process_pokemon_locations, process_trainer_data
 from .rules import set_rules
@@ -589,6 +589,9 @@ class PokemonRedBlueWorld(World):
     def generate_output(self, output_directory: str):
         generate_output(self, output_directory)
 
+    def generate_output_job(self, output_directory: str):
+        return generate_output_job(self, output_directory)
+
     def modify_multidata(self, multidata: dict):
         rom_name = bytearray(f'AP{__version__.replace(".", "")[0:3]}_{self.player}_{self.multiworld.seed:11}\0',
                              'utf8')[:21]
@@ -1,9 +1,10 @@
+import functools
 import os
 import hashlib
 import Utils
 import bsdiff4
 import pkgutil
-from worlds.Files import APDeltaPatch
+from worlds.Files import APDeltaPatch, write_delta_patch
 from .text import encode_text
 from .items import item_table
 from .pokemon import set_mon_palettes
@@ -237,6 +238,10 @@ def write_quizzes(world, data, random):
 
 
 def generate_output(world, output_directory: str):
+    generate_output_job(world, output_directory)()
+
+
+def generate_output_job(world, output_directory: str):
     random = world.random
     game_version = world.options.game_version.current_key
     data = bytes(get_base_rom_bytes(game_version))
@@ -663,15 +668,10 @@ def generate_output(world, output_directory: str):
     rompath = os.path.join(output_directory, f'AP_{world.multiworld.seed_name}{outfilepname}.gb')
     with open(rompath, 'wb') as outfile:
         outfile.write(data)
-    if world.options.game_version.current_key == "red":
-        patch = RedDeltaPatch(os.path.splitext(rompath)[0] + RedDeltaPatch.patch_file_ending, player=world.player,
-                              player_name=world.multiworld.player_name[world.player], patched_path=rompath)
-    else:
-        patch = BlueDeltaPatch(os.path.splitext(rompath)[0] + BlueDeltaPatch.patch_file_ending, player=world.player,
-                               player_name=world.multiworld.player_name[world.player], patched_path=rompath)
-
-    patch.write()
-    os.unlink(rompath)
+    # diffing against the base rom is the slow part, so that is left to the output job
+    patch_type = RedDeltaPatch if world.options.game_version.current_key == "red" else BlueDeltaPatch
+    return functools.partial(write_delta_patch, patch_type, rompath, world.player,
+                             world.multiworld.player_name[world.player])
 
 
 def write_bytes(data, byte_array, address):
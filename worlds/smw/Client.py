@@ -150,36 +150,37 @@ class SMWSNIClient(SNIClient):
 
 
     async def handle_message_queue(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read_many
 
         if not hasattr(self, "message_queue") or len(self.message_queue) == 0:
             return
 
-        game_state = await snes_read(ctx, SMW_GAME_STATE_ADDR, 0x1)
+        read_data = await snes_read_many(ctx, [(SMW_GAME_STATE_ADDR, 0x1), (SMW_MARIO_STATE_ADDR, 0x1),
+                                               (SMW_MESSAGE_BOX_ADDR, 0x1), (SMW_PAUSE_ADDR, 0x1),
+                                               (SMW_CURRENT_LEVEL_ADDR, 0x1), (SMW_BOSS_STATE_ADDR, 0x1),
+                                               (SMW_ACTIVE_BOSS_ADDR, 0x1)])
+        if read_data is None:
+            return
+        game_state, mario_state, message_box, pause_state, current_level, boss_state, active_boss = read_data
+
         if game_state[0] != 0x14:
             return
 
-        mario_state = await snes_read(ctx, SMW_MARIO_STATE_ADDR, 0x1)
         if mario_state[0] != 0x00:
             return
 
-        message_box = await snes_read(ctx, SMW_MESSAGE_BOX_ADDR, 0x1)
         if message_box[0] != 0x00:
             return
 
-        pause_state = await snes_read(ctx, SMW_PAUSE_ADDR, 0x1)
         if pause_state[0] != 0x00:
             return
 
-        current_level = await snes_read(ctx, SMW_CURRENT_LEVEL_ADDR, 0x1)
         if current_level[0] in SMW_BAD_TEXT_BOX_LEVELS:
             return
 
-        boss_state = await snes_read(ctx, SMW_BOSS_STATE_ADDR, 0x1)
         if boss_state[0] in SMW_BOSS_STATES:
             return
 
-        active_boss = await snes_read(ctx, SMW_ACTIVE_BOSS_ADDR, 0x1)
         if active_boss[0] != 0x00:
             return
 
@@ -204,20 +205,23 @@ class SMWSNIClient(SNIClient):
 
 
     async def handle_trap_queue(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read, snes_read_many
 
         if not hasattr(self, "trap_queue") or len(self.trap_queue) == 0:
             return
 
-        game_state = await snes_read(ctx, SMW_GAME_STATE_ADDR, 0x1)
+        read_data = await snes_read_many(ctx, [(SMW_GAME_STATE_ADDR, 0x1), (SMW_MARIO_STATE_ADDR, 0x1),
+                                               (SMW_PAUSE_ADDR, 0x1)])
+        if read_data is None:
+            return
+        game_state, mario_state, pause_state = read_data
+
         if game_state[0] != 0x14:
             return
 
-        mario_state = await snes_read(ctx, SMW_MARIO_STATE_ADDR, 0x1)
         if mario_state[0] != 0x00:
             return
 
-        pause_state = await snes_read(ctx, SMW_PAUSE_ADDR, 0x1)
         if pause_state[0] != 0x00:
             return
 
@@ -274,18 +278,20 @@ class SMWSNIClient(SNIClient):
 
 
     async def game_watcher(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read, snes_read_many
         
-        boss_state = await snes_read(ctx, SMW_BOSS_STATE_ADDR, 0x1)
-        game_state = await snes_read(ctx, SMW_GAME_STATE_ADDR, 0x1)
-        mario_state = await snes_read(ctx, SMW_MARIO_STATE_ADDR, 0x1)
-        if game_state is None:
+        read_data = await snes_read_many(ctx, [(SMW_BOSS_STATE_ADDR, 0x1), (SMW_GAME_STATE_ADDR, 0x1),
+                                               (SMW_MARIO_STATE_ADDR, 0x1), (SMW_CURRENT_LEVEL_ADDR, 0x1),
+                                               (SMW_GOAL_DATA, 0x1), (SMW_MESSAGE_BOX_ADDR, 0x1),
+                                               (SMW_EGG_COUNT_ADDR, 0x1), (SMW_REQUIRED_EGGS_DATA, 0x1),
+                                               (SMW_BOSS_COUNT_ADDR, 0x1), (SMW_BONUS_STAR_ADDR, 0x1)])
+        if read_data is None:
             # We're not properly connected
             return
-        elif game_state[0] >= 0x18:
+        boss_state, game_state, mario_state, current_level, goal, message_box, egg_count, required_egg_count, \
+            boss_count, display_count = read_data
+        if game_state[0] >= 0x18:
             if not ctx.finished_game:
-                current_level = await snes_read(ctx, SMW_CURRENT_LEVEL_ADDR, 0x1)
-
                 if current_level[0] in SMW_GOAL_LEVELS:
                     await ctx.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
                     ctx.finished_game = True
@@ -304,13 +310,7 @@ class SMWSNIClient(SNIClient):
             await ctx.handle_deathlink_state(currently_dead)
 
         # Check for Egg Hunt ending
-        goal = await snes_read(ctx, SMW_GOAL_DATA, 0x1)
         if game_state[0] == 0x14 and goal[0] == 1:
-            current_level = await snes_read(ctx, SMW_CURRENT_LEVEL_ADDR, 0x1)
-            message_box = await snes_read(ctx, SMW_MESSAGE_BOX_ADDR, 0x1)
-            egg_count = await snes_read(ctx, SMW_EGG_COUNT_ADDR, 0x1)
-            required_egg_count = await snes_read(ctx, SMW_REQUIRED_EGGS_DATA, 0x1)
-
             if current_level[0] == 0x28 and message_box[0] == 0x01 and egg_count[0] >= required_egg_count[0]:
                 snes_buffered_write(ctx, WRAM_START + 0x13C6, bytes([0x08]))
                 snes_buffered_write(ctx, WRAM_START + 0x13CE, bytes([0x01]))
@@ -320,10 +320,6 @@ class SMWSNIClient(SNIClient):
                 await snes_flush_writes(ctx)
                 return
 
-        egg_count     = await snes_read(ctx, SMW_EGG_COUNT_ADDR, 0x1)
-        boss_count    = await snes_read(ctx, SMW_BOSS_COUNT_ADDR, 0x1)
-        display_count = await snes_read(ctx, SMW_BONUS_STAR_ADDR, 0x1)
-
         if goal[0] == 0 and boss_count[0] > display_count[0]:
             snes_buffered_write(ctx, SMW_BONUS_STAR_ADDR, bytes([boss_count[0]]))
             await snes_flush_writes(ctx)
@@ -335,20 +331,28 @@ class SMWSNIClient(SNIClient):
         await self.handle_trap_queue(ctx)
 
         new_checks = []
-        event_data = await snes_read(ctx, SMW_EVENT_ROM_DATA, 0x60)
-        progress_data = bytearray(await snes_read(ctx, SMW_PROGRESS_DATA, 0x0F))
-        dragon_coins_data = bytearray(await snes_read(ctx, SMW_DRAGON_COINS_DATA, 0x0C))
-        dragon_coins_active = await snes_read(ctx, SMW_DRAGON_COINS_ACTIVE_ADDR, 0x1)
-        moon_data = bytearray(await snes_read(ctx, SMW_MOON_DATA, 0x0C))
-        moon_active = await snes_read(ctx, SMW_MOON_ACTIVE_ADDR, 0x1)
-        hidden_1up_data = bytearray(await snes_read(ctx, SMW_HIDDEN_1UP_DATA, 0x0C))
-        hidden_1up_active = await snes_read(ctx, SMW_HIDDEN_1UP_ACTIVE_ADDR, 0x1)
-        bonus_block_data = bytearray(await snes_read(ctx, SMW_BONUS_BLOCK_DATA, 0x0C))
-        bonus_block_active = await snes_read(ctx, SMW_BONUS_BLOCK_ACTIVE_ADDR, 0x1)
-        blocksanity_data = bytearray(await snes_read(ctx, SMW_BLOCKSANITY_DATA, SMW_BLOCKSANITY_BLOCK_COUNT))
-        blocksanity_flags = bytearray(await snes_read(ctx, SMW_BLOCKSANITY_FLAGS, 0xC))
-        blocksanity_active = await snes_read(ctx, SMW_BLOCKSANITY_ACTIVE_ADDR, 0x1)
-        level_clear_flags = bytearray(await snes_read(ctx, SMW_LEVEL_CLEAR_FLAGS, 0x60))
+        read_data = await snes_read_many(ctx, [
+            (SMW_EVENT_ROM_DATA, 0x60), (SMW_PROGRESS_DATA, 0x0F), (SMW_DRAGON_COINS_DATA, 0x0C),
+            (SMW_DRAGON_COINS_ACTIVE_ADDR, 0x1), (SMW_MOON_DATA, 0x0C), (SMW_MOON_ACTIVE_ADDR, 0x1),
+            (SMW_HIDDEN_1UP_DATA, 0x0C), (SMW_HIDDEN_1UP_ACTIVE_ADDR, 0x1), (SMW_BONUS_BLOCK_DATA, 0x0C),
+            (SMW_BONUS_BLOCK_ACTIVE_ADDR, 0x1), (SMW_BLOCKSANITY_DATA, SMW_BLOCKSANITY_BLOCK_COUNT),
+            (SMW_BLOCKSANITY_FLAGS, 0xC), (SMW_BLOCKSANITY_ACTIVE_ADDR, 0x1), (SMW_LEVEL_CLEAR_FLAGS, 0x60),
+            (SMW_GAME_STATE_ADDR, 0x1), (SMW_ROMHASH_START, ROMHASH_SIZE), (SMW_CURRENT_SUBLEVEL_ADDR, 2),
+            (SMW_RECV_PROGRESS_ADDR, 2),
+        ])
+        if read_data is None:
+            return
+        event_data, progress_data, dragon_coins_data, dragon_coins_active, moon_data, moon_active, hidden_1up_data, \
+            hidden_1up_active, bonus_block_data, bonus_block_active, blocksanity_data, blocksanity_flags, \
+            blocksanity_active, level_clear_flags, verify_game_state, rom, current_sublevel_data, recv_count = read_data
+        progress_data = bytearray(progress_data)
+        dragon_coins_data = bytearray(dragon_coins_data)
+        moon_data = bytearray(moon_data)
+        hidden_1up_data = bytearray(hidden_1up_data)
+        bonus_block_data = bytearray(bonus_block_data)
+        blocksanity_data = bytearray(blocksanity_data)
+        blocksanity_flags = bytearray(blocksanity_flags)
+        level_clear_flags = bytearray(level_clear_flags)
         from .Rom import item_rom_data, ability_rom_data, trap_rom_data, icon_rom_data
         from .Levels import location_id_to_level_id, level_info_dict, level_blocks_data
         from worlds import AutoWorldRegister
@@ -433,13 +437,11 @@ class SMWSNIClient(SNIClient):
                     if bit_set:
                         new_checks.append(loc_id)
 
-        verify_game_state = await snes_read(ctx, SMW_GAME_STATE_ADDR, 0x1)
-        if verify_game_state is None or verify_game_state[0] < 0x0B or verify_game_state[0] > 0x29:
+        if verify_game_state[0] < 0x0B or verify_game_state[0] > 0x29:
             # We have somehow exited the save file (or worse)
             print("Exit Save File")
             return
 
-        rom = await snes_read(ctx, SMW_ROMHASH_START, ROMHASH_SIZE)
         if rom != ctx.rom:
             ctx.rom = None
             print("Exit ROM")
@@ -454,7 +456,6 @@ class SMWSNIClient(SNIClient):
             await ctx.send_msgs([{"cmd": 'LocationChecks', "locations": [new_check_id]}])
 
         # Send Current Room for Tracker
-        current_sublevel_data = await snes_read(ctx, SMW_CURRENT_SUBLEVEL_ADDR, 2)
         current_sublevel_value = current_sublevel_data[0] + (current_sublevel_data[1] << 8)
 
         if game_state[0] != 0x14:
@@ -490,10 +491,6 @@ class SMWSNIClient(SNIClient):
             # Don't receive items or collect locations inside boss battles
             return
 
-        recv_count = await snes_read(ctx, SMW_RECV_PROGRESS_ADDR, 2)
-        if recv_count is None:
-            # Add a small failsafe in case we get a None. Other SNI games do this...
-            return
         recv_index = recv_count[0] | (recv_count[1] << 8)
 
         if recv_index < len(ctx.items_received):
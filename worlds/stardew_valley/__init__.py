@@ -443,12 +443,14 @@ class StardewValleyWorld(World):
         change = super().collect(state, item)
         if change:
             state.prog_items[self.player][Event.received_walnuts] += self.get_walnut_amount(item.name)
+            state.stardew_rule_memo.change(self.player)
         return change
 
     def remove(self, state: CollectionState, item: StardewItem) -> bool:
         change = super().remove(state, item)
         if change:
             state.prog_items[self.player][Event.received_walnuts] -= self.get_walnut_amount(item.name)
+            state.stardew_rule_memo.change(self.player)
         return change
 
     @staticmethod
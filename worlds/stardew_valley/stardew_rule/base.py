@@ -135,6 +135,9 @@ class AggregatingStardewRule(BaseStardewRule, ABC):
     combinable_rules: Dict[Hashable, CombinableStardewRule]
     simplification_state: _SimplificationState
     _last_short_circuiting_rule: Optional[StardewRule] = None
+    shared: bool = False
+    memo_player: Optional[int] = None
+    """The player whose reachable regions the result of a shared rule can depend on, None if not shared or no subrule tells."""
 
     def __init__(self, *rules: StardewRule, _combinable_rules=None, _simplification_state=None):
         if _combinable_rules is None:
@@ -205,7 +208,31 @@ class AggregatingStardewRule(BaseStardewRule, ABC):
         self._last_short_circuiting_rule = rule
         return self, self.complement.value
 
+    def share(self):
+        """
+        Called on the rules of items, which are evaluated by every rule needing the item, so their result is kept in the memo of the state until it changes.
+        Other rules are rarely evaluated twice on the same state, and are not worth the lookup.
+        """
+        self.shared = True
+        self.memo_player = find_player(self)
+
     def evaluate_while_simplifying(self, state: CollectionState) -> Tuple[StardewRule, bool]:
+        player = self.memo_player
+        if player is None:
+            return self.evaluate_while_simplifying_uncached(state)
+
+        memo = state.stardew_rule_memo
+        generation = memo.generations.get(player, 0)
+        result = memo.results.get(id(self))
+        if result is not None and result[0] is self and result[1] == generation and result[2] == len(state.reachable_regions[player]):
+            return self, result[3]
+
+        simplified, value = self.evaluate_while_simplifying_uncached(state)
+        # Counting regions after evaluating, as evaluating can update the reachable regions.
+        memo.results[id(self)] = (self, generation, len(state.reachable_regions[player]), value)
+        return simplified, value
+
+    def evaluate_while_simplifying_uncached(self, state: CollectionState) -> Tuple[StardewRule, bool]:
         """
         The global idea here is the same as short-circuiting operators, applied to evaluation and rule simplification.
         """
@@ -445,7 +472,10 @@ class Has(BaseStardewRule):
         return self.evaluate_while_simplifying(state)[1]
 
     def evaluate_while_simplifying(self, state: CollectionState) -> Tuple[StardewRule, bool]:
-        return self.other_rules[self.item].evaluate_while_simplifying(state)
+        rule = self.other_rules[self.item]
+        if isinstance(rule, AggregatingStardewRule) and not rule.shared:
+            rule.share()
+        return rule.evaluate_while_simplifying(state)
 
     def __str__(self):
         if self.item not in self.other_rules:
@@ -458,6 +488,26 @@ class Has(BaseStardewRule):
         return f"Has {self.item} ({self.group}) -> {repr(self.other_rules[self.item])}"
 
 
+def find_player(rule: StardewRule, depth: int = 0) -> Optional[int]:
+    if depth >= 50:
+        return None
+
+    if isinstance(rule, AggregatingStardewRule):
+        subrules = rule.original_rules
+    elif isinstance(rule, Count):
+        subrules = rule.counter.keys()
+    elif isinstance(rule, Has):
+        subrules = (rule.other_rules[rule.item],) if rule.item in rule.other_rules else ()
+    else:
+        return getattr(rule, "player", None)
+
+    for subrule in subrules:
+        player = find_player(subrule, depth + 1)
+        if player is not None:
+            return player
+    return None
+
+
 class RepeatableChain(Iterable, Sized):
     """
     Essentially a copy of what's in the core, with proper type hinting
@@ -0,0 +1,41 @@
+from itertools import count
+from typing import Dict, Tuple
+
+from BaseClasses import CollectionState, MultiWorld
+from worlds.AutoWorld import LogicMixin
+
+_generations = count(1)
+
+
+class EvaluationMemo:
+    """
+    Results of the rules of items evaluated on a state, so rules shared by many locations and entrances, like seasons, tools or skills,
+    are evaluated once per change of the state instead of once per rule referencing them.
+
+    A result stays valid as long as its player has the same generation and the same number of reachable regions.
+    Reachable regions only grow between two generations, so counting them is enough, and also covers results computed in the middle of a region update.
+
+    Generations are unique in the process, so copies of a state share the results, until one of them changes.
+    """
+    generations: Dict[int, int]
+    """player -> generation, 0 until a Stardew item of the player is collected or removed"""
+    results: Dict[int, Tuple[object, int, int, bool]]
+    """id of the rule -> (the rule, so its id can't be reused, generation, reachable regions, result)"""
+
+    def __init__(self, generations: Dict[int, int], results: Dict[int, Tuple[object, int, int, bool]]):
+        self.generations = generations
+        self.results = results
+
+    def change(self, player: int):
+        self.generations[player] = next(_generations)
+
+
+class StardewLogicMixin(LogicMixin):
+    stardew_rule_memo: EvaluationMemo
+
+    def init_mixin(self, parent: MultiWorld):
+        self.stardew_rule_memo = EvaluationMemo({}, {})
+
+    def copy_mixin(self, new_state: CollectionState) -> CollectionState:
+        new_state.stardew_rule_memo = EvaluationMemo(self.stardew_rule_memo.generations.copy(), self.stardew_rule_memo.results)
+        return new_state
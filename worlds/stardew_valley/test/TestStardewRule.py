@@ -3,7 +3,7 @@ from typing import cast
 from unittest.mock import MagicMock, Mock
 
 from .. import StardewRule
-from ..stardew_rule import Received, And, Or, HasProgressionPercent, false_, true_, Count
+from ..stardew_rule import Received, And, Or, HasProgressionPercent, false_, true_, Count, Has, EvaluationMemo
 
 
 class TestSimplification(unittest.TestCase):
@@ -303,3 +303,50 @@ class TestCount(unittest.TestCase):
         rule = Count([cast(StardewRule, Mock()) for i in range(5)], 2)
 
         self.assertEqual(rule.evaluate, rule.evaluate_without_shortcircuit)
+
+
+class TestEvaluationMemo(unittest.TestCase):
+    def setUp(self):
+        self.collection_state = MagicMock()
+        self.collection_state.has = Mock(return_value=True)
+        self.collection_state.reachable_regions = {1: set()}
+        self.collection_state.stardew_rule_memo = EvaluationMemo({}, {})
+        self.internal_rule = MagicMock(return_value=True)
+        self.internal_rule.evaluate_while_simplifying = Mock(return_value=(self.internal_rule, True))
+        self.item_rule = And(Received("Hoe", 1, 1), cast(StardewRule, self.internal_rule))
+        self.has_rule = Has("Melon", {"Melon": self.item_rule})
+
+    def internal_evaluations(self):
+        return self.internal_rule.call_count + self.internal_rule.evaluate_while_simplifying.call_count
+
+    def test_item_rule_is_evaluated_once_per_state(self):
+        self.has_rule.evaluate_while_simplifying(self.collection_state)
+        self.item_rule(self.collection_state)
+        _, result = self.has_rule.evaluate_while_simplifying(self.collection_state)
+
+        self.assertTrue(result)
+        self.assertEqual(1, self.internal_evaluations())
+
+    def test_item_rule_is_evaluated_again_when_player_changes(self):
+        self.has_rule.evaluate_while_simplifying(self.collection_state)
+        self.collection_state.stardew_rule_memo.change(2)
+        self.has_rule.evaluate_while_simplifying(self.collection_state)
+        self.assertEqual(1, self.internal_evaluations())
+
+        self.collection_state.stardew_rule_memo.change(1)
+        self.has_rule.evaluate_while_simplifying(self.collection_state)
+        self.assertEqual(2, self.internal_evaluations())
+
+    def test_item_rule_is_evaluated_again_when_regions_are_reached(self):
+        self.has_rule.evaluate_while_simplifying(self.collection_state)
+        self.collection_state.reachable_regions[1].add("Farm")
+        self.has_rule.evaluate_while_simplifying(self.collection_state)
+
+        self.assertEqual(2, self.internal_evaluations())
+
+    def test_rule_not_shared_through_has_is_not_kept(self):
+        self.item_rule(self.collection_state)
+        self.item_rule(self.collection_state)
+
+        self.assertEqual(2, self.internal_evaluations())
+        self.assertFalse(self.collection_state.stardew_rule_memo.results)
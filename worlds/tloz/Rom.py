@@ -55,6 +55,18 @@ class TLoZDeltaPatch(APDeltaPatch):
         return get_base_rom_bytes()
 
 
+def write_delta_patch(patched_rom: bytes, output_filename: str, player: int, player_name: str) -> None:
+    """Output job of TLoZWorld, creates the patch file from the patched rom."""
+    with open(output_filename, 'wb') as patched_rom_file:
+        patched_rom_file.write(patched_rom)
+    patch = TLoZDeltaPatch(os.path.splitext(output_filename)[0] + TLoZDeltaPatch.patch_file_ending,
+                           player=player,
+                           player_name=player_name,
+                           patched_path=output_filename)
+    patch.write()
+    os.unlink(output_filename)
+
+
 def get_base_rom_bytes(file_name: str = "") -> bytes:
     base_rom_bytes = getattr(get_base_rom_bytes, "base_rom_bytes", None)
     if not base_rom_bytes:
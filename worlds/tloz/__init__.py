@@ -1,3 +1,4 @@
+import functools
 import os
 import threading
 from pkgutil import get_data
@@ -15,7 +16,7 @@ from .Locations import location_table, level_locations, major_locations, shop_lo
     standard_level_locations, shop_price_location_ids, secret_money_ids, location_ids, food_locations, \
     take_any_locations, sword_cave_locations
 from .Options import TlozOptions
-from .Rom import TLoZDeltaPatch, get_base_rom_path, first_quest_dungeon_items_early, first_quest_dungeon_items_late
+from .Rom import TLoZDeltaPatch, get_base_rom_path, write_delta_patch, first_quest_dungeon_items_early, first_quest_dungeon_items_late
 from .Rules import set_rules
 from worlds.AutoWorld import World, WebWorld
 from worlds.generic.Rules import add_rule
@@ -285,7 +286,7 @@ class TLoZWorld(World):
             rom_data[secret_money_ids[cave]] = secret_cave_money_amounts[i]
         return rom_data
 
-    def generate_output(self, output_directory: str):
+    def generate_output_job(self, output_directory: str):
         try:
             patched_rom = self.apply_randomizer()
             outfilebase = 'AP_' + self.multiworld.seed_name
@@ -300,18 +301,15 @@ class TLoZWorld(World):
             self.playerName = bytearray(self.multiworld.player_name[self.player], 'utf8')[:0x20]
             self.playerName.extend([0] * (0x20 - len(self.playerName)))
             patched_rom[0x30:0x50] = self.playerName
-            patched_filename = os.path.join(output_directory, outputFilename)
-            with open(patched_filename, 'wb') as patched_rom_file:
-                patched_rom_file.write(patched_rom)
-            patch = TLoZDeltaPatch(os.path.splitext(outputFilename)[0] + TLoZDeltaPatch.patch_file_ending,
-                                   player=self.player,
-                                   player_name=self.multiworld.player_name[self.player],
-                                   patched_path=outputFilename)
-            patch.write()
-            os.unlink(patched_filename)
+            # diffing against the base rom is the slow part, so that is left to the output job
+            return functools.partial(write_delta_patch, bytes(patched_rom), outputFilename,
+                                     self.player, self.multiworld.player_name[self.player])
         finally:
             self.rom_name_available_event.set()
 
+    def generate_output(self, output_directory: str):
+        self.generate_output_job(output_directory)()
+
     def modify_multidata(self, multidata: dict):
         import base64
         self.rom_name_available_event.wait()